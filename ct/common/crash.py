@@ -179,11 +179,10 @@ def state_snapshot():
     the longest name in the list, so a layout bug that only happens with a
     40-character client would vanish if every name became "Client 1".
     """
-    import json
     from ct.common.setup import PATHS
+    from ct.util import dump_json, load_json
     try:
-        data = json.loads((PATHS.current / "state.json")
-                          .read_text(encoding="utf-8"))
+        data = load_json(PATHS.current / "state.json")
     except (OSError, ValueError):
         return b""
     for i, row in enumerate(data.get("layout", {}).get("rows", [])):
@@ -192,7 +191,9 @@ def state_snapshot():
         if len(original) > len(stand_in):
             stand_in += "x" * (len(original) - len(stand_in))
         row["name"] = stand_in[:len(original)] or stand_in
-    return json.dumps(data, indent=2).encode("utf-8")
+    # Straight to bytes in one buffer — json.dumps built the whole text as a
+    # str first, then encode() copied all of it again.
+    return dump_json(data, indent=True)
 
 
 def capture_current_exception():
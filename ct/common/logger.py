@@ -1,4 +1,5 @@
 import logging
+import os
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 from ct.common.setup import PATHS
@@ -24,14 +25,18 @@ def get_logger(
     logger.setLevel(logging.DEBUG if historical_debugs > 0 else level)
 
     log_dir = log_dir or PATHS.logs
-    log_dir.mkdir(parents=True,exist_ok=True)
+    historical_debug_path = log_dir / "debug"
+    # One mkdir for both: creating debug/ creates log_dir on the way
+    (historical_debug_path if historical_debugs > 0 else log_dir).mkdir(parents=True,exist_ok=True)
     log_file_path = log_dir / f"{name}.log"
 
     fmt = logging.Formatter(LOG_FORMAT,LOG_DATE_FORMAT)
+    # Handlers already attached, looked up once for all four checks below
+    existing = {h.get_name() for h in logger.handlers}
 
     # Setup persistent handler
     persistent_handler_name = f"{name}:persistent"
-    if persistent and not any(h.get_name() == persistent_handler_name for h in logger.handlers):
+    if persistent and persistent_handler_name not in existing:
         persistent_handler = RotatingFileHandler(
             filename=log_file_path,
             maxBytes=max_bytes,
@@ -46,7 +51,7 @@ def get_logger(
 
     # Setup latest-only handler (always overwritten each run)
     latest_handler_name = f"{name}:latest"
-    if not any(h.get_name() == latest_handler_name for h in logger.handlers):
+    if latest_handler_name not in existing:
         latest_log_path = log_dir / "latest.log"
         latest_handler = logging.FileHandler(
             filename=latest_log_path,
@@ -61,9 +66,7 @@ def get_logger(
 
     # Setup historical debug handler
     historical_debug_handler_name = f"{name}:historical_debug"
-    if historical_debugs > 0 and not any(h.get_name() == historical_debug_handler_name for h in logger.handlers):
-        historical_debug_path = log_dir / "debug"
-        historical_debug_path.mkdir(parents=True,exist_ok=True)
+    if historical_debugs > 0 and historical_debug_handler_name not in existing:
         this_historical_debug_log_path =  historical_debug_path / f"{name}_{datetime.now():%Y-%m-%d_%H-%M-%S}.log"
 
         historical_debug_handler = logging.FileHandler(
@@ -76,15 +79,21 @@ def get_logger(
         historical_debug_handler.set_name(historical_debug_handler_name)
         logger.addHandler(historical_debug_handler)
 
-        # Prune oldest runs
-        runs = sorted(historical_debug_path.glob(f"{name}_*.log"),key=lambda p: p.stat().st_mtime,reverse=True)
-        for run in runs[historical_debugs:]:
-            try: run.unlink()
+        # Prune oldest runs. scandir rather than glob + Path.stat: on Windows the
+        # entries carry their mtime from the listing, so this is one directory
+        # read instead of a stat call per file.
+        prefix = f"{name}_"
+        with os.scandir(historical_debug_path) as it:
+            runs = [(e.stat().st_mtime, e.path) for e in it
+                    if e.name.startswith(prefix) and e.name.endswith(".log")]
+        runs.sort(reverse=True)
+        for _, run in runs[historical_debugs:]:
+            try: os.unlink(run)
             except OSError: pass
 
     # Setup console handler
     console_handler_name = f"{name}:console"
-    if console and not any(h.get_name() == console_handler_name for h in logger.handlers):
+    if console and console_handler_name not in existing:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(fmt)
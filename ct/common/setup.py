@@ -66,11 +66,15 @@ class ProjectPaths:
         # Folder for all clienttimer user-specific and session related stuff
         data = ensure_directory(Path(appdata) / "ClientTimer2")
 
-        # Folders within the data folder
-        logs = ensure_directory(data / "logs")
-        current = ensure_directory(data / "current")
-        snapshots = ensure_directory(data / "snapshots")
-        sessions = ensure_directory(data / "completed_sessions")
+        # Folders within the data folder. Not created here: every import of this
+        # module paid a mkdir (and a stat) per folder to learn, almost always,
+        # that they were already there. Whatever writes into one creates it
+        # if it's missing (get_logger, write_atomic), and readers treat a
+        # missing folder as an empty one.
+        logs = data / "logs"
+        current = data / "current"
+        snapshots = data / "snapshots"
+        sessions = data / "completed_sessions"
 
         return ProjectPaths(
             root = root,
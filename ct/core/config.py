@@ -1,13 +1,12 @@
-import copy
 import dataclasses
 import json
-import os
+import sys
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from ct.common.logger import log
 from ct.common.setup import PATHS
-from ct.util import now_iso
+from ct.util import now_iso, dump_json, load_json, write_atomic
 
 
 _SCHEMA_VERSION = 1
@@ -54,7 +53,9 @@ def _coerce_setting(key, value, default):
     return default, True
 
 
-@dataclass
+# Slotted: the UI reads these on every row build and every tick, and a slot
+# read skips the instance-dict probe.
+@dataclass(slots=True)
 class Settings:
     """All user-configurable settings as a typed, dot-accessible object."""
     theme:                str  = "E-Ink (Default)"
@@ -82,13 +83,19 @@ class Settings:
     # not mean six prompts, and an app left open for a week must still get
     # one. Written when the toast appears, whether or not they act on it.
     last_update_prompt:   str  = ""
+    # Keys from_dict had to coerce. Not a setting: kept out of __init__, the
+    # defaults table and to_dict(). A field only because a slotted class has
+    # nowhere else to put it. MainWindow reads this at startup to toast the
+    # user about it.
+    coerced_keys:         list = field(default_factory=list, init=False,
+                                       repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, d: dict) -> "Settings":
         d = cls._migrate(d)
         values = {}
         coerced = []
-        for k, default in _SETTINGS_DEFAULTS.items():
+        for k, default in _SETTINGS_ITEMS:
             if k in d:
                 values[k], changed = _coerce_setting(k, d[k], default)
                 if changed:
@@ -96,8 +103,6 @@ class Settings:
             else:
                 values[k] = default
         obj = cls(**values)
-        # Plain attribute, not a field - never serialized by to_dict().
-        # MainWindow reads this at startup to toast the user about it.
         obj.coerced_keys = coerced
         return obj
 
@@ -139,12 +144,40 @@ class Settings:
             d.pop("button_visibility", None)
         return d
 
+    # Every value is a str or bool, so there's nothing for asdict()'s
+    # recursive deep copy to do — and this runs on every save.
     def to_dict(self) -> dict:
-        return dataclasses.asdict(self)
+        return {k: getattr(self, k) for k in _SETTINGS_DEFAULTS}
 
 
 # Derived from the dataclass so defaults live in exactly one place.
-_SETTINGS_DEFAULTS = {f.name: f.default for f in dataclasses.fields(Settings)}
+_SETTINGS_DEFAULTS = {f.name: f.default for f in dataclasses.fields(Settings)
+                      if f.init}
+# The same pairs as a tuple, for Settings.from_dict, which walks every one.
+_SETTINGS_ITEMS = tuple(_SETTINGS_DEFAULTS.items())
+
+
+# What AppState.load insists on inside each section of state.json, as
+# (section, key, is_valid, make_default, quiet_if_absent). One loop walks it;
+# the dotted name for the log is only built for a value that actually failed,
+# so a healthy file does no string work at all. quiet_if_absent marks keys
+# that older files legitimately lack: those are filled without a warning, and
+# only a present-but-malformed value is reported. Settings aren't here —
+# they're filled by key-set difference against _SETTINGS_DEFAULTS instead.
+def _is_height(v):
+    # A bool is an int to isinstance, and not a height. States written before
+    # window sizing existed lack it entirely and get 0 (quietly — see above).
+    return isinstance(v, int) and not isinstance(v, bool) and v >= 0
+
+_STATE_SECTIONS = ("meta", "layout", "session")
+_STATE_CHECKS = (
+    ("meta",    "schema_version",       lambda v: isinstance(v, int),  lambda: _SCHEMA_VERSION, False),
+    ("meta",    "is_completed_session", lambda v: isinstance(v, bool), lambda: False,           False),
+    ("layout",  "rows",                 lambda v: isinstance(v, list), list,                    False),
+    ("layout",  "collapsed_groups",     lambda v: isinstance(v, list), list,                    False),
+    ("layout",  "window_height",        _is_height,                    int,                     True),
+    ("session", "tracked_times",        lambda v: isinstance(v, dict), dict,                    False),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -162,13 +195,16 @@ class AppState:
     serialize() / save() when persisting.
     """
 
-    # Helper to construct a truly fresh, default state.
+    # Helper to construct a fresh, default state. Its "settings" is a copy of
+    # _SETTINGS_DEFAULTS: the state dict is the caller's to change, and the
+    # defaults must not change with it.
     @staticmethod
     def _build_default_state() -> dict:
+        now = now_iso()
         return {
             "meta": {
                 "schema_version": _SCHEMA_VERSION,
-                "saved_at": now_iso(),
+                "saved_at": now,
                 "is_completed_session": False,
             },
             "layout": {
@@ -176,9 +212,9 @@ class AppState:
                 "collapsed_groups": [],
                 "window_height": 0,
             },
-            "settings": dict(_SETTINGS_DEFAULTS),
+            "settings": _SETTINGS_DEFAULTS.copy(),
             "session": {
-                "start": now_iso(),
+                "start": now,
                 "tracked_times": {},
             },
         }
@@ -192,9 +228,20 @@ class AppState:
         self.session_start    = session_start
         self.tracked_times    = tracked_times     # used only during MainWindow.__init__
         self.window_height    = 0                 # user's height ceiling; 0 = auto-fit
+        self._last_write      = None              # (path, mtime_ns, body) of our last save
+
+    # Everything but meta, as of the last save() — the text save() compares to
+    # decide a write can be skipped. None before the first save.
+    @property
+    def saved_body(self):
+        return self._last_write[2] if self._last_write else None
 
     # Helper to build the full state dict from current live data.
     def _serialize(self, timers: dict) -> dict:
+        # One stamp for the whole save: every running timer is frozen as of
+        # this moment, and formatting a fresh one per timer only made them
+        # disagree by microseconds.
+        now = now_iso()
         tracked = {}
         for rid, ts in timers.items():
             ts.freeze()
@@ -203,17 +250,20 @@ class AppState:
                 # freeze() above makes elapsed current as of this save, so the
                 # recovery baseline is the save moment, using started_at here
                 # would double-count everything between start and last save.
-                entry["running_since"] = now_iso()
+                entry["running_since"] = now
             tracked[str(rid)] = entry
         return {
             "meta": {
                 "schema_version":      _SCHEMA_VERSION,
-                "saved_at":            now_iso(),
+                "saved_at":            now,
                 "is_completed_session": False,
             },
             "layout": {
                 "rows":             list(self.rows),
-                "collapsed_groups": list(self.collapsed_groups),
+                # Sorted: a set's iteration order follows its insertion
+                # history, so the same groups could serialise differently and
+                # defeat save()'s unchanged-write check (and diff noisily).
+                "collapsed_groups": sorted(self.collapsed_groups),
                 "window_height":    int(self.window_height),
             },
             "settings": self.settings.to_dict(),
@@ -237,60 +287,43 @@ class AppState:
                 state = cls._build_default_state()
                 log.info("No existing state.json; loading fresh state.")
             else:
-                with open(path, "r", encoding="utf-8") as f:
-                    state = json.load(f)
+                state = load_json(path)
+                # Everything below indexes into dicts; a file holding some
+                # other JSON value would otherwise escape as AttributeError.
+                if not isinstance(state, dict):
+                    raise TypeError(f"'{path}' holds a {type(state).__name__}, not an object")
                 defaulted_values = set()
 
-                # Validate the meta dict
-                if not isinstance(state.get("meta"), dict):
-                    state["meta"] = {}
-                    defaulted_values.add("meta")
-                if not isinstance(state["meta"].get("schema_version"), int):
-                    state["meta"]["schema_version"] = _SCHEMA_VERSION
-                    defaulted_values.add("meta.schema_version")
-                if not isinstance(state["meta"].get("is_completed_session"), bool):
-                    state["meta"]["is_completed_session"] = False
-                    defaulted_values.add("meta.is_completed_session")
-
-                # Validate the layout dict, default to empty if its missing and treat as an error
-                if not isinstance(state.get("layout"), dict):
-                    state["layout"] = {"rows": [], "collapsed_groups": [],
-                                       "window_height": 0}
-                    defaulted_values.add("layout")
-                # Validate rows and collapsed groups in layout dict.
-                else:
-                    if not isinstance(state["layout"].get("rows"), list):
-                        state["layout"]["rows"] = []
-                        defaulted_values.add("layout.rows")
-                    if not isinstance(state["layout"].get("collapsed_groups"), list):
-                        state["layout"]["collapsed_groups"] = []
-                        defaulted_values.add("layout.collapsed_groups")
-                    # Absent on states written before window sizing existed.
-                    wh = state["layout"].get("window_height", 0)
-                    if not isinstance(wh, int) or isinstance(wh, bool) or wh < 0:
-                        state["layout"]["window_height"] = 0
-                        if "window_height" in state["layout"]:
-                            defaulted_values.add("layout.window_height")
+                # A section that's missing or the wrong shape starts out
+                # empty and is filled key by key below. Reported once by its
+                # own name rather than once per key.
+                for section in _STATE_SECTIONS:
+                    if not isinstance(state.get(section), dict):
+                        state[section] = {}
+                        defaulted_values.add(section)
+                for (section, key, is_valid, make_default,
+                     quiet_if_absent) in _STATE_CHECKS:
+                    node = state[section]
+                    if quiet_if_absent and key not in node:
+                        node[key] = make_default()
+                    elif not is_valid(node.get(key)):
+                        node[key] = make_default()
+                        if section not in defaulted_values:
+                            defaulted_values.add(f"{section}.{key}")
 
                 # Validate the settings dict, fill in any necessary defaults
-                if not isinstance(state.get("settings"), dict):
-                    state["settings"] = dict(_SETTINGS_DEFAULTS)
+                raw = state.get("settings")
+                if not isinstance(raw, dict):
+                    # A copy, as in _build_default_state.
+                    state["settings"] = _SETTINGS_DEFAULTS.copy()
                     defaulted_values.add("settings")
                 else:
-                    for key, default in _SETTINGS_DEFAULTS.items():
-                        if key not in state["settings"]:
-                            state["settings"][key] = default
-                            defaulted_values.add(f"settings.{key}")
-
-                # Validate the session dict
-                if not isinstance(state.get("session"), dict):
-                    state["session"] = {"start": now_iso(), "tracked_times": {}}
-                    defaulted_values.add("session")
-                # Validate that the tracked_times dict exists within sessions
-                else:
-                    if not isinstance(state["session"].get("tracked_times"), dict):
-                        state["session"]["tracked_times"] = {}
-                        defaulted_values.add("session.tracked_times")
+                    # Key-set difference first: a state saved by this
+                    # version has every key, so the usual load fills nothing
+                    # and does no per-setting work at all.
+                    for key in _SETTINGS_DEFAULTS.keys() - raw.keys():
+                        raw[key] = _SETTINGS_DEFAULTS[key]
+                        defaulted_values.add(f"settings.{key}")
 
                 # Log results
                 if defaulted_values:
@@ -322,6 +355,14 @@ class AppState:
         # pressing Apply on an unrelated change silently switched the user's
         # theme to whatever sorts first.
         rows      = list(state["layout"]["rows"])
+        # The decoder already shares key strings across a parse, but not
+        # values: every row carries its own copy of "timer" or "separator",
+        # and the UI compares those against literals on every rebuild.
+        # Interned, that compare is settled by identity.
+        for row in rows:
+            kind = row.get("type") if isinstance(row, dict) else None
+            if type(kind) is str:
+                row["type"] = sys.intern(kind)
         collapsed = set(state["layout"]["collapsed_groups"])
         try:
             start = datetime.fromisoformat(state["session"].get("start", now_iso()))
@@ -332,14 +373,27 @@ class AppState:
         obj.window_height = state["layout"].get("window_height", 0)
         return obj
     # Serialize and write state to disk. Returns the state dict.
+    #
+    # State is only ever read from disk at startup and on a snapshot restore;
+    # in between, this object is the copy of record and saves only go one way.
+    # Many actions save and then snapshot, and the snapshot saves again, so the
+    # same state regularly gets written twice in a row. The write is skipped
+    # when everything but meta.saved_at matches what we last wrote AND the
+    # file's mtime says nobody else has touched it since — the returned dict
+    # (which snapshots are built from) is always fresh either way.
     def save(self, timers: dict) -> dict:
         state = self._serialize(timers)
-        # Write to a temp file and atomically replace, so a crash mid-write
-        # can't corrupt state.json.
-        tmp_path = _STATE_PATH.with_suffix(".json.tmp")
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-        os.replace(tmp_path, _STATE_PATH)
+        body = dump_json({k: v for k, v in state.items() if k != "meta"},
+                         sort_keys=True)
+        try:
+            mtime = _STATE_PATH.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._last_write == (_STATE_PATH, mtime, body):
+            return state
+        # Atomic, so a crash mid-write can't corrupt state.json.
+        write_atomic(_STATE_PATH, dump_json(state, indent=True), durable=True)
+        self._last_write = (_STATE_PATH, _STATE_PATH.stat().st_mtime_ns, body)
         log.info(f"Saved state to '{_STATE_PATH}'.")
         return state
 
@@ -354,14 +408,16 @@ class AppState:
 
 # Archives a state dict as a completed session to PATHS.sessions, and returns the file path.
 def save_completed_session(state: dict, boundary_dt: datetime) -> str:
-    completed = copy.deepcopy(state)
-    completed["meta"]["is_completed_session"] = True
-    completed["meta"]["saved_at"] = now_iso()
-    completed["session"]["end"] = boundary_dt.isoformat()
+    # Only meta and session gain keys, so only they are copied; the rest is
+    # just read by the dump. Same as create_snapshot — this was a deepcopy of
+    # every row and tracked time to set three fields.
+    completed = dict(state)
+    completed["meta"] = {**state["meta"], "is_completed_session": True,
+                         "saved_at": now_iso()}
+    completed["session"] = {**state["session"], "end": boundary_dt.isoformat()}
     ts   = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     path = PATHS.sessions / f"session_{ts}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(completed, f, indent=2)
+    write_atomic(path, dump_json(completed, indent=True), durable=True)
     log.info(f"Saved completed session to '{path}'.")
     return str(path)
 
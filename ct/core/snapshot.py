@@ -1,12 +1,15 @@
-import copy
-import json
 import os
+import queue
+import threading
+from bisect import bisect_left
 from datetime import datetime
 from ct.common.setup import PATHS
 from ct.common.logger import log
+from ct.util import dump_json, load_json, write_atomic
 
 # Exponential-ish time-tier targets in seconds.  For each tier we keep the snapshot whose
-# timestamp is closest to (now - tier).
+# timestamp is closest to (now - tier). Must stay in ascending order — prune's
+# search relies on it.
 TIERS = [
     5 * 60,       # ~5 minutes ago
     10 * 60,      # ~10 minutes ago
@@ -31,33 +34,143 @@ HIGH_PRIORITY_KEEP_SECS = 7 * 86400
 
 # Absolute ceiling, so nothing above can inflate without bound. A snapshot is
 # ~2.5 KB, so this is a few hundred KB at worst.
+#
+# Deliberately not compressed. At that size a file already fits in one
+# filesystem block, so zlib/zstd would save no disk I/O at all; they'd add a
+# dependency to the build, a decode step to every restore, and files nobody
+# can open by hand when a restore goes wrong.
 MAX_SNAPSHOTS = 100
 
+# Held by every write and prune. Queued snapshots are written on a worker
+# thread while high-priority ones are written on the GUI thread, and two
+# prunes working from different listings of the same directory would fight
+# over which files to keep.
+_LOCK = threading.Lock()
+
 # Writes a full copy of the state_dict as a snapshot (backupish thing)
 def create_snapshot(state_dict, reason, priority="normal"):
-    snap = copy.deepcopy(state_dict)
-    snap["meta"]["snapshot_reason"] = reason
-    snap["meta"]["snapshot_priority"] = priority
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    target_path = PATHS.snapshots / f"state_{timestamp}.json"
-    with open(target_path, "w", encoding="utf-8") as f:
-        json.dump(snap, f, indent=2)
-    # Seed the cache from the writer: this file never needs reading back.
+    payload = encode_snapshot(state_dict, reason, priority)
+    target_path, ts = _new_snapshot_path()
+    _seed_peek(target_path, state_dict)
+    with _LOCK:
+        return _write_snapshot(payload, reason, priority, target_path, ts)
+
+# The bytes a snapshot of state_dict is written as.
+def encode_snapshot(state_dict, reason, priority="normal"):
+    # Only "meta" gains keys, so only it is copied; the dump reads the rest
+    # without changing it. This was a deepcopy of the whole state — every
+    # row dict and tracked time — to add two strings to one small dict.
+    snap = dict(state_dict)
+    snap["meta"] = {**state_dict["meta"], "snapshot_reason": reason,
+                    "snapshot_priority": priority}
+    # Compact: these are read back by the app, never by hand, and the
+    # indentation was about half of every file.
+    return dump_json(snap)
+
+# Where a snapshot taken right now goes, and the timestamp its name encodes.
+# Decided when the state is captured, not when the file is written, so a
+# queued snapshot still sorts by the moment it describes.
+def _new_snapshot_path():
+    now = datetime.now()
+    return (PATHS.snapshots / f"state_{now:%Y%m%d_%H%M%S_%f}.json",
+            now.timestamp())
+
+def _write_snapshot(payload, reason, priority, target_path, ts):
+    # Atomic, because a snapshot cut short by a crash is exactly the file
+    # someone will try to restore. The folder's mtime is read first so
+    # _remember can tell whether anything else changed it since the listing.
+    before = _dir_mtime()
+    write_atomic(target_path, payload)
+    # Seed the caches from the writer: this file never needs reading back,
+    # and the directory never needs listing again to learn it exists.
     _PRIORITY_CACHE[target_path.name] = priority
+    _remember(target_path, ts, before)
     log.debug(f"Saved snapshot for reason '{reason}', priority '{priority}' to {target_path}")
     return target_path
 
+
+# Snapshots nobody needs on disk the moment they're taken — the idle
+# heartbeat and the routine restore points around edits — are serialised on
+# the spot, so later edits can't reach them, and queued for one long-lived
+# writer thread. It takes whatever has piled up, writes it, and prunes once
+# for the lot. Prune lists and deletes across the whole directory, and on a
+# slow or busy disk that was a visible hitch in the GUI thread after every
+# edit; a burst of edits now costs that thread one dump each, and the disk
+# one prune per burst.
+#
+# High-priority snapshots stay on create_snapshot: callers (app exit above
+# all) rely on those being on disk when it returns.
+_QUEUE = queue.SimpleQueue()
+_WRITER = None
+
+def queue_snapshot(state_dict, reason, priority="normal"):
+    global _WRITER
+    target_path, ts = _new_snapshot_path()
+    _seed_peek(target_path, state_dict)
+    _QUEUE.put((encode_snapshot(state_dict, reason, priority), reason,
+                priority, target_path, ts))
+    if _WRITER is None:
+        _WRITER = threading.Thread(target=_drain_queue, daemon=True,
+                                   name="ct2-snapshot")
+        _WRITER.start()
+
+# Waits until everything queued so far is on disk. The writer is a daemon
+# thread, so anything still queued when the process ends is lost; app exit
+# calls this. Returns False if the writer didn't get there within timeout.
+def flush_snapshots(timeout=5.0):
+    if _WRITER is None:
+        return True
+    done = threading.Event()
+    _QUEUE.put(done)
+    return done.wait(timeout)
+
+def _drain_queue():
+    while True:
+        batch = [_QUEUE.get()]
+        while True:
+            try:
+                batch.append(_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        flushes = [item for item in batch if isinstance(item, threading.Event)]
+        try:
+            with _LOCK:
+                written = 0
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        continue
+                    try:
+                        _write_snapshot(*item)
+                        written += 1
+                    except OSError as e:
+                        log.warning(f"Background snapshot failed: {e}")
+                if written:
+                    _prune_snapshots()
+        except Exception:
+            # Anything else would end the thread, and with it every later
+            # snapshot and flush.
+            log.exception("Background snapshot writer failed.")
+        for done in flushes:
+            done.set()
+
 # Extracts and returns the datetime from a given snapshot's filename, such as state_20260212_140311_123456.json ->
 # 2/12/2026, 2:03PM, 11.123456 seconds
+# create_snapshot only ever writes that one fixed-width shape, so the fields
+# are sliced out by position rather than handed to strptime, which re-scans
+# its format string for every file in a fresh listing.
 def _parse_snapshot_time(filename):
-    base = os.path.splitext(filename)[0]  # state_20260212_140311_123456
-    parts = base.split("_", 1)
-    if len(parts) < 2:
+    if (len(filename) != 33 or not filename.startswith("state_")
+            or not filename.endswith(".json")
+            or filename[14] != "_" or filename[21] != "_"):
+        return None
+    digits = filename[6:14] + filename[15:21] + filename[22:28]
+    if not (digits.isascii() and digits.isdigit()):
         return None
     try:
-        return datetime.strptime(parts[1], "%Y%m%d_%H%M%S_%f")
-    except ValueError:
+        return datetime(int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                        int(digits[8:10]), int(digits[10:12]),
+                        int(digits[12:14]), int(digits[14:20]))
+    except ValueError:          # a month 13, a 30th of February
         return None
 
 
@@ -84,41 +197,166 @@ def _snapshot_priority(path):
     if hit is not None:
         return hit
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            value = json.load(f).get("meta", {}).get("snapshot_priority", "normal")
+        value = load_json(path).get("meta", {}).get("snapshot_priority", "normal")
     except (OSError, ValueError):
         # NOT cached: an unreadable file may be one that is still being
         # written, and pinning "normal" here would outlive the reason.
         return "normal"
     _PRIORITY_CACHE[name] = value
     return value
+
+
+# filename -> {"start": session.start, "saved_at": meta.saved_at}, the two
+# fields the backup browser shows for each snapshot. It used to parse every
+# file in full (up to MAX_SNAPSHOTS of them) each time it opened, to read two
+# strings. Immutable like the priority, so cached the same way and evicted by
+# the same prune: seeded by the writer from the state it was handed, so
+# anything written this session is never read back for it at all.
+_PEEK_CACHE = {}
+
+
+def _seed_peek(path, state_dict):
+    _PEEK_CACHE[path.name] = {
+        "start": state_dict.get("session", {}).get("start"),
+        "saved_at": state_dict.get("meta", {}).get("saved_at"),
+    }
+
+
+# The browser's view of one snapshot, from the cache where possible. Raises
+# OSError/ValueError for a file that can't be read, like load_json; those
+# aren't cached, for the same reason as _snapshot_priority. A full read
+# records the priority while it's there.
+def peek_meta(path):
+    name = path.name
+    hit = _PEEK_CACHE.get(name)
+    if hit is not None:
+        return hit
+    data = load_json(path)
+    meta = data.get("meta", {})
+    peek = {"start": data.get("session", {}).get("start"),
+            "saved_at": meta.get("saved_at")}
+    _PEEK_CACHE[name] = peek
+    _PRIORITY_CACHE.setdefault(name, meta.get("snapshot_priority", "normal"))
+    return peek
+
+
+# filename -> POSIX timestamp (a float, converted once here so prune's
+# arithmetic never touches a datetime) for every snapshot on disk, as of the
+# directory mtime recorded alongside it. Kept in oldest-first order, so prune
+# bisects it as it stands instead of sorting it again every time.
+#
+# prune ran iterdir plus a strptime per file on every snapshot, and all it
+# ever learns that it didn't already know is the one file create_snapshot
+# just wrote. Our own writes and deletes update this in place and re-stamp
+# the mtime; anything else touching the folder (a user clearing it by hand)
+# changes the mtime and forces one fresh listing.
+_LISTING = {"dir": None, "mtime": None, "entries": {}}
+
+
+def _dir_mtime():
+    try:
+        return os.stat(PATHS.snapshots).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _snapshot_entries():
+    mtime = _dir_mtime()
+    if (_LISTING["dir"] == PATHS.snapshots and mtime is not None
+            and _LISTING["mtime"] == mtime):
+        return _LISTING["entries"]
+    entries = {}
+    with os.scandir(PATHS.snapshots) as it:
+        for entry in it:
+            ts = _parse_snapshot_time(entry.name)
+            if ts is not None:
+                entries[entry.name] = ts.timestamp()
+    entries = dict(sorted(entries.items(), key=lambda e: e[1]))
+    _LISTING.update(dir=PATHS.snapshots, mtime=mtime, entries=entries)
+    return entries
+
+
+# Record a file we just wrote, stamped with the time its name was made from
+# (the same value a fresh listing would parse back out of it, so the writer
+# never has to parse its own name). Only valid if the listing was current
+# before the write — `before` is the folder's mtime read just ahead of it. If
+# that doesn't match, something else touched the folder in between, and
+# re-stamping would hide it; drop the stamp so the next look re-lists. A
+# queued snapshot can be older than the newest one on file, so entries can
+# arrive out of order.
+def _remember(path, ts, before):
+    if _LISTING["dir"] != path.parent or _LISTING["mtime"] is None:
+        return
+    if before is None or before != _LISTING["mtime"]:
+        _LISTING["mtime"] = None
+        return
+    entries = _LISTING["entries"]
+    newest = next(reversed(entries.values()), None)
+    entries[path.name] = ts
+    if newest is not None and ts < newest:
+        # Queued behind a newer one, or the clock went backwards; put the
+        # order right once.
+        _LISTING["entries"] = dict(sorted(entries.items(),
+                                          key=lambda e: e[1]))
+    _LISTING["mtime"] = _dir_mtime()
+
+
+# Removes each of names from folder and returns the ones that went; anything
+# that couldn't be removed is left out. Where the platform allows it (not
+# Windows), a sweep of several files opens the folder once and unlinks
+# relative to it, instead of the kernel resolving the full path again for
+# every file. For a single file the open and close would cost more than they
+# save, so that goes by path.
+def _unlink_each(folder, names):
+    dir_fd = None
+    if len(names) > 1 and os.unlink in os.supports_dir_fd:
+        try:
+            dir_fd = os.open(folder, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError:
+            pass
+    removed = []
+    try:
+        for name in names:
+            try:
+                if dir_fd is None:
+                    os.unlink(os.path.join(folder, name))
+                else:
+                    os.unlink(name, dir_fd=dir_fd)
+            except OSError:
+                continue
+            removed.append(name)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    return removed
+
 # Use time-tier retention to remove all snapshots that don't best fit any tier. The newest snapshot is always kept.
 # We then calculate which snapshot is closest to each tier in TIERS, and delete everything else.
 def prune_snapshots():
+    with _LOCK:
+        _prune_snapshots()
+
+def _prune_snapshots():
     # Gather snapshots with parsed timestamps
-    entries = []
-    for path in PATHS.snapshots.iterdir():
-        filename = path.name
-        if not filename.startswith("state_") or not filename.endswith(".json"):
-            continue
-        ts = _parse_snapshot_time(filename)
-        if ts is not None:
-            entries.append((filename, ts))
+    listing = _snapshot_entries()
+    # The listing is oldest first; this is newest first.
+    entries = list(reversed(listing.items()))
 
     # This means there isn't anything to prune yet.
     if len(entries) <= 1:
         return
 
-    # Sort by newest first
-    entries.sort(key=lambda e: e[1], reverse=True)
-    now = datetime.now()
+    now = datetime.now().timestamp()
 
     # Keep the cache bounded to what is actually on disk. Anything deleted by
     # a previous prune (or by hand) drops out here, so this can never grow
     # past the directory — which MAX_SNAPSHOTS already caps.
-    present = {name for name, _ in entries}
-    for gone in [k for k in _PRIORITY_CACHE if k not in present]:
+    # The listing is keyed by filename already, so its keys view is the set
+    # of what's present; the difference runs in C without building one.
+    for gone in _PRIORITY_CACHE.keys() - listing.keys():
         del _PRIORITY_CACHE[gone]
+    for gone in _PEEK_CACHE.keys() - listing.keys():
+        del _PEEK_CACHE[gone]
 
     # Priority lives inside the file, so only read the ones we have to.
     priorities = {}
@@ -137,23 +375,28 @@ def prune_snapshots():
     for filename, _ in entries[:RECENT_KEEP]:
         keep.add(filename)
 
-    # For each tier, find closest snapshot
+    # For each tier, find closest snapshot. The list is already sorted, so
+    # the closest is one of the two either side of the target — bisect
+    # rather than measuring every file against every tier. TIERS ascends, so
+    # the targets only move back in time and each search can stop where the
+    # one before it landed: the eight bisects sweep the list once, between
+    # them, instead of each covering all of it.
+    oldest_first = list(listing.values())
+    last = len(oldest_first) - 1
+    hi = len(oldest_first)
     for tier_secs in TIERS:
-        target = now.timestamp() - tier_secs
-        best = None
-        best_distance = float("inf")
-        for filename, ts in entries:
-            distance = abs(ts.timestamp() - target)
-            if distance < best_distance:
-                best_distance = distance
-                best = filename
-        if best is not None:
-            keep.add(best)
+        target = now - tier_secs
+        hi = bisect_left(oldest_first, target, 0, hi)
+        i = min(hi, last)
+        # On a tie the newer one wins, as it did in the linear scan.
+        if i > 0 and target - oldest_first[i - 1] < oldest_first[i] - target:
+            i -= 1
+        keep.add(entries[last - i][0])
 
     # High-priority snapshots survive the ladder while they're recent enough.
-    cutoff = now.timestamp() - HIGH_PRIORITY_KEEP_SECS
+    cutoff = now - HIGH_PRIORITY_KEEP_SECS
     for filename, ts in entries:
-        if filename in keep or ts.timestamp() < cutoff:
+        if filename in keep or ts < cutoff:
             continue
         if priority_of(filename) == "high":
             keep.add(filename)
@@ -162,9 +405,9 @@ def prune_snapshots():
     # the newest snapshot always.
     if len(keep) > MAX_SNAPSHOTS:
         newest = entries[0][0]
-        oldest_first = [f for f, _ in reversed(entries) if f in keep]
+        kept_oldest_first = [f for f, _ in reversed(entries) if f in keep]
         for spare_high in (True, False):
-            for filename in oldest_first:
+            for filename in kept_oldest_first:
                 if len(keep) <= MAX_SNAPSHOTS:
                     break
                 if filename == newest or filename not in keep:
@@ -173,14 +416,24 @@ def prune_snapshots():
                     continue
                 keep.discard(filename)
 
-    # Delete everything not in the keep set
-    pruned_count = 0
-    for filename, _ in entries:
-        if filename not in keep:
-            try:
-                os.remove(PATHS.snapshots / filename)
-                pruned_count += 1
-            except OSError:
-                pass
+    # Delete everything not in the keep set. Usually that's one file or none,
+    # so the list is settled first and the loop is just the unlinks.
+    doomed = [filename for filename, _ in entries if filename not in keep]
+    if not doomed:
+        return
+    # As in _remember: the in-place update below only stands if nothing else
+    # has touched the folder since it was listed.
+    before = _dir_mtime()
+    removed = _unlink_each(os.fspath(PATHS.snapshots), doomed)
+    for filename in removed:
+        listing.pop(filename, None)
+    pruned_count = len(removed)
+    failed = pruned_count < len(doomed)
+    if pruned_count > 0:
+        _LISTING["mtime"] = (_dir_mtime() if before is not None
+                             and before == _LISTING["mtime"] else None)
+    if failed:
+        # Already gone, or locked — either way only a fresh listing knows.
+        _LISTING["mtime"] = None
     if pruned_count > 0:
         log.info(f"Pruned {pruned_count} files from '{PATHS.snapshots}'")
\ No newline at end of file
@@ -1,66 +1,103 @@
 import time
 from datetime import datetime
+from functools import lru_cache
 from ct.common.logger import log
 
-# This object handles actual time tracking for a single client. It uses monotonic seconds for accuracy (clock change
-# immunity).
+# A save stamps every running timer with the same running_since, so a restore parses the same few strings over and
+# over. datetime is immutable, so handing out the one cached instance is safe.
+@lru_cache(maxsize=256)
+def _parse_iso(stamp):
+    return datetime.fromisoformat(stamp)
+
+# This object handles actual time tracking for a single client. It uses the monotonic clock for accuracy (clock change
+# immunity), read as integer nanoseconds: a running span is then an exact int subtraction, converted to seconds once
+# when it's folded into `elapsed`, rather than the difference of two large float readings. `elapsed` itself stays float
+# seconds — it's what state files store and what Set Time/undo assign.
+# Its debug lines use logging's own %-args rather than f-strings: the message is only built if a handler actually
+# takes the record, instead of on every start/stop/adjust and once per timer on every restore.
 class TimerState:
+    # One of these exists per client and they are created/replaced on every restore, so keep them dict-free.
+    __slots__ = ("name", "elapsed", "running", "_mono", "started_at")
 
     # Simple __init__, with option to specify how long the timer has already been running
     def __init__(self, name, elapsed=0.0, running_since=None):
         self.name = name
         self.elapsed = float(elapsed)
         self.running = False
-        self._mono = None
+        self._mono = None       # time.monotonic_ns() at start/last freeze, while running
         self.started_at = None  # aware datetime, set when running
 
         # This means that the timer was running when last saved, restore and restart
         if running_since is not None:
-            self.started_at = datetime.fromisoformat(running_since)
+            self.started_at = _parse_iso(running_since)
             self.start()
 
-        log.debug(f"Initialized new timer '{name}', with elapsed of {elapsed} that has been running_since {running_since}")
+        log.debug("Initialized new timer '%s', with elapsed of %s that has been running_since %s",
+                  name, elapsed, running_since)
 
-    # Returns how much time has elapsed since `start()` was run.
-    @property
-    def current_elapsed(self):
+    # Returns how much time has elapsed since `start()` was run, in seconds. A plain method (no descriptor hop) that
+    # binds time.monotonic_ns as a default arg to skip the global/attr lookup.
+    def current_elapsed(self, _monotonic_ns=time.monotonic_ns):
         if self.running and self._mono is not None:
-            return self.elapsed + (time.monotonic() - self._mono)
+            return self.elapsed + (_monotonic_ns() - self._mono) * 1e-9
+        return self.elapsed
+    # current_elapsed() as of an already-read time.monotonic_ns() `now`. The UI tick reads the clock once and passes it
+    # to every row and group total it shows, so they all agree on the same instant and no one reads the clock twice.
+    # Left written out rather than having current_elapsed call it, since that one is still called one-off all over.
+    def elapsed_at(self, now):
+        if self.running and self._mono is not None:
+            return self.elapsed + (now - self._mono) * 1e-9
         return self.elapsed
 
-    # Start and stop methods for the timer.
-    def start(self):
+    # Start and stop methods for the timer. Like current_elapsed, the clocks are bound as default args so each call
+    # reads them as locals.
+    def start(self, _monotonic_ns=time.monotonic_ns, _now=datetime.now):
         if not self.running:
             self.running = True
-            self._mono = time.monotonic()
+            self._mono = _monotonic_ns()
             if self.started_at is None:
-                self.started_at = datetime.now().astimezone()
-            log.debug(f"Started timer '{self.name}' at mono {self._mono}")
-    def stop(self):
+                self.started_at = _now().astimezone()
+            log.debug("Started timer '%s' at mono %s", self.name, self._mono)
+    def stop(self, _monotonic_ns=time.monotonic_ns):
         if self.running:
-            now = time.monotonic()
-            self.elapsed += now - self._mono
+            now = _monotonic_ns()
+            self.elapsed += (now - self._mono) * 1e-9
             self.running = False
             self._mono = None
             self.started_at = None
-            log.debug(f"Stopped timer '{self.name}' at mono {now}")
+            log.debug("Stopped timer '%s' at mono %s", self.name, now)
     # Simply restores the timer to 0:00
     def reset(self):
         self.running = False
         self._mono = None
         self.started_at = None
         self.elapsed = 0.0
-        log.debug(f"Reset timer '{self.name}' to 0.0")
+        log.debug("Reset timer '%s' to 0.0", self.name)
 
     # "Freezes" the timer's running time from internal _mono into elapsed, without actually stopping the timer.
-    def freeze(self):
+    def freeze(self, _monotonic_ns=time.monotonic_ns):
         if self.running and self._mono is not None:
-            now = time.monotonic()
-            self.elapsed += now - self._mono
+            now = _monotonic_ns()
+            self.elapsed += (now - self._mono) * 1e-9
             self._mono = now
     # Manually adjusts the timer's time by the given delta in seconds (clamped at zero).
     def adjust(self, seconds):
         self.freeze()
         self.elapsed = max(0.0, self.elapsed + seconds)
-        log.debug(f"Adjusted timer '{self.name}' by {seconds} seconds to {self.elapsed}")
+        log.debug("Adjusted timer '%s' by %s seconds to %s", self.name, seconds, self.elapsed)
+
 
+# Sum of current_elapsed() across many timers, read against a single clock sample — `now` if the caller already has
+# one (see elapsed_at). The status line totals every timer on every tick, and only the running ones have moved; this
+# walks the slots directly instead of paying a method call and a clock read per timer. The running spans are summed as
+# integer nanoseconds and converted to seconds once at the end.
+def total_elapsed(timers, now=None, _monotonic_ns=time.monotonic_ns):
+    if now is None:
+        now = _monotonic_ns()
+    total = 0.0
+    running_ns = 0
+    for ts in timers:
+        total += ts.elapsed
+        if ts.running and ts._mono is not None:
+            running_ns += now - ts._mono
+    return total + running_ns * 1e-9
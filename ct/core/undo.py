@@ -70,8 +70,8 @@ class ResetTimes(Command):
         out = []
         for rid in self.previous:
             ts = timers.get(rid)
-            if ts is not None and ts.current_elapsed >= 1:
-                out.append((ts.name, ts.current_elapsed))
+            if ts is not None and ts.current_elapsed() >= 1:
+                out.append((ts.name, ts.current_elapsed()))
         return out
 
     def undo(self, state, timers, mode="revert"):
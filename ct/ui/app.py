@@ -3,10 +3,12 @@ from ctypes import wintypes
 import re
 import time
 import sys
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
 from PySide6.QtCore import (Qt, QEvent, QTimer, QPropertyAnimation,
-                            QEasingCurve, QSharedMemory, Signal)
+                            QEasingCurve, QSharedMemory, QSignalBlocker,
+                            Signal)
 from PySide6.QtGui import (QColor, QCursor, QFont, QFontDatabase, QIcon,
                            QKeySequence)
 from PySide6.QtWidgets import (
@@ -31,9 +33,10 @@ from ct.common import crash
 from ct.common.logger import log
 from ct.common.setup import PATHS
 from ct.core.config import AppState, save_completed_session
-from ct.core.snapshot import create_snapshot, prune_snapshots
+from ct.core.snapshot import (create_snapshot, flush_snapshots,
+                              prune_snapshots, queue_snapshot)
 from ct.core.update import launch_installer as update_launch
-from ct.core.timer_state import TimerState
+from ct.core.timer_state import TimerState, total_elapsed
 from ct.core.undo import (DeleteRow, RenameRow, ReorderRows, ResetTimes,
                           UndoStack)
 from ct.ui.dialogs import ConfigDialog
@@ -41,14 +44,42 @@ from ct.ui.drag import DragController
 from ct.ui.theme import (THEMES, SIZES, FONTS, build_stylesheet,
                          build_menu_stylesheet)
 from ct.ui.ui_blueprint import UIBlueprint
-from ct.ui.row_factory import RowFactory
+from ct.ui.row_factory import RowFactory, fg_css
 from ct.ui.widgets import TickCheckBox
 from ct.util import format_time, format_copy_time, now_iso
 
 # Permissive denylist: real client names use unicode, '&', '-', ',', etc.
 # Only control characters are stripped — name labels render as PlainText so
-# nothing else needs escaping.
-_SANITIZE = re.compile(r"[\x00-\x1f\x7f-\x9f]+")
+# nothing else needs escaping. A str.translate deletion table rather than a
+# regex: it is one C-level pass with no pattern engine involved, and the set
+# being stripped is a fixed list of code points anyway.
+_SANITIZE = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])
+
+def _sanitize(text):
+    # Nearly every name is already clean. isprintable() is False for every
+    # code point in _SANITIZE, so when it holds there is nothing to delete,
+    # and the scan skips building a translated copy just to strip it.
+    if text.isprintable():
+        return text.strip()
+    return text.translate(_SANITIZE).strip()
+
+# The colour picker is always dark whatever the theme: its swatches are the
+# content, and a themed background would tint how every colour reads.
+_COLOR_DIALOG_CSS = (
+    "QColorDialog { background-color: #2a2a2a; }"
+    "QLabel { color: #FFFFFF; background: transparent; }"
+    "QPushButton { color: #FFFFFF; background-color: #555555;"
+    "  border: 1px solid #777; padding: 4px 8px; }"
+    "QPushButton:hover { background-color: #666666; }"
+    "QLineEdit { color: #FFFFFF; background-color: #555555;"
+    "  border: 1px solid #777; }"
+    "QSpinBox { color: #FFFFFF; background-color: #555555;"
+    "  border: 1px solid #777; }"
+)
+
+# Set Time input: up to three colon-separated ASCII numbers. See
+# _parse_time_input for what each shape means.
+_TIME_INPUT = re.compile(r"([0-9]+)(?::([0-9]+))?(?::([0-9]+))?\Z")
 
 # Windows sends these around an interactive move/resize of the window frame.
 # They bracket the whole gesture, so they tell us when the user has actually
@@ -74,6 +105,18 @@ _SC_MASK       = 0xFFF0
 # the button has ever been laid out.
 _TOAST_CLOSE_W = 18
 
+# The window icon, decoded once per process. Built lazily rather than at
+# import because a QIcon needs a QApplication to exist first; after that
+# every MainWindow (tests make dozens) shares the one instance instead of
+# re-reading and re-decoding the .ico from disk.
+_APP_ICON = None
+
+
+def _app_icon():
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(str(PATHS.assets / "icon.ico"))
+    return _APP_ICON
 
 
 # ---------------------------------------------------------------------------
@@ -107,7 +150,7 @@ class MainWindow(QMainWindow):
         self._reset_choices = reset_choices
 
         self.setWindowTitle("Client Timer 2")
-        self.setWindowIcon(QIcon(str(PATHS.assets / "icon.ico")))
+        self.setWindowIcon(_app_icon())
 
         self._next_rowid = max(
             (r["rowid"] for r in self._state.rows), default=-1) + 1
@@ -125,29 +168,48 @@ class MainWindow(QMainWindow):
                 )
 
         self._widgets      = {}
-        self._has_mdl2     = "Segoe MDL2 Assets" in QFontDatabase.families()
+        self._blueprint    = None  # what the current row widgets were sized from
+        self._built_from   = None  # theme/size values that blueprint was built on
+        self._has_mdl2     = QFontDatabase.hasFamily("Segoe MDL2 Assets")
+        self._row_idx      = None  # see _row_index
         self._shift_held   = False
+        self._last_applied_shift = False  # what the row buttons currently say
         self._rearranging  = False
         self._visible_rowids = []  # populated by _rebuild_rows
+        self._visible_cache  = None  # see _visible_set
         self._undo         = UndoStack()
 
         # -- Drag controller --
         self._drag = DragController(self)
 
         # -- Snapshot handling --
-        self._last_snapshot_time = 0.0
-        # Seconds between non-high-priority snapshots. Short on purpose: a
+        # When the next idle / medium snapshot is allowed, as time.monotonic_ns()
+        # deadlines. Both move forward together whenever any snapshot is
+        # taken; the idle check runs every tick, and this makes the usual
+        # answer ("not yet") a single integer compare.
+        self._idle_snapshot_due   = 0
+        self._medium_snapshot_due = 0
+        # The state (AppState.saved_body) the newest snapshot holds. A routine
+        # snapshot of an unchanged state is a duplicate: it restores nothing
+        # new, and it pushes a real restore point out of the newest-20 that
+        # snapshot.py keeps. Left open and idle overnight, that was all of them.
+        # Medium ones count too: with nothing changed since, the file they'd
+        # write is one already on disk under another name. High-priority ones
+        # are always written; their callers want a file, and prune keeps them
+        # longer.
+        self._snapshot_body = None
+        # Time between non-high-priority snapshots. Short on purpose: a
         # snapshot is ~2.5 KB, and a rapid run of deletes/resets deserves a
         # restore point each rather than one shared between them.
-        self._snapshot_debounce  = 2.0
-        # Seconds between IDLE snapshots — the heartbeat taken because time
+        self._snapshot_debounce_ns = 2 * 1_000_000_000
+        # Time between IDLE snapshots — the heartbeat taken because time
         # passed, with nothing happening. A tuning value, not a preference:
         # it used to be a "Backup Interval" setting and was removed because
         # nothing a user could reason about depended on it. Crash safety is
-        # state.json (rewritten every 20 ticks), and history depth is the
+        # state.json (rewritten every 20 s), and history depth is the
         # tier ladder in snapshot.py — neither is affected by this. All it
         # changes is how densely the newest-20 buffer is packed.
-        self._snapshot_idle_secs = 5 * 60
+        self._snapshot_idle_ns = 5 * 60 * 1_000_000_000
 
         # -- Pre-UI startup checks --
         self._startup_checks()
@@ -159,6 +221,7 @@ class MainWindow(QMainWindow):
         self._main_lay.setContentsMargins(0, 0, 0, 0)
 
         self._time_labels    = {}    # time QLabel -> rowid, for click-to-copy
+        self._shown_secs     = {}    # rowid -> (time QLabel, whole seconds shown)
         self._name_labels    = {}    # name QLabel -> rowid, for dbl-click rename
         self._row_children   = {}    # any row sub-widget -> rowid, for hover
         self._hovered_rid    = None  # row the pointer is actually inside
@@ -175,6 +238,12 @@ class MainWindow(QMainWindow):
         self._resize_settle.setSingleShot(True)
         self._resize_settle.setInterval(200)
         self._resize_settle.timeout.connect(self._on_resize_settled)
+        self._last_save      = 0     # monotonic_ns; the tick autosaves off it
+        # Trailing save for the clicks that come in bursts — see _save_soon.
+        self._save_settle    = QTimer(self)
+        self._save_settle.setSingleShot(True)
+        self._save_settle.setInterval(250)
+        self._save_settle.timeout.connect(self._save_state)
         # Qt does not guarantee a Leave when the pointer exits quickly, and
         # this window is usually not the focused one, so a missed Leave used
         # to strand the hover tint until the user came back and hovered
@@ -185,6 +254,8 @@ class MainWindow(QMainWindow):
         self._hover_poll.timeout.connect(self._sync_hover_to_cursor)
         self._grid_widget    = None  # created fresh each _rebuild_rows
         self._content_widget = None  # single swappable child: grid + footer
+        self._tree_key       = None  # what the content tree was built for
+        self._applied_style  = None  # last sheet pushed by _apply_style
 
         # -- Toast notification bar --
         self._toast_container = QWidget()
@@ -265,10 +336,21 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(2500, self._start_update_check)
 
         # -- Tick timer (1 s) --
-        self._tick_n = 0
+        # Only runs while some timer does: started by _ensure_ticking, and
+        # _tick stops it once nothing is left to count. A 1 Hz wakeup for the
+        # life of an idle window is exactly what keeps a laptop from idling.
         self._timer  = QTimer(self)
         self._timer.timeout.connect(self._tick)
-        self._timer.start(1000)
+        self._ensure_ticking()
+
+        # The daily reset gets its own wakeup aimed at the boundary, running
+        # or idle alike — the tick doesn't check for it. See
+        # _schedule_reset_wake.
+        self._reset_wake = QTimer(self)
+        self._reset_wake.setSingleShot(True)
+        self._reset_wake.setTimerType(Qt.CoarseTimer)
+        self._reset_wake.timeout.connect(self._on_reset_wake)
+        self._schedule_reset_wake()
 
 
     # ------------------------------------------------------------------ #
@@ -428,11 +510,18 @@ class MainWindow(QMainWindow):
         return reset
 
     def _apply_style(self):
+        # setStyleSheet makes Qt reparse the sheet and repolish every widget
+        # under it — on the QApplication that is ALL of them. Settings saves
+        # and snapshot restores call this whether or not the theme moved, so
+        # only push the sheet when it is actually a different one. Margins
+        # below are cheap and always re-applied (size can change on its own).
         style = build_stylesheet(self._state.settings.theme)
-        self.setStyleSheet(style)
-        app = QApplication.instance()
-        if app is not None:
-            app.setStyleSheet(style)
+        if style != self._applied_style:
+            self.setStyleSheet(style)
+            app = QApplication.instance()
+            if app is not None:
+                app.setStyleSheet(style)
+            self._applied_style = style
 
         s = SIZES.get(self._state.settings.size, SIZES["Regular"])
         self._main_lay.setContentsMargins(
@@ -447,40 +536,76 @@ class MainWindow(QMainWindow):
     #  Group helpers                                                       #
     # ------------------------------------------------------------------ #
 
+    def _row_index(self):
+        """(row by rowid, owning group by rowid, child rowids by group).
+
+        Built in one pass over the rows and reused until the row list
+        changes. The tick asks for every group's children, and a drag looks
+        rows up by rowid on every step, so scanning the list for each answer
+        was O(rows) per question. Rows are edited in place (rename, colour)
+        without the dicts changing identity, so only the list's structure
+        matters here. Swapping or resizing the list is noticed on its own;
+        anything that reorders it in place calls _rows_changed.
+        """
+        rows = self._state.rows
+        idx = self._row_idx
+        if idx is None or idx[0] is not rows or idx[1] != len(rows):
+            by_rid, parent_of, children_of = {}, {}, {}
+            group = None
+            for row in rows:
+                rid = row["rowid"]
+                by_rid[rid] = row
+                if row["type"] == "separator":
+                    group = rid
+                    children_of[rid] = []
+                else:
+                    parent_of[rid] = group
+                    if group is not None:
+                        children_of[group].append(rid)
+            idx = self._row_idx = (rows, len(rows), by_rid, parent_of,
+                                   children_of)
+        return idx
+
+    def _rows_changed(self):
+        """Drop the row index after an in-place reorder of the row list."""
+        self._row_idx = None
+
+    def _row(self, rowid):
+        """The row dict for a rowid, or None."""
+        return self._row_index()[2].get(rowid)
+
     def _group_children(self, group_rowid):
         """Return rowids of timer rows belonging to a separator."""
+        return list(self._children_view(group_rowid))
+
+    def _children_view(self, group_rowid):
+        """_group_children without the copy, for callers that only read.
+
+        The tick counts and totals every group every second; copying each
+        child list just to take its len() or sum over it was pure overhead.
+        The index entry itself comes back, so this must never be mutated.
+        """
         if (self._drag.group_rids is not None
                 and group_rowid == self._drag.dragging_rid):
-            return list(self._drag.group_rids)
-        children = []
-        found = False
-        for row in self._state.rows:
-            if row["rowid"] == group_rowid:
-                found = True
-                continue
-            if found:
-                if row["type"] == "separator":
-                    break
-                children.append(row["rowid"])
-        return children
-
-    def _group_total_time(self, group_rowid):
-        """Sum of floored current_elapsed for all children of a separator."""
-        total = 0
-        for child_rid in self._group_children(group_rowid):
-            if child_rid in self.timers:
-                total += int(self.timers[child_rid].current_elapsed)
-        return total
+            return self._drag.group_rids
+        return self._row_index()[4].get(group_rowid, ())
+
+    def _group_total_time(self, group_rowid, now=None):
+        """Sum of floored current_elapsed for all children of a separator.
+
+        As of `now` (a time.monotonic_ns() reading) when the caller has one —
+        the tick passes its own — else one fresh reading for every child.
+        """
+        if now is None:
+            now = time.monotonic_ns()
+        timers = self.timers
+        return sum(int(timers[cid].elapsed_at(now))
+                   for cid in self._children_view(group_rowid)
+                   if cid in timers)
 
     def _parent_group(self, rowid):
         """Return the separator rowid that owns this timer, or None."""
-        parent = None
-        for row in self._state.rows:
-            if row["type"] == "separator":
-                parent = row["rowid"]
-            elif row["rowid"] == rowid:
-                return parent
-        return None
+        return self._row_index()[3].get(rowid)
 
     # ------------------------------------------------------------------ #
     #  Row building                                                        #
@@ -495,17 +620,33 @@ class MainWindow(QMainWindow):
         # the position has to be carried across by hand. Done here rather than
         # at the call sites because _reorder_visual rebuilds mid-drag, and
         # that path would otherwise yank the list back to the top.
+        # Both scroll bars are kept quiet while this runs. Their valueChanged
+        # refreshes the bottom line and status, which are refreshed once at
+        # the end anyway: the old bar fires as its content is torn down
+        # (against a half-built row list, no less) and the new one fires when
+        # the position is put back. The deferred retry in _restore_scroll
+        # runs after this and still signals, since by then nothing else will.
+        # An in-place rebuild keeps the bar, so it is unblocked again if it
+        # survived; otherwise it is deleted with the old content.
         keep = 0
+        old_bar = None
         if self._scroll_area is not None:
-            keep = self._scroll_area.verticalScrollBar().value()
+            old_bar = self._scroll_area.verticalScrollBar()
+            keep = old_bar.value()
+            old_bar.blockSignals(True)
         self.setUpdatesEnabled(False)
         try:
             self._rebuild_rows_impl()
+            if old_bar is not None and old_bar is self._scroll_area.verticalScrollBar():
+                old_bar.blockSignals(False)
             if keep:
-                self._restore_scroll(keep)
+                with QSignalBlocker(self._scroll_area.verticalScrollBar()):
+                    self._restore_scroll(keep)
             self._update_bottom_line()
             self._update_status()
         finally:
+            if self._grid_widget is not None:
+                self._grid.setEnabled(True)
             self.setUpdatesEnabled(True)
 
     def _scroll_anchor(self):
@@ -572,45 +713,130 @@ class MainWindow(QMainWindow):
         except Exception:
             pass          # reporting must never be able to break the app
 
+    def _reuse_row(self, old_widgets, old_grid, rid, sig):
+        """Adopt a row from the outgoing grid if it was built from `sig`.
+
+        A rebuild used to recreate every row for any edit at all — ~280ms at
+        68 timers to add one client. Almost all of those rows come out
+        exactly as they went in, so a row is kept when everything that went
+        into building it is unchanged, and only its moving parts (the time,
+        a group's count and total) are re-set by the caller.
+
+        Anything that restyles a row in place after it was built without
+        going through RowFactory must drop its "_sig", or this would hand
+        back a row that no longer looks like its signature says.
+        """
+        wd = old_widgets.pop(rid, None)
+        if wd is None or wd.get("_sig") != sig:
+            return None
+        rc = wd.get("container")
+        try:
+            if old_grid is not None:
+                old_grid.removeWidget(rc)
+            hov = rc.property("hov")
+        except RuntimeError:
+            return None                  # died with an earlier tree
+        # A fresh container starts untinted; so must an adopted one.
+        if hov:
+            rc.setProperty("hov", "")
+            rc.style().unpolish(rc)
+            rc.style().polish(rc)
+        self._register_row(rc, wd, rid)
+        return rc, wd
+
     def _rebuild_rows_impl(self):
-        """Tear down and recreate the entire grid: client rows + footer."""
+        """Rebuild the grid: client rows + footer.
+
+        Rows whose inputs haven't changed since they were built are carried
+        over rather than recreated — see _reuse_row — and when they can be,
+        the grid, scroll area and footer around them are kept as well.
+        """
         self._sync_scrub_terms()
+        self._rows_changed()   # a rebuild is the catch-all after any edit
+        # Rows are built fresh, or adopted from here if nothing they were
+        # built from has changed. Whatever is left dies with the old tree.
+        old_widgets = dict(self._widgets)
+        old_grid = self._grid if self._grid_widget is not None else None
         self._widgets.clear()
         self._time_labels = {}   # time QLabel -> rowid, for click-to-copy
         self._name_labels = {}   # name QLabel -> rowid, for dbl-click rename
         self._row_children = {}  # sub-widget -> rowid, for hover tracking
-        # The editor lived in the tree about to be replaced.
-        self._inline_editor = None
-
-        # Build the entire new content (row grid + footer) fully offline as
-        # ONE widget tree, then swap it into the window in a single adjacent
-        # remove/insert. Swapping grid/footer as separate top-level layout
-        # children lets Qt flush a partial frame between event-loop
-        # iterations — the drag-drop flicker.
-        content = QWidget()
-        content_lay = QVBoxLayout(content)
-        content_lay.setContentsMargins(0, 0, 0, 0)
-        content_lay.setSpacing(0)
-
-        self._grid_widget = QWidget()
-        self._grid = QVBoxLayout(self._grid_widget)
-        self._grid.setContentsMargins(0, 0, 0, 0)
-        # NOTE: the grid is added to content_lay further down — bare when the
-        # row count is under the cap, wrapped in a QScrollArea when it isn't.
+        self._shown_secs = {}    # rows may be rebuilt with different text
+        self._last_applied_shift = self._shift_held  # rows are built with it
+        # The editor is parented to a row, which may survive the rebuild now.
+        self._end_inline_rename(commit=False)
 
         ss = self._state.settings
         t  = THEMES.get(ss.theme, THEMES["E-Ink (Default)"])
         s  = SIZES.get(ss.size, SIZES["Regular"])
 
+        blueprint = UIBlueprint.compute(t, s, ss.font, self._state.rows, self._has_mdl2)
+        # Every fixed width and font in a row comes from the blueprint, so a
+        # different one (theme, size, font, or a longer name widening the
+        # name column) means nothing old can be kept.
+        # Theme and size are copied: the blueprint only holds references to
+        # those dicts, and a reference compares equal to itself.
+        built_from = (dict(t), dict(s))
+        if blueprint != self._blueprint or built_from != self._built_from:
+            old_widgets = {}
+        self._blueprint  = blueprint
+        self._built_from = built_from
+
+        # When rows can be adopted, so can everything around them: the scroll
+        # area, the footer rule and the footer are built from the same
+        # blueprint, and beyond that only care whether there are any rows at
+        # all (edit mode flips the footer in place — _apply_rearrange_mode).
+        # Keeping the tree means adopted
+        # rows never change parent. Moving them into a fresh grid was most of
+        # what an adopting rebuild still cost — every reparent re-polishes
+        # the row and its children, and sends each of them a burst of events
+        # through eventFilter — ~400ms at 72 rows, against ~40ms in place.
+        tree_key = bool(self._state.rows)
+        in_place = (bool(old_widgets) and old_grid is not None
+                    and self._content_widget is not None
+                    and tree_key == self._tree_key)
+        self._tree_key = tree_key
+
+        if in_place:
+            # Emptying the layout leaves every row parented where it is;
+            # the loops below put them back in the new order. The layout is
+            # switched off meanwhile: each take and add invalidates it, and
+            # nothing may act on a half-refilled list — it is laid out once,
+            # when it is whole again (below, and in _rebuild_rows' finally
+            # should this throw halfway).
+            self._grid.setEnabled(False)
+            while self._grid.count():
+                self._grid.takeAt(0)
+            old_grid = None
+        else:
+            # Build the entire new content (row grid + footer) fully offline
+            # as ONE widget tree, then swap it into the window in a single
+            # adjacent remove/insert. Swapping grid/footer as separate
+            # top-level layout children lets Qt flush a partial frame between
+            # event-loop iterations — the drag-drop flicker.
+            content = QWidget()
+            content_lay = QVBoxLayout(content)
+            content_lay.setContentsMargins(0, 0, 0, 0)
+            content_lay.setSpacing(0)
+
+            self._grid_widget = QWidget()
+            # Still called the grid, but a plain vertical stack: every row is
+            # one container with its own QHBoxLayout, so there are no cells
+            # or spans to keep. The grid goes into content_lay in
+            # _install_content, always inside a QScrollArea.
+            self._grid = QVBoxLayout(self._grid_widget)
+            self._grid.setContentsMargins(0, 0, 0, 0)
+
         self._grid.setSpacing(s.get("v_spacing", s["padding"]))
 
-        blueprint = UIBlueprint.compute(t, s, ss.font, self._state.rows, self._has_mdl2)
+        def take(rid, sig):
+            return self._reuse_row(old_widgets, old_grid, rid, sig)
 
         row_containers = []    # every row widget, for the uniform-height pass
 
         if not self._state.rows:
             lbl = QLabel("No clients. Click the unlock button in\nthe bottom left and add one to begin!")
-            lbl.setFont(QFont(ss.font, s["label"]))
+            lbl.setFont(blueprint.label_font)
             lbl.setAlignment(Qt.AlignCenter)
             self._grid.addWidget(lbl)
             self._visible_rowids = []
@@ -619,6 +845,21 @@ class MainWindow(QMainWindow):
             visible_entries   = []
             dragging_group    = (self._drag.active and self._drag.group_rids is not None)
 
+            # Everything RowFactory.timer is told about a row, bar the
+            # blueprint (checked above) and the time (re-set on reuse).
+            def timer_sig(row, is_child, is_dragging, needs_sep):
+                return ("timer", row["name"], row.get("bg"), is_child,
+                        is_dragging, needs_sep, self.timers[row["rowid"]].running,
+                        self._shift_held, ss.label_align,
+                        ss.show_adjust_buttons, self._rearranging,
+                        ss.client_separators)
+
+            # Group membership comes from the row index — dropped at the top
+            # of this method, so this builds it, and the tick and drag that
+            # follow reuse it instead of re-walking the rows after us. Read
+            # only: these are the index's own lists.
+            _, _, _, group_of, children_of = self._row_index()
+
             for row in self._state.rows:
                 if row["type"] == "separator":
                     current_group_rid = row["rowid"]
@@ -648,11 +889,30 @@ class MainWindow(QMainWindow):
                         children  = list(self._drag.group_rids)
                         collapsed = True
                     else:
-                        children = self._group_children(rid)
-                    has_running = any(
-                        cid in self.timers and self.timers[cid].running
-                        for cid in children)
-                    total = self._group_total_time(rid)
+                        children = children_of.get(rid, [])
+                    child_timers = [self.timers[cid] for cid in children
+                                    if cid in self.timers]
+                    has_running = any(ts.running for ts in child_timers)
+                    # Same sum as _group_total_time: floored per child.
+                    total = sum(int(ts.current_elapsed()) for ts in child_timers)
+
+                    sig = ("separator", row["name"], row.get("bg"),
+                           self._drag.dragging_rid == rid, collapsed,
+                           has_running, ss.show_group_count, ss.show_group_time,
+                           ss.show_adjust_buttons, self._rearranging)
+                    kept = take(rid, sig)
+                    if kept is not None:
+                        # Count and total move without changing the build.
+                        row_container, widget_dict = kept
+                        if ss.show_group_count:
+                            widget_dict["count"].setText(f"({len(children)})")
+                        if ss.show_group_time:
+                            widget_dict["time"].setText(format_time(total))
+                        self._widgets[rid] = widget_dict
+                        row_containers.append(row_container)
+                        self._grid.addWidget(row_container)
+                        row_container.show()
+                        continue
 
                     row_container, widget_dict = RowFactory.separator(
                         blueprint=blueprint, rid=rid, row=row,
@@ -672,6 +932,18 @@ class MainWindow(QMainWindow):
                     # Bottom-most row: replace its client separator with the
                     # thick footer line instead of stacking both.
                     timer_state = self.timers[rid]
+                    sig = timer_sig(row, is_child,
+                                    self._drag.dragging_rid == rid, needs_sep)
+                    kept = take(rid, sig)
+                    if kept is not None:
+                        row_container, widget_dict = kept
+                        widget_dict["time"].setText(
+                            format_time(timer_state.current_elapsed()))
+                        self._widgets[rid] = widget_dict
+                        row_containers.append(row_container)
+                        self._grid.addWidget(row_container)
+                        row_container.show()
+                        continue
                     row_container, widget_dict = RowFactory.timer(
                         blueprint=blueprint, rid=rid, row=row, state=timer_state,
                         shift_held=self._shift_held, label_align=ss.label_align,
@@ -695,11 +967,15 @@ class MainWindow(QMainWindow):
                     if timer_state.running:
                         self._set_bold(rid, True, widget_dict)
 
+                widget_dict["_sig"] = sig
                 self._widgets[rid] = widget_dict
 
                 self._wire_row(row_container, widget_dict, rid)
                 row_containers.append(row_container)
                 self._grid.addWidget(row_container)
+                # A widget added to an already-visible parent stays hidden
+                # until told otherwise — the in-place path's case.
+                row_container.show()
 
             # ---- Rows inside collapsed groups -------------------------
             # Built too, then hidden. A hidden child contributes nothing to
@@ -722,21 +998,26 @@ class MainWindow(QMainWindow):
             hidden_rows = [r for r in self._state.rows
                            if r["rowid"] not in built]
             if hidden_rows:
-                current_group_rid = None
-                group_of = {}
-                for row in self._state.rows:
-                    if row["type"] == "separator":
-                        current_group_rid = row["rowid"]
-                    else:
-                        group_of[row["rowid"]] = current_group_rid
                 for row in hidden_rows:
                     rid = row["rowid"]
                     if row["type"] == "separator" or rid not in self.timers:
                         continue          # separators are never hidden
+                    is_child = group_of.get(rid) is not None
+                    sig = timer_sig(row, is_child, False, ss.client_separators)
+                    kept = take(rid, sig)
+                    if kept is not None:
+                        rc, wd = kept
+                        wd["time"].setText(
+                            format_time(self.timers[rid].current_elapsed()))
+                        self._widgets[rid] = wd
+                        row_containers.append(rc)
+                        self._grid.addWidget(rc)
+                        rc.hide()
+                        continue
                     rc, wd = RowFactory.timer(
                         blueprint=blueprint, rid=rid, row=row,
                         state=self.timers[rid],
-                        is_child=group_of.get(rid) is not None,
+                        is_child=is_child,
                         is_dragging=False,
                         draw_separator_line=ss.client_separators,
                         shift_held=self._shift_held,
@@ -751,6 +1032,7 @@ class MainWindow(QMainWindow):
                     )
                     if self.timers[rid].running:
                         self._set_bold(rid, True, wd)
+                    wd["_sig"] = sig
                     self._widgets[rid] = wd
                     self._wire_row(rc, wd, rid)
                     row_containers.append(rc)
@@ -762,11 +1044,29 @@ class MainWindow(QMainWindow):
         # given window of N rows a different total height from the next,
         # so the bottom row was clipped by a varying amount while scrolling.
         # One pitch means both edges stay flush at every scroll position.
+        self._grid.setEnabled(True)
         if row_containers:
             uniform = max(c.sizeHint().height() for c in row_containers)
             for c in row_containers:
                 c.setFixedHeight(uniform)
 
+        if in_place:
+            self._retire_rows(old_widgets)
+        else:
+            self._install_content(content, content_lay, blueprint, t, s)
+        # The strip was destroyed with the old tree; a live drag still wants
+        # one. Must come after the swap so the new containers have geometry.
+        self._sync_drag_strip()
+
+        QTimer.singleShot(0, self._sync_footer_heights)
+        # Deferred so the new rows have geometry to hit-test against. This is
+        # what re-tints the row under a stationary pointer after a drag ends.
+        QTimer.singleShot(0, self._sync_hover_to_cursor)
+        self._schedule_bottom_line()
+
+    def _install_content(self, content, content_lay, blueprint, t, s):
+        """Wrap a freshly built grid in its scroll area and footer, and swap
+        the result into the window in place of the old content tree."""
         # The grid always lives in a scroll viewport. Without one the layout's
         # minimum size is the whole row list, so the user physically cannot
         # drag the window shorter than its contents.
@@ -847,22 +1147,42 @@ class MainWindow(QMainWindow):
         # event-loop turn, and until then QLayout skips it when measuring, so
         # the window's size hint reads 0x0.
         content.setVisible(True)
-        # The strip was destroyed with the old tree; a live drag still wants
-        # one. Must come after the swap so the new containers have geometry.
-        self._sync_drag_strip()
 
-        QTimer.singleShot(0, self._sync_footer_heights)
-        # Deferred so the new rows have geometry to hit-test against. This is
-        # what re-tints the row under a stationary pointer after a drag ends.
-        QTimer.singleShot(0, self._sync_hover_to_cursor)
-        self._schedule_bottom_line()
+    def _retire_rows(self, leftovers):
+        """Get rid of the rows an in-place rebuild did not adopt.
+
+        The full path lets them die with the old content tree. Here there is
+        no old tree, so each goes individually — hidden first, because
+        deleteLater waits for the event loop and an unlaid-out child would
+        sit painted at its old position until then.
+        """
+        for wd in leftovers.values():
+            rc = wd.get("container")
+            try:
+                rc.hide()
+                rc.deleteLater()
+            except (AttributeError, RuntimeError):
+                pass
+        # Same reset the tree swap does: the strip may be sitting over a row
+        # that just moved or went away. _sync_hover_to_cursor re-derives it.
+        strip = self._live_strip()
+        if strip is not None:
+            strip.hide()
+        self._hovered_rid = None
 
     # ------------------------------------------------------------------ #
     #  Shift-key visual feedback                                           #
     # ------------------------------------------------------------------ #
 
     def _update_shift_labels(self):
+        # Shift edges arrive twice — a release also clears it on deactivation,
+        # and key events can land after changeEvent already did — so only an
+        # actual flip walks the rows. Per button, setText is already a no-op
+        # on identical text.
         sh = self._shift_held
+        if sh == self._last_applied_shift:
+            return
+        self._last_applied_shift = sh
         for rid, w in self._widgets.items():
             if w.get("is_group"):
                 continue
@@ -893,6 +1213,7 @@ class MainWindow(QMainWindow):
         # snapshot history should be able to get back past it.
         self._try_snapshot(reason="pre_undo", priority="medium")
         cmd.undo(self._state, self.timers, mode)
+        self._rows_changed()    # undo can reorder the rows in place
         self._save_state()
         self._rebuild_rows()
         self._shrink_to_fit()
@@ -1069,8 +1390,21 @@ class MainWindow(QMainWindow):
         else:
             self._on_start(rowid)
 
+    @staticmethod
+    def _shift_down():
+        """Whether Shift was held for the input event being handled.
+
+        keyboardModifiers() is the state Qt recorded off the last input
+        event, not a query to the OS (that is queryKeyboardModifiers), so
+        it is already the "captured at click time" value and costs a read.
+        Deliberately not _shift_held: that only follows key events, and the
+        window is usually unfocused when clicked, so a Shift pressed
+        elsewhere never reaches it — the click's own modifiers do.
+        """
+        return bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+
     def _on_start(self, rowid):
-        if QApplication.keyboardModifiers() & Qt.ShiftModifier:
+        if self._shift_down():
             self._start_additional(rowid)
         else:
             self._start_exclusive(rowid)
@@ -1083,11 +1417,11 @@ class MainWindow(QMainWindow):
         self._update_status()
 
     def _on_adjust(self, rowid, direction):
-        minutes = 1 if (QApplication.keyboardModifiers() & Qt.ShiftModifier) else 5
+        minutes = 1 if self._shift_down() else 5
         self.timers[rowid].adjust(direction * minutes * 60)
         self._update_display(rowid)
         self._update_parent_group_time(rowid)
-        self._save_state()
+        self._save_soon()
         self._update_status()
 
     def _push_delete_undo(self, rowid):
@@ -1095,7 +1429,7 @@ class MainWindow(QMainWindow):
 
         Returns the row's name so the caller can name it in a toast.
         """
-        row = next((r for r in self._state.rows if r["rowid"] == rowid), None)
+        row = self._row(rowid)
         if row is None:
             return None
         ts = self.timers.get(rowid)
@@ -1103,14 +1437,14 @@ class MainWindow(QMainWindow):
             f"the deletion of '{row['name']}'",
             row=dict(row),
             index=self._state.rows.index(row),
-            elapsed=ts.current_elapsed if ts is not None else 0.0,
+            elapsed=ts.current_elapsed() if ts is not None else 0.0,
             was_collapsed=rowid in self._state.collapsed_groups,
         ))
         return row["name"]
 
     def _on_add(self):
         raw  = self._add_input.text().strip()
-        name = _SANITIZE.sub("", raw).strip()
+        name = _sanitize(raw)
         if not name:
             return
         rid = self._next_rowid
@@ -1123,7 +1457,7 @@ class MainWindow(QMainWindow):
 
     def _on_add_group(self):
         raw  = self._add_input.text().strip()
-        name = _SANITIZE.sub("", raw).strip()
+        name = _sanitize(raw)
         if not name:
             return
         rid = self._next_rowid
@@ -1169,8 +1503,7 @@ class MainWindow(QMainWindow):
             "Reset confirmations off, can be toggled back on in Settings")
 
     def _on_remove_group(self, rowid):
-        name = next(
-            (r["name"] for r in self._state.rows if r["rowid"] == rowid), "")
+        name = (self._row(rowid) or {}).get("name", "")
         if not self._confirm_delete(f"Delete group '{name}'?"):
             return
         self._push_delete_undo(rowid)
@@ -1187,7 +1520,7 @@ class MainWindow(QMainWindow):
             self._state.collapsed_groups.discard(rowid)
         else:
             self._state.collapsed_groups.add(rowid)
-        self._save_state()
+        self._save_soon()
         self._apply_collapse_state()
 
     def _apply_collapse_state(self):
@@ -1218,6 +1551,7 @@ class MainWindow(QMainWindow):
                 btn.setText("▸" if row["rowid"] in collapsed else "▾")
         self._drag._reorder_visual()
         self._refresh_group_headers()
+        self._refresh_running_rows()
         # Rows appearing or disappearing changes the window HEIGHT, and a
         # hidden widget's effect on a layout hint only lands once the event
         # loop delivers the posted request — same reason the lock toggle
@@ -1250,8 +1584,7 @@ class MainWindow(QMainWindow):
         # two outcomes are wildly mismatched. Mistime the Shift and you
         # delete a row when you meant to zero it. Reset Time lives in the
         # right-click menu, which says what it does.
-        name = next(
-            (r["name"] for r in self._state.rows if r["rowid"] == rowid), "")
+        name = (self._row(rowid) or {}).get("name", "")
         if not self._confirm_delete(f"Delete '{name}'?"):
             return
         self._push_delete_undo(rowid)
@@ -1306,13 +1639,13 @@ class MainWindow(QMainWindow):
                 x_btn.setVisible(rearranging)
             if rearranging:
                 rc.setCursor(Qt.OpenHandCursor)
-                for child in rc.findChildren(QPushButton):
+                for child in w.get("_buttons", ()):
                     child.setCursor(Qt.ArrowCursor)
             else:
                 # unset, not ArrowCursor: the build path never set one here,
                 # and an explicit cursor stops inheriting from the parent.
                 rc.unsetCursor()
-                for child in rc.findChildren(QPushButton):
+                for child in w.get("_buttons", ()):
                     child.unsetCursor()
             # Transparent while unlocked so a drag begun on the name or the
             # time still grabs the ROW. Interactive while locked, which is
@@ -1571,9 +1904,15 @@ class MainWindow(QMainWindow):
         self._sync_hover_to_cursor()
         lbl = self._widgets[rid].get("time")
         if lbl is not None:
-            f = lbl.font()
-            f.setUnderline(entering)
-            lbl.setFont(f)
+            # Picked from the blueprint's shared fonts, as _set_bold does,
+            # rather than copying the label's font to flip one flag.
+            bp = self._blueprint
+            ts = self.timers.get(rid)
+            if ts is not None and ts.running:
+                lbl.setFont(bp.hover_bold_time_font if entering
+                            else bp.bold_time_font)
+            else:
+                lbl.setFont(bp.hover_time_font if entering else bp.time_font)
 
     # ------------------------------------------------------------------ #
     #  Footer status line (locked mode)                                    #
@@ -1600,19 +1939,22 @@ class MainWindow(QMainWindow):
                 return True
         return False
 
-    def _update_status(self):
+    def _update_status(self, now=None):
         """Refresh the locked footer's status line.
 
         Deliberately additive: the total is the plain sum of every row, so it
         always matches what a user gets by adding the rows up by hand. Running
         two timers at once therefore advances it at 2s/s — the count sitting
         right beside it is what explains that.
+
+        `now`: the tick's time.monotonic_ns() reading, so the total agrees with
+        the rows it just drew. Everything else lets it read the clock.
         """
         if not hasattr(self, "_status_lbl"):
             return
         t = THEMES.get(self._state.settings.theme, THEMES["E-Ink (Default)"])
         running = len(self._running_rids())
-        total   = sum(ts.current_elapsed for ts in self.timers.values())
+        total   = total_elapsed(self.timers.values(), now)
         # "Today" only means anything while daily reset is drawing the
         # boundary. With it off, session_start never advances on its own, so
         # the app can't honestly name the period — so it doesn't claim one.
@@ -1704,10 +2046,10 @@ class MainWindow(QMainWindow):
             if row["type"] != "timer":
                 continue
             ts = self.timers.get(row["rowid"])
-            if ts is None or ts.current_elapsed < 1:
+            if ts is None or ts.current_elapsed() < 1:
                 continue
             lines.append(f"{ts.name}: "
-                         f"{format_copy_time(ts.current_elapsed, fmt)}")
+                         f"{format_copy_time(ts.current_elapsed(), fmt)}")
         return lines
 
     def _copy_session(self):
@@ -1726,7 +2068,7 @@ class MainWindow(QMainWindow):
         if rid not in self.timers:
             return
         ts = self.timers[rid]
-        time_str = format_copy_time(ts.current_elapsed,
+        time_str = format_copy_time(ts.current_elapsed(),
                                     self._state.settings.copy_format)
         QApplication.clipboard().setText(time_str)
         self.show_toast(f"Time for {ts.name} ({time_str}) copied to clipboard",
@@ -1787,10 +2129,10 @@ class MainWindow(QMainWindow):
             self._apply_rename(rowid, text)
 
     def _apply_rename(self, rowid, text):
-        row = next((r for r in self._state.rows if r["rowid"] == rowid), None)
+        row = self._row(rowid)
         if row is None:
             return
-        new_name = _SANITIZE.sub("", text).strip()
+        new_name = _sanitize(text)
         if not new_name or new_name == row["name"]:
             return
         self._undo.push(RenameRow(
@@ -1805,7 +2147,7 @@ class MainWindow(QMainWindow):
         self._shrink_to_fit()
 
     def _on_row_context_menu(self, rowid, global_pos):
-        row = next((r for r in self._state.rows if r["rowid"] == rowid), None)
+        row = self._row(rowid)
         if row is None:
             return
         is_timer = row["type"] == "timer"
@@ -1840,10 +2182,10 @@ class MainWindow(QMainWindow):
         set_time      = menu.addAction("Set Time") if is_timer else None
         reset_time    = menu.addAction("Reset Time") if is_timer else None
         if reset_time is not None:
-            reset_time.setEnabled(self.timers[rowid].current_elapsed >= 1)
+            reset_time.setEnabled(self.timers[rowid].current_elapsed() >= 1)
         reset_all     = menu.addAction("Reset ALL Times")
         reset_all.setEnabled(
-            any(ts.current_elapsed >= 1 for ts in self.timers.values()))
+            any(ts.current_elapsed() >= 1 for ts in self.timers.values()))
         delete_action = menu.addAction("Delete")
 
         action = menu.exec(global_pos)
@@ -1880,17 +2222,7 @@ class MainWindow(QMainWindow):
             current_bg = row.get("bg")
             initial    = QColor(current_bg) if current_bg else QColor(255, 255, 255)
             cdlg = QColorDialog(initial, self)
-            cdlg.setStyleSheet(
-                "QColorDialog { background-color: #2a2a2a; }"
-                "QLabel { color: #FFFFFF; background: transparent; }"
-                "QPushButton { color: #FFFFFF; background-color: #555555;"
-                "  border: 1px solid #777; padding: 4px 8px; }"
-                "QPushButton:hover { background-color: #666666; }"
-                "QLineEdit { color: #FFFFFF; background-color: #555555;"
-                "  border: 1px solid #777; }"
-                "QSpinBox { color: #FFFFFF; background-color: #555555;"
-                "  border: 1px solid #777; }"
-            )
+            cdlg.setStyleSheet(_COLOR_DIALOG_CSS)
             if cdlg.exec() == QDialog.Accepted:
                 row["bg"] = cdlg.currentColor().name()
                 self._save_state()
@@ -1902,22 +2234,25 @@ class MainWindow(QMainWindow):
             self._try_snapshot(reason="layout_change", priority="medium")
             self._rebuild_rows()
         elif is_timer and action == set_time:
-            current = format_time(self.timers[rowid].current_elapsed)
+            current = format_time(self.timers[rowid].current_elapsed())
             text, ok = QInputDialog.getText(
                 self, "Set Time", "Enter time (HH:MM:SS):", text=current)
             if ok and text.strip():
                 secs = self._parse_time_input(text.strip())
                 if secs is not None:
                     ts = self.timers[rowid]
-                    was_running = ts.running
-                    if was_running:
-                        ts.stop()
+                    # freeze() re-bases a running timer on one clock read,
+                    # so the new value counts on from here. This was a
+                    # stop() and start() — two reads with a sliver of time
+                    # lost between them.
+                    ts.freeze()
                     ts.elapsed = secs
-                    if was_running:
-                        ts.start()
                     self._update_display(rowid)
                     self._update_parent_group_time(rowid)
                     self._save_state()
+                    # No tick to pick the new total up while everything is
+                    # stopped — see _ensure_ticking.
+                    self._update_status()
         elif action == delete_action:
             if not self._confirm_delete(f"Delete '{row['name']}'?"):
                 return
@@ -1938,17 +2273,20 @@ class MainWindow(QMainWindow):
 
     @staticmethod
     def _parse_time_input(text):
-        parts = text.split(":")
-        try:
-            if len(parts) == 3:
-                return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            elif len(parts) == 2:
-                return int(parts[0]) * 60 + int(parts[1])
-            elif len(parts) == 1:
-                return int(parts[0]) * 60
-        except ValueError:
+        """H:M:S, M:S, or a bare number of minutes -> seconds, else None.
+
+        One anchored match instead of split + int per part. int() alone
+        also took "-5", "+5" and "1_0", so a typo could set a negative time.
+        """
+        m = _TIME_INPUT.match(text)
+        if m is None:
             return None
-        return None
+        a, b, c = m.groups()
+        if c is not None:
+            return int(a) * 3600 + int(b) * 60 + int(c)
+        if b is not None:
+            return int(a) * 60 + int(b)
+        return int(a) * 60
 
     # ------------------------------------------------------------------ #
     #  Settings dialog                                                     #
@@ -1991,8 +2329,9 @@ class MainWindow(QMainWindow):
             self._state.session_start = datetime.now().astimezone()
         s.show_adjust_buttons  = dlg.chosen_show_adjust_buttons
 
-        self._save_state()
+        # A high-priority snapshot always saves first; no separate save.
         self._try_snapshot(reason="layout_change", priority="high")
+        self._schedule_reset_wake()
 
         self._apply_style()
         self._rebuild_rows()
@@ -2013,6 +2352,20 @@ class MainWindow(QMainWindow):
     def _timer_rows(rows):
         return [r for r in rows if r["type"] == "timer"]
 
+    @staticmethod
+    def _first_unused(by_name, name, used):
+        """The first rowid queued under name that isn't in used, or None.
+
+        Both restore modes match by rowid first and fall back to name, so a
+        name's queue fills up with rowids already claimed. Those are dropped
+        as they're met — used only ever grows — so each is looked at once,
+        rather than rescanning the whole list for every row sharing a name.
+        """
+        queue = by_name.get(name)
+        while queue and queue[0] in used:
+            queue.popleft()
+        return queue[0] if queue else None
+
     def _restore_times_only(self, snap):
         """Bring back elapsed times for clients that still exist. Layout,
         ordering and groups are left exactly as they are.
@@ -2020,20 +2373,19 @@ class MainWindow(QMainWindow):
         Matched on rowid first, then on name — a client that was deleted and
         re-added has a new rowid but is still, to the user, the same client.
         """
-        live_rids = {r["rowid"] for r in self._timer_rows(self._state.rows)}
-        by_name = {}
+        # One pass builds both indexes; matching below is then dict lookups
+        # rather than a scan of the live rows per snapshot row.
+        live_rids, by_name = set(), {}
         for r in self._timer_rows(self._state.rows):
-            by_name.setdefault(r["name"], []).append(r["rowid"])
+            live_rids.add(r["rowid"])
+            by_name.setdefault(r["name"], deque()).append(r["rowid"])
 
         used, count = set(), 0
         for row in self._timer_rows(snap.rows):
             rid = row["rowid"]
             target = rid if (rid in live_rids and rid not in used) else None
             if target is None:
-                for cand in by_name.get(row["name"], []):
-                    if cand not in used:
-                        target = cand
-                        break
+                target = self._first_unused(by_name, row["name"], used)
             if target is None or target not in self.timers:
                 continue
             used.add(target)
@@ -2052,17 +2404,22 @@ class MainWindow(QMainWindow):
         aren't in the snapshot go away with it — that is what restoring a
         layout means. The pre-restore snapshot is the way back.
         """
-        kept = {rid: ts.current_elapsed for rid, ts in self.timers.items()}
+        kept = {rid: ts.current_elapsed() for rid, ts in self.timers.items()}
         kept_by_name = {}
         for r in self._timer_rows(self._state.rows):
             if r["rowid"] in kept:
-                kept_by_name.setdefault(r["name"], []).append(r["rowid"])
+                kept_by_name.setdefault(r["name"], deque()).append(r["rowid"])
 
-        self._state.rows = [dict(r) for r in snap.rows]
-        self._state.collapsed_groups = set(snap.collapsed_groups)
+        # One walk of the snapshot copies every row and builds the timers,
+        # rather than one pass to copy and another to pick the timers back out.
+        rows = []
         self.timers = {}
         used, carried = set(), 0
-        for row in self._timer_rows(self._state.rows):
+        for r in snap.rows:
+            row = dict(r)
+            rows.append(row)
+            if row["type"] != "timer":
+                continue
             rid = row["rowid"]
             elapsed = 0.0
             if rid in kept and rid not in used:
@@ -2070,13 +2427,14 @@ class MainWindow(QMainWindow):
                 used.add(rid)
                 carried += 1
             else:
-                for cand in kept_by_name.get(row["name"], []):
-                    if cand not in used:
-                        elapsed = kept[cand]
-                        used.add(cand)
-                        carried += 1
-                        break
+                cand = self._first_unused(kept_by_name, row["name"], used)
+                if cand is not None:
+                    elapsed = kept[cand]
+                    used.add(cand)
+                    carried += 1
             self.timers[rid] = TimerState(row["name"], elapsed=elapsed)
+        self._state.rows = rows
+        self._state.collapsed_groups = set(snap.collapsed_groups)
         return carried
 
     def _restore_from_snapshot(self, path: Path, mode: str = "all"):
@@ -2121,6 +2479,10 @@ class MainWindow(QMainWindow):
             # only ever moves the clock forward.
             self._state.session_start = max(
                 self._state.session_start, self._most_recent_reset_boundary())
+            # The snapshot's settings came with it, daily reset included, and
+            # nothing else re-aims the wakeup — the tick doesn't check the
+            # boundary. Restoring reset-on over reset-off would never fire.
+            self._schedule_reset_wake()
             summary = "Restored times and rows"
 
         self._next_rowid = max(
@@ -2149,6 +2511,7 @@ class MainWindow(QMainWindow):
     def _start_additional(self, rowid):
         self.timers[rowid].start()
         self._set_bold(rowid, True)
+        self._ensure_ticking()
 
     def _stop_all(self):
         for rid, ts in self.timers.items():
@@ -2156,6 +2519,7 @@ class MainWindow(QMainWindow):
                 ts.stop()
                 self._set_bold(rid, False)
                 self._update_display(rid)
+                self._update_parent_group_time(rid)
 
     def _stop_one(self, rowid):
         ts = self.timers[rowid]
@@ -2163,6 +2527,9 @@ class MainWindow(QMainWindow):
             ts.stop()
             self._set_bold(rowid, False)
             self._update_display(rowid)
+            # The tick only refreshes groups with a running child, so the
+            # last second this one counted has to reach its group from here.
+            self._update_parent_group_time(rowid)
 
     def _reset_one(self, rowid):
         """Zero a single timer, after confirming. Shared by shift-X and the
@@ -2177,7 +2544,7 @@ class MainWindow(QMainWindow):
         self._try_snapshot(reason="reset_timer", priority="medium")
         self._undo.push(ResetTimes(
             f"the reset of '{name}'",
-            {rowid: self.timers[rowid].current_elapsed}))
+            {rowid: self.timers[rowid].current_elapsed()}))
         self.timers[rowid].stop()
         self.timers[rowid].reset()
         self._set_bold(rowid, False)
@@ -2195,7 +2562,7 @@ class MainWindow(QMainWindow):
         self._try_snapshot(reason="reset_all", priority="high")
         self._undo.push(ResetTimes(
             "the reset of all times",
-            {rid: ts.current_elapsed for rid, ts in self.timers.items()}))
+            {rid: ts.current_elapsed() for rid, ts in self.timers.items()}))
         self._stop_all()
         for ts in self.timers.values():
             ts.reset()
@@ -2218,17 +2585,21 @@ class MainWindow(QMainWindow):
         running_fg = t["row_running_fg"]
         color     = running_fg if bold else normal_fg
 
-        for key in ("name", "time"):
-            lbl = w[key]
-            f   = lbl.font()
-            f.setBold(bold)
-            lbl.setFont(f)
-            lbl.setStyleSheet(f"color: {color};")
+        # The blueprint's shared fonts, the same ones RowFactory builds with,
+        # rather than copying each label's font to flip one flag on it. Only
+        # ever setFont/setStyleSheet/setText from here: start and stop land
+        # on this, and none of it may cost a rebuild or a resize.
+        bp = self._blueprint
+        w["name"].setFont(bp.bold_label_font if bold else bp.label_font)
+        w["time"].setFont(bp.bold_time_font if bold else bp.time_font)
+        css = fg_css(color)
+        w["name"].setStyleSheet(css)
+        w["time"].setStyleSheet(css)
 
         b = w.get("bullet")
         if b is not None:
             b.setText("\u2022" if bold else "")
-            b.setStyleSheet(f"color: {color};")
+            b.setStyleSheet(fg_css(color))
 
         # `bold` IS the running state, and this runs on every start and stop,
         # so it is the one place the single button's label has to follow.
@@ -2246,7 +2617,7 @@ class MainWindow(QMainWindow):
 
         has_running = any(
             self.timers[cid].running
-            for cid in self._group_children(group_rowid)
+            for cid in self._children_view(group_rowid)
             if cid in self.timers
         )
 
@@ -2255,26 +2626,63 @@ class MainWindow(QMainWindow):
         running_fg = t["group_running_fg"]
         color      = running_fg if has_running else normal_fg
 
+        # Same fonts RowFactory.separator picks from — see _set_bold.
+        bp = self._blueprint
         w = self._widgets[group_rowid]
-        for key in ("name", "time"):
-            lbl = w[key]
-            f   = lbl.font()
-            f.setBold(has_running)
-            lbl.setFont(f)
-            lbl.setStyleSheet(f"color: {color};")
-
-    def _update_display(self, rowid):
+        w["name"].setFont(bp.bold_label_font if has_running else bp.label_font)
+        w["time"].setFont(bp.bold_time_font if has_running else bp.time_font)
+        css = fg_css(color)
+        w["name"].setStyleSheet(css)
+        w["time"].setStyleSheet(css)
+
+    def _visible_set(self):
+        """_visible_rowids as a set, rebuilt only when that list is replaced.
+
+        Every rebuild and reorder assigns a new list rather than editing the
+        old one, so its identity is the cache key.
+        """
+        cached = self._visible_cache
+        if cached is None or cached[0] is not self._visible_rowids:
+            cached = self._visible_cache = (self._visible_rowids,
+                                            frozenset(self._visible_rowids))
+        return cached[1]
+
+    def _refresh_running_rows(self):
+        """Catch up running rows the tick skipped while they were hidden."""
+        for rid, ts in self.timers.items():
+            if ts.running:
+                self._update_display(rid)
+
+    def _update_display(self, rowid, now=None):
         if rowid in self._widgets:
-            self._widgets[rowid]["time"].setText(
-                format_time(self.timers[rowid].current_elapsed)
-            )
+            ts = self.timers[rowid]
+            secs = ts.current_elapsed() if now is None else ts.elapsed_at(now)
+            self._show_seconds(rowid, self._widgets[rowid]["time"], int(secs))
+
+    def _show_seconds(self, rowid, lbl, secs):
+        """Put `secs` on a time label unless it already reads exactly that.
+
+        The tick lands on a 1 s period whose phase has nothing to do with
+        when each timer started, so about as often as not a running row's
+        whole-second value hasn't moved since the last one — and a group's
+        total or a stopped row never moves at all. Skipping those saves the
+        format and Qt's text handling for them.
+
+        Keyed on the label too: a rebuild can hand a row a new label that
+        happens to have been built with the same value.
+        """
+        shown = self._shown_secs.get(rowid)
+        if shown is not None and shown[0] is lbl and shown[1] == secs:
+            return
+        self._shown_secs[rowid] = (lbl, secs)
+        lbl.setText(format_time(secs))
 
     def _update_parent_group_time(self, rowid):
         """Refresh the parent separator's total after a child's time changed."""
         parent = self._parent_group(rowid)
         if parent is not None and parent in self._widgets:
-            self._widgets[parent]["time"].setText(
-                format_time(self._group_total_time(parent)))
+            self._show_seconds(parent, self._widgets[parent]["time"],
+                               self._group_total_time(parent))
 
     def _wire_row(self, row_container, widget_dict, rid):
         """Event filters, context menu, cursors and click targets for a row.
@@ -2290,18 +2698,18 @@ class MainWindow(QMainWindow):
             lambda pos, r=rid, w=row_container: self._on_row_context_menu(
                 r, w.mapToGlobal(pos))
         )
-        for child in row_container.findChildren(QPushButton):
+        buttons = widget_dict["_buttons"]
+        for child in buttons:
             child.setContextMenuPolicy(Qt.PreventContextMenu)
             # A button is a child, so entering it sends Leave to the
             # container. Track them too or the row un-tints the moment
             # the pointer crosses onto Start.
             child.installEventFilter(self)
-            self._row_children[child] = rid
-        for child in row_container.findChildren(QLabel):
+        for child in widget_dict["_labels"]:
             child.setAttribute(Qt.WA_TransparentForMouseEvents)
         if self._rearranging:
             row_container.setCursor(Qt.OpenHandCursor)
-            for child in row_container.findChildren(QPushButton):
+            for child in buttons:
                 child.setCursor(Qt.ArrowCursor)
         else:
             # These two labels undo the blanket transparent-for-mouse
@@ -2314,7 +2722,6 @@ class MainWindow(QMainWindow):
             if nlbl is not None:
                 nlbl.setAttribute(Qt.WA_TransparentForMouseEvents, False)
                 nlbl.installEventFilter(self)
-                self._name_labels[nlbl] = rid
 
             # Click the time to copy it.
             if not widget_dict.get("is_group"):
@@ -2323,6 +2730,24 @@ class MainWindow(QMainWindow):
                     tlbl.setAttribute(Qt.WA_TransparentForMouseEvents, False)
                     tlbl.installEventFilter(self)
                     tlbl.setCursor(Qt.PointingHandCursor)
+        self._register_row(row_container, widget_dict, rid)
+
+    def _register_row(self, row_container, widget_dict, rid):
+        """Enter a row's widgets into the widget -> rowid lookups.
+
+        Split from _wire_row because a row adopted across a rebuild is
+        already wired — only these maps, which every rebuild starts empty,
+        need filling again.
+        """
+        for child in widget_dict["_buttons"]:
+            self._row_children[child] = rid
+        if not self._rearranging:
+            nlbl = widget_dict.get("name")
+            if nlbl is not None:
+                self._name_labels[nlbl] = rid
+            if not widget_dict.get("is_group"):
+                tlbl = widget_dict.get("time")
+                if tlbl is not None:
                     self._time_labels[tlbl] = rid
 
     def _clear_row_hover(self):
@@ -2357,11 +2782,11 @@ class MainWindow(QMainWindow):
             w = self._widgets.get(rid)
             if not w:
                 continue
-            children = self._group_children(rid)
+            children = self._children_view(rid)
             if ss.show_group_count:
                 w["count"].setText(f"({len(children)})")
             if ss.show_group_time:
-                w["time"].setText(format_time(self._group_total_time(rid)))
+                self._show_seconds(rid, w["time"], self._group_total_time(rid))
             self._update_group_bold(rid)
 
     def _update_all_displays(self):
@@ -3064,55 +3489,114 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------ #
 
     def _tick(self):
-        any_running = False
-        for rid, ts in self.timers.items():
-            if ts.running:
-                any_running = True
-                self._update_display(rid)
+        # One clock reading for the whole tick: every row, group total and the
+        # status line below are figured as of the same instant, so a group's
+        # total always equals the rows beside it.
+        now = time.monotonic_ns()
+        running = [rid for rid, ts in self.timers.items() if ts.running]
+        any_running = bool(running)
+        # A running timer under a collapsed group still counts, but its label
+        # isn't on screen; whatever shows it again catches it up
+        # (_refresh_running_rows).
+        shown = self._visible_set()
+        for rid in running:
+            if rid in shown:
+                self._update_display(rid, now)
+
+        # Only groups with a running child can have moved. Every other total
+        # is fixed until an edit, and the edit paths refresh it themselves —
+        # the tick used to re-sum every group, reading every stopped child's
+        # time, to arrive at the numbers already on screen.
+        parent_of = self._row_index()[3]
+        for gid in {parent_of.get(rid) for rid in running}:
+            w = self._widgets.get(gid)
+            if w is None or not w.get("is_group"):
+                continue
+            if self._state.settings.show_group_time:
+                self._show_seconds(gid, w["time"],
+                                   self._group_total_time(gid, now))
+            if self._state.settings.show_group_count:
+                w["count"].setText(f"({len(self._children_view(gid))})")
+
+        # The tick only runs while something does, so manual edits (Set
+        # Time, +5/-5) refresh the status line themselves rather than waiting
+        # on this. setText early-returns when the string is unchanged.
+        self._update_status(now)
+
+        # No daily-reset check here: _reset_wake lands on the boundary
+        # itself, so asking 86,400 times a day whether it has passed yet
+        # bought nothing.
+
+        # Autosave 20 s after the last save, not every 20th tick. Starting,
+        # stopping or adjusting a timer already saved; counting ticks
+        # re-saved seconds later anyway, and after a stop/start the count
+        # carried on from wherever it was.
+        if now - self._last_save >= 20_000_000_000:
+            self._save_state()
 
-        if any_running:
-            for rid in self._visible_rowids:
-                if rid in self._widgets and self._widgets[rid].get("is_group"):
-                    w = self._widgets[rid]
-                    if self._state.settings.show_group_time:
-                        w["time"].setText(format_time(self._group_total_time(rid)))
-                    if self._state.settings.show_group_count:
-                        w["count"].setText(
-                            f"({len(self._group_children(rid))})")
-
-        # Unconditional: the total also moves on manual edits (Set Time,
-        # +5/-5). setText early-returns when the string is unchanged, so an
-        # idle app doesn't repaint here every second.
-        self._update_status()
+        self._try_snapshot(reason="tick", priority="low")
 
-        if self._state.settings.daily_reset_enabled:
-            self._check_daily_reset_boundary()
+        if not any_running:
+            # Nothing left to count. Every stop path has already saved, so
+            # this tick was the last one with anything to do.
+            self._timer.stop()
 
-        self._tick_n += 1
-        if self._tick_n % 20 == 0:
-            self._save_state()
+    def _ensure_ticking(self):
+        """Start the 1 s tick if any timer is running and it isn't already.
 
-        self._try_snapshot(reason="tick", priority="low")
+        _start_additional is the only way a timer starts, so that and
+        startup (a timer recovered running from state.json) are the only
+        callers. _tick turns itself off.
+        """
+        if (not self._timer.isActive()
+                and any(ts.running for ts in self.timers.values())):
+            self._timer.start(1000)
 
     # ------------------------------------------------------------------ #
     #  Persistence helpers                                                 #
     # ------------------------------------------------------------------ #
 
     def _save_state(self):
+        self._save_settle.stop()     # this save covers anything pending
+        self._last_save = time.monotonic_ns()
         return self._state.save(self.timers)
 
+    def _save_soon(self):
+        """Save once the current burst of clicks has stopped.
+
+        For the handlers people hit several times in a row — the +/-
+        buttons, group collapse. Each used to rewrite state.json on every
+        click: six clicks on +5 were six full serialise-and-replace cycles
+        for one result. Anything that saves for real in the meantime (a
+        snapshot, the tick's autosave, app exit) takes the pending save
+        with it.
+        """
+        self._save_settle.start()
+
     def _try_snapshot(self, reason, priority="low"):
-        now = time.monotonic()
-        min_secs = self._snapshot_idle_secs
-        if ((priority == "low" and now - self._last_snapshot_time > min_secs)
-                or (priority == "medium" and now - self._last_snapshot_time > self._snapshot_debounce)
-                or priority == "high"):
-            state = self._save_state()
-            created_snapshot_path = create_snapshot(state, reason, priority)
-            self._last_snapshot_time = now
-            prune_snapshots()
-            return created_snapshot_path
-        return None
+        now = time.monotonic_ns()
+        if priority == "low":
+            if now < self._idle_snapshot_due:
+                return None
+        elif priority == "medium":
+            if now < self._medium_snapshot_due:
+                return None
+        elif priority != "high":
+            return None
+        state = self._save_state()
+        self._idle_snapshot_due = now + self._snapshot_idle_ns
+        body = self._state.saved_body
+        if priority != "high" and body == self._snapshot_body:
+            return None
+        self._snapshot_body = body
+        self._medium_snapshot_due = now + self._snapshot_debounce_ns
+        if priority != "high":
+            # Written and pruned off this thread — see snapshot.py.
+            queue_snapshot(state, reason, priority)
+            return None
+        created_snapshot_path = create_snapshot(state, reason, priority)
+        prune_snapshots()
+        return created_snapshot_path
 
     # ------------------------------------------------------------------ #
     #  Daily reset                                                         #
@@ -3129,6 +3613,28 @@ class MainWindow(QMainWindow):
             return boundary_today
         return boundary_today - timedelta(days=1)
 
+    def _schedule_reset_wake(self):
+        """Aim the reset wakeup at the next daily-reset boundary.
+
+        Capped at 15 minutes rather than one shot for the whole wait: a
+        QTimer's countdown does not reliably include time the machine spent
+        asleep, so an eight-hour shot armed at night could land hours after
+        the boundary. Re-deriving from the wall clock every quarter hour
+        bounds that to one interval — ~100 wakeups a day instead of 86,400.
+        """
+        self._reset_wake.stop()
+        if not self._state.settings.daily_reset_enabled:
+            return
+        boundary = self._most_recent_reset_boundary() + timedelta(days=1)
+        wait = (boundary - datetime.now().astimezone()).total_seconds()
+        # +1s so the wakeup lands past the boundary, not a hair before it.
+        self._reset_wake.start(int((min(max(wait, 0), 15 * 60) + 1) * 1000))
+
+    def _on_reset_wake(self):
+        if self._state.settings.daily_reset_enabled:
+            self._check_daily_reset_boundary()
+        self._schedule_reset_wake()
+
     def _check_daily_reset_boundary(self):
         boundary = self._most_recent_reset_boundary()
         if self._state.session_start < boundary:
@@ -3159,6 +3665,9 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         try:
             self._try_snapshot(reason="app_exit", priority="high")
+            # Queued snapshots are written by a daemon thread, which dies
+            # with the process.
+            flush_snapshots()
         except Exception as e:
             QMessageBox.warning(self, "Save Error",
                                 f"Failed to save state:\n{e}")
@@ -3219,7 +3728,7 @@ def _raise_existing_window():
 def main():
     app = QApplication(sys.argv)
     # Before anything is built. Five copies all rewriting state.json every
-    # 20 ticks is last-writer-wins on the user's tracked time — which is
+    # 20 s is last-writer-wins on the user's tracked time — which is
     # exactly what happens when a slow machine tempts someone into clicking
     # the icon repeatedly.
     guard = _claim_single_instance()
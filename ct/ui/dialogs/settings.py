@@ -1,6 +1,5 @@
 """Configuration dialog for Client Timer — tabbed sidebar layout."""
 
-import json
 import re
 from datetime import datetime
 from pathlib import Path
@@ -31,7 +30,9 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from ct.common.setup import PATHS
+from ct.common.setup import PATHS, ensure_directory
+from ct.core.snapshot import peek_meta
+from ct.ui.row_factory import LABEL_ALIGN_FLAGS
 
 # ---------------------------------------------------------------------------
 # Tips
@@ -80,10 +81,24 @@ TIP_INTERVAL_MS = 9000
 TIP_PREFIX = "Tip: "
 from ct.ui.theme import THEMES, SIZES, FONTS, build_menu_stylesheet
 from ct.ui.widgets import TickCheckBox
-from ct.util import (format_time, format_copy_time,
+from ct.util import (format_time, format_copy_time, load_json,
                      COPY_FORMATS, DEFAULT_COPY_FORMAT)
 
 
+# The sample names the appearance preview sizes its name column to fit.
+_PREVIEW_NAMES = ("Acme Tickets", "Acme Calls", "Acme Corp")
+
+# Measured column widths for the appearance preview, keyed by (font family,
+# point size). The text being measured never changes, so the answer depends on
+# nothing else — and text shaping is the slow part of a QFontMetrics call on
+# Windows. These live at module level rather than on the dialog because a new
+# ConfigDialog is built every time Settings opens; kept here, reopening it and
+# flicking through the sizes measures nothing it has measured before. Bounded
+# by FONTS x the handful of point sizes in SIZES.
+_PREVIEW_NAME_W = {}
+_PREVIEW_TIME_W = {}
+
+
 class PreviewRow(QWidget):
     """A timer row in the session preview — click it to copy its time."""
 
@@ -191,6 +206,11 @@ class ReportProblemDialog(QDialog):
 
 class ConfigDialog(QDialog):
 
+    # Sidebar row / stack index of the History and Appearance pages, which
+    # are built on first visit — see _ensure_page.
+    _HISTORY_TAB = 2
+    _APPEARANCE_TAB = 3
+
     def __init__(self, parent, cfg, on_reset):
         super().__init__(parent)
         self.setWindowTitle("Settings")
@@ -217,8 +237,24 @@ class ConfigDialog(QDialog):
         self.restore_mode = "all"     # "all" | "times" | "rows"
         self.style_changed = False
 
-        # Kept for comparison in _apply — no changes means no rebuild.
+        # Kept for comparison in _apply — no changes means no rebuild. Also
+        # what the deferred pages are built from when they're first opened.
         self._initial_cfg = dict(cfg)
+        # Stack index -> builder, for the pages still waiting on a first
+        # visit. _ensure_page pops each one as it's built.
+        self._unbuilt_pages = {
+            self._HISTORY_TAB: self._build_daily_reset_page,
+            self._APPEARANCE_TAB: self._build_appearance_page,
+        }
+        self._preview_font_cache = {}
+        # (theme, separators) the preview's stylesheets were last built for.
+        self._preview_style_key = None
+        # Coalesces the preview refreshes the combos ask for — see
+        # _refresh_preview_soon.
+        self._preview_settle = QTimer(self)
+        self._preview_settle.setSingleShot(True)
+        self._preview_settle.setInterval(0)
+        self._preview_settle.timeout.connect(self._refresh_preview)
 
         # --- Layout ---
         outer = QHBoxLayout(self)
@@ -250,8 +286,13 @@ class ConfigDialog(QDialog):
         self._stack = QStackedWidget()
         self._stack.addWidget(self._build_about_page())
         self._stack.addWidget(self._build_general_page(cfg, on_reset))
-        self._stack.addWidget(self._build_daily_reset_page(cfg))
-        self._stack.addWidget(self._build_appearance_page(cfg))
+        # History and Appearance get placeholders until first visited. Most
+        # trips into Settings never open either. Appearance is the costliest
+        # page — eight combos plus a live preview of ~25 widgets, every one
+        # restyled and re-measured once up front — and History lists the
+        # sessions folder off disk into a table, behind a time editor.
+        self._stack.addWidget(QWidget())
+        self._stack.addWidget(QWidget())
         # Sync the stack to the pre-selected row. Without this the sidebar
         # highlights General while the stack still shows page 0.
         self._stack.setCurrentIndex(self._tab_list.currentRow())
@@ -316,6 +357,7 @@ class ConfigDialog(QDialog):
         self.move(x, y)
 
     def _on_tab_changed(self, index):
+        self._ensure_page(index)
         self._stack.setCurrentIndex(index)
         # Hide preview, backup browser, and clear selections when switching tabs.
         # Block table signals to prevent clearSelection from re-triggering
@@ -334,6 +376,17 @@ class ConfigDialog(QDialog):
         if hasattr(self, '_restore_btn'):
             self._restore_btn.setEnabled(False)
 
+    def _ensure_page(self, index):
+        """Swap the real page in for its placeholder, once. Pages that are
+        built up front, or already swapped in, are left alone."""
+        build = self._unbuilt_pages.pop(index, None)
+        if build is None:
+            return
+        placeholder = self._stack.widget(index)
+        self._stack.insertWidget(index, build(self._initial_cfg))
+        self._stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     def _on_daily_reset_toggle(self):
         enabled = self._daily_reset.currentText() == "On"
         # Enable/disable child controls
@@ -620,7 +673,7 @@ class ConfigDialog(QDialog):
         entries = []
         try:
             for path in PATHS.snapshots.iterdir():
-                m = _SNAP_RE.match(path.name)
+                m = _SNAP_RE.fullmatch(path.name)
                 if not m:
                     continue
                 try:
@@ -642,11 +695,8 @@ class ConfigDialog(QDialog):
             # Try to read session span from the JSON
             span_str = None
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                start = data.get("session", {}).get("start")
-                end = data.get("meta", {}).get("saved_at")
-                span_str = _format_span(start, end)
+                peek = peek_meta(path)
+                span_str = _format_span(peek["start"], peek["saved_at"])
             except Exception:
                 pass
             if not span_str:
@@ -711,7 +761,12 @@ class ConfigDialog(QDialog):
         label = " ".join(table.item(row, 0).text().split())
 
         menu = QMenu(self)
-        menu.setStyleSheet(build_menu_stylesheet(self._theme.currentText()))
+        # The dropdown's theme once Appearance has been opened; until then
+        # it can only still be the saved one.
+        theme = (self.chosen_theme
+                 if self._APPEARANCE_TAB in self._unbuilt_pages
+                 else self._theme.currentText())
+        menu.setStyleSheet(build_menu_stylesheet(theme))
         actions = {}
         # Copying is not destructive, so it gets its own section away from
         # the three that are.
@@ -743,8 +798,7 @@ class ConfigDialog(QDialog):
         """Clipboard copy of one saved entry, matching the main window's
         'copy the whole session' format."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json(path)
         except (OSError, ValueError):
             self._toast_main("Couldn't read that entry, nothing copied")
             return
@@ -807,8 +861,7 @@ class ConfigDialog(QDialog):
     def _show_state_preview(self, path, title="", is_session=False):
         """Load a state JSON file and display a read-only view in the preview panel."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json(path)
         except Exception:
             self._hide_preview()
             return
@@ -1046,7 +1099,7 @@ class ConfigDialog(QDialog):
         entries = []
         try:
             for path in PATHS.sessions.iterdir():
-                m = _SESSION_RE.match(path.name)
+                m = _SESSION_RE.fullmatch(path.name)
                 if not m:
                     continue
                 try:
@@ -1068,8 +1121,7 @@ class ConfigDialog(QDialog):
             # Try to read session span from the JSON
             span_str = None
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = load_json(path)
                 start = data.get("session", {}).get("start")
                 end = data.get("session", {}).get("end")
                 span_str = _format_span(start, end)
@@ -1187,7 +1239,7 @@ class ConfigDialog(QDialog):
         self._sessions_folder_btn.setFont(QFont("Calibri", 11))
         self._sessions_folder_btn.clicked.connect(
             lambda: QDesktopServices.openUrl(
-                QUrl.fromLocalFile(str(PATHS.sessions)))
+                QUrl.fromLocalFile(str(ensure_directory(PATHS.sessions))))
         )
         btn_row.addWidget(self._sessions_folder_btn)
         lay.addLayout(btn_row)
@@ -1319,7 +1371,7 @@ class ConfigDialog(QDialog):
         self._size.setCurrentText(cfg.get("size", "Regular"))
         self._size.setMinimumWidth(230)
         self._size.setToolTip(appearance_size_tooltip)
-        self._size.currentTextChanged.connect(self._refresh_preview)
+        self._size.currentTextChanged.connect(self._refresh_preview_soon)
         row.addWidget(lbl)
         row.addWidget(self._size)
         lay.addLayout(row)
@@ -1335,7 +1387,7 @@ class ConfigDialog(QDialog):
         self._theme.setCurrentText(cfg.get("theme", "E-Ink (Default)"))
         self._theme.setMinimumWidth(230)
         self._theme.setToolTip(appearance_theme_tooltip)
-        self._theme.currentTextChanged.connect(self._refresh_preview)
+        self._theme.currentTextChanged.connect(self._refresh_preview_soon)
         row.addWidget(lbl)
         row.addWidget(self._theme)
         lay.addLayout(row)
@@ -1355,7 +1407,7 @@ class ConfigDialog(QDialog):
             self._font.setCurrentIndex(idx)
         self._font.setMinimumWidth(230)
         self._font.setToolTip(appearance_font_tooltip)
-        self._font.currentIndexChanged.connect(self._refresh_preview)
+        self._font.currentIndexChanged.connect(self._refresh_preview_soon)
         row.addWidget(lbl)
         row.addWidget(self._font)
         lay.addLayout(row)
@@ -1371,7 +1423,7 @@ class ConfigDialog(QDialog):
         self._align.setCurrentText(cfg.get("label_align", "Left"))
         self._align.setMinimumWidth(230)
         self._align.setToolTip(appearance_label_alignment_tooltip)
-        self._align.currentTextChanged.connect(self._refresh_preview)
+        self._align.currentTextChanged.connect(self._refresh_preview_soon)
         row.addWidget(lbl)
         row.addWidget(self._align)
         lay.addLayout(row)
@@ -1388,7 +1440,7 @@ class ConfigDialog(QDialog):
             "Yes" if cfg.get("client_separators", True) else "No")
         self._sep.setMinimumWidth(230)
         self._sep.setToolTip(appearance_client_separators_tooltip)
-        self._sep.currentTextChanged.connect(self._refresh_preview)
+        self._sep.currentTextChanged.connect(self._refresh_preview_soon)
         row.addWidget(lbl)
         row.addWidget(self._sep)
         lay.addLayout(row)
@@ -1405,7 +1457,7 @@ class ConfigDialog(QDialog):
             "Yes" if cfg.get("show_group_count", True) else "No")
         self._grp_count.setMinimumWidth(230)
         self._grp_count.setToolTip(appearance_group_count_tooltip)
-        self._grp_count.currentTextChanged.connect(self._refresh_preview)
+        self._grp_count.currentTextChanged.connect(self._refresh_preview_soon)
         row.addWidget(lbl)
         row.addWidget(self._grp_count)
         lay.addLayout(row)
@@ -1422,7 +1474,7 @@ class ConfigDialog(QDialog):
             "Yes" if cfg.get("show_group_time", True) else "No")
         self._grp_time.setMinimumWidth(230)
         self._grp_time.setToolTip(appearance_group_time_tooltip)
-        self._grp_time.currentTextChanged.connect(self._refresh_preview)
+        self._grp_time.currentTextChanged.connect(self._refresh_preview_soon)
         row.addWidget(lbl)
         row.addWidget(self._grp_time)
         lay.addLayout(row)
@@ -1441,7 +1493,7 @@ class ConfigDialog(QDialog):
             "Yes" if cfg.get("show_adjust_buttons", True) else "No")
         self._adj_btns.setMinimumWidth(230)
         self._adj_btns.setToolTip(adj_tooltip)
-        self._adj_btns.currentTextChanged.connect(self._refresh_preview)
+        self._adj_btns.currentTextChanged.connect(self._refresh_preview_soon)
         row.addWidget(lbl)
         row.addWidget(self._adj_btns)
         lay.addLayout(row)
@@ -1470,6 +1522,8 @@ class ConfigDialog(QDialog):
         self._p_gtime.setAlignment(Qt.AlignCenter)
         self._p_gspacer = QLabel("")
         self._p_gx = QPushButton("X")
+        self._p_toggle.setObjectName("pSq")
+        self._p_gx.setObjectName("pSq")
         for w in (self._p_toggle, self._p_gname, self._p_gcount,
                   self._p_gtime, self._p_gspacer, self._p_gx):
             grp_lay.addWidget(w)
@@ -1493,6 +1547,7 @@ class ConfigDialog(QDialog):
         self._p1_minus = QPushButton("-5")
         self._p1_plus = QPushButton("+5")
         self._p1_x = QPushButton("X")
+        self._p1_x.setObjectName("pSq")
         for w in (self._p1_bullet, self._p1_name, self._p1_start,
                   self._p1_time, self._p1_minus,
                   self._p1_plus, self._p1_x):
@@ -1515,12 +1570,23 @@ class ConfigDialog(QDialog):
         self._p2_minus = QPushButton("-5")
         self._p2_plus = QPushButton("+5")
         self._p2_x = QPushButton("X")
+        self._p2_x.setObjectName("pSq")
         for w in (self._p2_bullet, self._p2_name, self._p2_start,
                   self._p2_time, self._p2_minus,
                   self._p2_plus, self._p2_x):
             t2_lay.addWidget(w)
         pv_lay.addWidget(self._p_t2_row)
 
+        # Built once, walked by every refresh.
+        self._p_adjust_btns = (self._p1_minus, self._p1_plus,
+                               self._p2_minus, self._p2_plus)
+        # The preview shows the app as it looks while locked, which is how it
+        # looks nearly all the time — so no X buttons. They're still built
+        # because the row sizing maths uses their column width. Nothing
+        # shows them again, so this is done here rather than every refresh.
+        for w in (self._p1_x, self._p2_x, self._p_gx):
+            w.setVisible(False)
+
         lay.addWidget(self._preview)
 
         self._refresh_preview()
@@ -1530,151 +1596,177 @@ class ConfigDialog(QDialog):
     #  Preview refresh                                                     #
     # ------------------------------------------------------------------ #
 
-    def _refresh_preview(self):
-        theme_name = self._theme.currentText()
-        if theme_name not in THEMES:
-            return
-        t = THEMES[theme_name]
-        s = SIZES[self._size.currentText()]
-        font_family = self._font.currentData()
-        ghbg = t["group_bg"]
+    def _preview_fonts(self, font_family, size_name):
+        """The preview's fonts and the widths measured from them.
+
+        Only the font and size combos change these; theme, alignment and
+        the show/hide options don't. Each refresh used to build about
+        twenty QFonts and three QFontMetrics — the font database lookups
+        being the slow part — so they're kept per (font, size) pair. That
+        is bounded by FONTS x SIZES, and goes with the dialog.
+        """
+        key = (font_family, size_name)
+        hit = self._preview_font_cache.get(key)
+        if hit is not None:
+            return hit
+        s = SIZES[size_name]
+        label_font = QFont(font_family, s["label"])
+        bold_label_font = QFont(label_font)
+        bold_label_font.setBold(True)
+        time_font = QFont(font_family, s["time"])
+        bold_time_font = QFont(time_font)
+        bold_time_font.setBold(True)
+        action_font = QFont(font_family, s["action"])
+
+        # Fixed widths for alignment across rows
+        name_key = (font_family, s["label"])
+        name_w = _PREVIEW_NAME_W.get(name_key)
+        if name_w is None:
+            bfm = QFontMetrics(bold_label_font)
+            name_w = _PREVIEW_NAME_W[name_key] = max(
+                bfm.horizontalAdvance(text) for text in _PREVIEW_NAMES) + 8
+        time_key = (font_family, s["time"])
+        time_w = _PREVIEW_TIME_W.get(time_key)
+        if time_w is None:
+            time_w = _PREVIEW_TIME_W[time_key] = QFontMetrics(
+                bold_time_font).horizontalAdvance("00:00:00 ")
+        # Square size for toggle/bullet/X
+        sq = QFontMetrics(action_font).height() + 10
+
+        hit = self._preview_font_cache[key] = (
+            label_font, bold_label_font, time_font, bold_time_font,
+            action_font, name_w, time_w, sq)
+        return hit
 
-        normal_fg = t["app_fg"]
-        running_fg = t["row_running_fg"]
-        ghfg = t["group_fg"]
-        ghfg_running = t["group_running_fg"]
+    def _refresh_preview_soon(self):
+        """Refresh the preview once control is back in the event loop.
+
+        What the combos connect to. A refresh restyles every preview widget,
+        and setting several combos from code fires a signal for each, every
+        one of which used to redo all of it. Every request before the timer
+        fires lands on the same single refresh.
+        """
+        self._preview_settle.start()
 
-        # Outer preview frame
+    def _style_preview(self, t, sep_on):
+        """Every stylesheet in the preview, for theme `t`.
+
+        Split out of _refresh_preview because these are the expensive part —
+        Qt reparses a stylesheet and repolishes beneath it on every
+        setStyleSheet — and they depend on nothing but the theme and the
+        separator option. _refresh_preview only calls this when one of those
+        two has changed. Four sheets cover the whole preview: the frame's,
+        which also styles the buttons, and one per row.
+        """
+        ghbg = t["group_bg"]
+        act_fg = t["control_hover_fg"]
+        line_c = t["control_line"]
+
+        # Outer preview frame, plus every button in it. The buttons share one
+        # rule scoped under #preview instead of a sheet each; the square ones
+        # (toggle and X, tagged pSq at build) only differ in padding.
         self._preview.setStyleSheet(
             f"#preview {{ background-color: {t['app_bg']};"
             f"  border: 2px solid gray; }}"
+            f"#preview QPushButton {{ color: {t['control_fg']};"
+            f"  background-color: {t['control_bg']};"
+            f"  border: {t['control_border_px']}px solid {line_c};"
+            f"  padding: 4px 8px; }}"
+            f"#preview QPushButton:hover, #preview QPushButton:pressed {{"
+            f"  color: {act_fg};"
+            f"  background-color: {t['control_hover_bg']}; }}"
+            f"#preview QPushButton#pSq {{ padding: 0px; }}"
         )
 
-        # Row backgrounds (with optional client separator line)
-        sep_on = self._sep.currentText() == "Yes"
+        # Row backgrounds (with optional client separator line), and each
+        # row's label colour as a descendant rule on that row's own sheet —
+        # three sheets where there used to be a sheet per label. The colour
+        # has to stay a stylesheet rule: the app-wide sheet sets QLabel's
+        # color, and a stylesheet rule beats setPalette every time.
+        # Group header labels show running (the preview's child is running);
+        # row 1 is the running sample, row 2 stopped.
         sep_css = (f"border-bottom: 1px solid {t['row_line']};"
                    if sep_on else "")
-        self._p_t1_row.layout().setContentsMargins(
-            0, 0, 0, s.get("line_gap", 0) if sep_on else 0)
         group_line = t["group_line"]
         self._p_grp_row.setStyleSheet(
             f"#pGrpRow {{ background-color: {ghbg};"
-            f"  border: 2px solid {group_line}; }}")
+            f"  border: 2px solid {group_line}; }}"
+            f"#pGrpRow QLabel {{ color: {t['group_running_fg']};"
+            f"  background: transparent; }}")
         self._p_t1_row.setStyleSheet(
             f"#pT1Row {{ background-color: {t['app_bg']};"
-            f"  margin-left: 12px; {sep_css} }}")
+            f"  margin-left: 12px; {sep_css} }}"
+            f"#pT1Row QLabel {{ color: {t['row_running_fg']};"
+            f"  background: transparent; }}")
         self._p_t2_row.setStyleSheet(
             f"#pT2Row {{ background-color: {t['app_bg']};"
-            f"  margin-left: 12px; }}")
+            f"  margin-left: 12px; }}"
+            f"#pT2Row QLabel {{ color: {t['app_fg']};"
+            f"  background: transparent; }}")
 
-        # Group header label colors (preview shows running children)
-        grp_lbl_running = (
-            f"color: {ghfg_running}; background: transparent;")
-        for lbl in (self._p_gname, self._p_gcount, self._p_gtime):
-            lbl.setStyleSheet(grp_lbl_running)
-
-        # Timer label colors
-        tmr_lbl = f"color: {t['app_fg']}; background: transparent;"
-        for lbl in (self._p1_bullet, self._p1_name, self._p1_time,
-                    self._p2_bullet, self._p2_name, self._p2_time):
-            lbl.setStyleSheet(tmr_lbl)
+    def _refresh_preview(self):
+        self._preview_settle.stop()     # this refresh covers anything pending
+        theme_name = self._theme.currentText()
+        if theme_name not in THEMES:
+            return
+        s = SIZES[self._size.currentText()]
+        font_family = self._font.currentData()
 
-        # Button styling
-        act_fg = t["control_hover_fg"]
-        line_c = t["control_line"]
-        btn_style = (
-            f"QPushButton {{ color: {t['control_fg']};"
-            f"  background-color: {t['control_bg']};"
-            f"  border: {t['control_border_px']}px solid {line_c};"
-            f"  padding: 4px 8px; }}"
-            f"QPushButton:hover, QPushButton:pressed {{"
-            f"  color: {act_fg};"
-            f"  background-color: {t['control_hover_bg']}; }}"
-        )
-        btn_sq = (
-            f"QPushButton {{ color: {t['control_fg']};"
-            f"  background-color: {t['control_bg']};"
-            f"  border: {t['control_border_px']}px solid {line_c};"
-            f"  padding: 0px; }}"
-            f"QPushButton:hover, QPushButton:pressed {{"
-            f"  color: {act_fg};"
-            f"  background-color: {t['control_hover_bg']}; }}"
-        )
-        for btn in (self._p1_start, self._p1_minus,
-                    self._p1_plus, self._p2_start,
-                    self._p2_minus, self._p2_plus):
-            btn.setStyleSheet(btn_style)
-        for btn in (self._p_toggle, self._p_gx, self._p1_x, self._p2_x):
-            btn.setStyleSheet(btn_sq)
-
-        # Compute fixed widths for alignment across rows
-        bold_label_font = QFont(font_family, s["label"])
-        bold_label_font.setBold(True)
-        bfm = QFontMetrics(bold_label_font)
-        name_w = max(bfm.horizontalAdvance("Acme Tickets"),
-                     bfm.horizontalAdvance("Acme Calls"),
-                     bfm.horizontalAdvance("Acme Corp")) + 8
-        bold_time_font = QFont(font_family, s["time"])
-        bold_time_font.setBold(True)
-        time_w = QFontMetrics(bold_time_font).horizontalAdvance("00:00:00 ")
+        sep_on = self._sep.currentText() == "Yes"
+        style_key = (theme_name, sep_on)
+        if style_key != self._preview_style_key:
+            self._style_preview(THEMES[theme_name], sep_on)
+            self._preview_style_key = style_key
+        self._p_t1_row.layout().setContentsMargins(
+            0, 0, 0, s.get("line_gap", 0) if sep_on else 0)
 
-        # Square size for toggle/bullet/X
-        fm_action = QFontMetrics(QFont(font_family, s["action"]))
-        sq = fm_action.height() + 10
+        (label_font, bold_label_font, time_font, bold_time_font,
+         action_font, name_w, time_w, sq) = self._preview_fonts(
+            font_family, self._size.currentText())
 
         # Group header fonts (bold — child is "running")
         self._p_gname.setFont(bold_label_font)
         self._p_gname.setFixedWidth(name_w)
-        self._p_gcount.setFont(QFont(font_family, s["action"]))
+        self._p_gcount.setFont(action_font)
         self._p_gtime.setFont(bold_time_font)
         self._p_gtime.setFixedWidth(time_w)
-        self._p_toggle.setFont(QFont(font_family, s["action"]))
+        self._p_toggle.setFont(action_font)
         self._p_toggle.setFixedSize(sq, sq)
-        self._p_gx.setFont(QFont(font_family, s["action"]))
+        self._p_gx.setFont(action_font)
         self._p_gx.setFixedSize(sq, sq)
 
         # Label alignment (group name always left, timers follow setting)
-        _ALIGN = {"Left": Qt.AlignLeft | Qt.AlignVCenter,
-                  "Center": Qt.AlignCenter,
-                  "Right": Qt.AlignRight | Qt.AlignVCenter}
-        tmr_align = _ALIGN.get(
+        tmr_align = LABEL_ALIGN_FLAGS.get(
             self._align.currentText(), Qt.AlignLeft | Qt.AlignVCenter)
 
-        # Timer row fonts
-        for (bullet, name, start, time_l, minus, plus, x,
-             is_running) in (
-                (self._p1_bullet, self._p1_name, self._p1_start,
-                 self._p1_time, self._p1_minus,
-                 self._p1_plus, self._p1_x, True),
-                (self._p2_bullet, self._p2_name, self._p2_start,
-                 self._p2_time, self._p2_minus,
-                 self._p2_plus, self._p2_x, False),
-        ):
-            bullet.setFont(QFont(font_family, s["action"]))
-            bullet.setFixedSize(sq, sq)
-
-            if is_running:
-                name.setFont(bold_label_font)
-                time_l.setFont(bold_time_font)
-                color = running_fg
-            else:
-                name.setFont(QFont(font_family, s["label"]))
-                time_l.setFont(QFont(font_family, s["time"]))
-                color = normal_fg
-
-            name.setFixedWidth(name_w)
-            name.setAlignment(tmr_align)
-            start.setFont(QFont(font_family, s["time"]))
-            time_l.setFixedWidth(time_w)
-            minus.setFont(QFont(font_family, s["action"]))
-            plus.setFont(QFont(font_family, s["action"]))
-            x.setFont(QFont(font_family, s["action"]))
-            x.setFixedSize(sq, sq)
-
-            for lbl in (bullet, name, time_l):
-                lbl.setStyleSheet(
-                    f"color: {color}; background: transparent;"
-                )
+        # Timer row fonts. Written out per row rather than looped: there are
+        # exactly two, and they differ only in which fonts are bold.
+        # Row 1 — running, so bold.
+        self._p1_bullet.setFont(action_font)
+        self._p1_bullet.setFixedSize(sq, sq)
+        self._p1_name.setFont(bold_label_font)
+        self._p1_name.setFixedWidth(name_w)
+        self._p1_name.setAlignment(tmr_align)
+        self._p1_start.setFont(time_font)
+        self._p1_time.setFont(bold_time_font)
+        self._p1_time.setFixedWidth(time_w)
+        self._p1_minus.setFont(action_font)
+        self._p1_plus.setFont(action_font)
+        self._p1_x.setFont(action_font)
+        self._p1_x.setFixedSize(sq, sq)
+        # Row 2 — stopped.
+        self._p2_bullet.setFont(action_font)
+        self._p2_bullet.setFixedSize(sq, sq)
+        self._p2_name.setFont(label_font)
+        self._p2_name.setFixedWidth(name_w)
+        self._p2_name.setAlignment(tmr_align)
+        self._p2_start.setFont(time_font)
+        self._p2_time.setFont(time_font)
+        self._p2_time.setFixedWidth(time_w)
+        self._p2_minus.setFont(action_font)
+        self._p2_plus.setFont(action_font)
+        self._p2_x.setFont(action_font)
+        self._p2_x.setFixedSize(sq, sq)
 
         # Preview count/time visibility
         self._p_gcount.setVisible(
@@ -1684,13 +1776,8 @@ class ConfigDialog(QDialog):
 
         # Adjust buttons
         show_adjust = self._adj_btns.currentText() == "Yes"
-        for w in (self._p1_minus, self._p1_plus, self._p2_minus, self._p2_plus):
+        for w in self._p_adjust_btns:
             w.setVisible(show_adjust)
-        # The preview shows the app as it looks while locked, which is how it
-        # looks nearly all the time — so no X buttons. They're still built
-        # above because the row sizing maths uses their column width.
-        for w in (self._p1_x, self._p2_x, self._p_gx):
-            w.setVisible(False)
 
     # ------------------------------------------------------------------ #
     #  Apply                                                               #
@@ -1707,22 +1794,26 @@ class ConfigDialog(QDialog):
         self.chosen_recover_running_time = (
             self._recover_running.currentText() == "Yes")
         self.chosen_copy_format = self._copy_fmt.currentText()
-        # Daily Reset
-        self.chosen_daily_reset_enabled = (
-            self._daily_reset.currentText() == "On")
-        t = self._daily_reset_time.time()
-        self.chosen_daily_reset_time = f"{t.hour():02d}:{t.minute():02d}"
-        # Appearance
-        self.chosen_theme = self._theme.currentText()
-        self.chosen_size = self._size.currentText()
-        self.chosen_font = self._font.currentData()
-        self.chosen_label_align = self._align.currentText()
-        self.chosen_client_separators = self._sep.currentText() == "Yes"
-        self.chosen_show_group_count = (
-            self._grp_count.currentText() == "Yes")
-        self.chosen_show_group_time = (
-            self._grp_time.currentText() == "Yes")
-        self.chosen_show_adjust_buttons = self._adj_btns.currentText() == "Yes"
+        # Daily Reset and Appearance — a page never opened means nothing
+        # changed there, and its chosen_* values are still the ones the
+        # dialog was given.
+        if self._HISTORY_TAB not in self._unbuilt_pages:
+            self.chosen_daily_reset_enabled = (
+                self._daily_reset.currentText() == "On")
+            t = self._daily_reset_time.time()
+            self.chosen_daily_reset_time = f"{t.hour():02d}:{t.minute():02d}"
+        if self._APPEARANCE_TAB not in self._unbuilt_pages:
+            self.chosen_theme = self._theme.currentText()
+            self.chosen_size = self._size.currentText()
+            self.chosen_font = self._font.currentData()
+            self.chosen_label_align = self._align.currentText()
+            self.chosen_client_separators = self._sep.currentText() == "Yes"
+            self.chosen_show_group_count = (
+                self._grp_count.currentText() == "Yes")
+            self.chosen_show_group_time = (
+                self._grp_time.currentText() == "Yes")
+            self.chosen_show_adjust_buttons = (
+                self._adj_btns.currentText() == "Yes")
         # Only flag a change if something actually differs from the values
         # the dialog opened with — otherwise Apply is a no-op for the caller.
         chosen = {
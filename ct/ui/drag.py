@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import TYPE_CHECKING
 from PySide6.QtCore import Qt, QEvent, QTimer
 from PySide6.QtGui import QColor, QFont, QFontMetrics
 from PySide6.QtWidgets import QApplication, QGraphicsDropShadowEffect
+from ct.ui.row_factory import group_row_css, timer_row_css
 
 if TYPE_CHECKING:
     from ct.ui.app import MainWindow
@@ -39,9 +41,27 @@ class DragController:
         self._autoscroll  = QTimer(host)
         self._autoscroll.setInterval(110)
         self._autoscroll.timeout.connect(self._on_autoscroll_tick)
-        self.group_rids   = None   # set of child rowids when dragging collapsed group
+        # Mouse moves arrive far faster than a reorder can be drawn, and each
+        # one used to run the hit test and, on a row change, a reorder. Now a
+        # move only records the cursor and arms this; it fires once per
+        # event-loop turn with whatever the latest position is by then, so
+        # a burst of moves costs one reorder. Coarse: it is a zero-interval
+        # shot, and has no business raising the system timer resolution.
+        self._move_timer  = QTimer(host)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(0)
+        self._move_timer.setTimerType(Qt.CoarseTimer)
+        self._move_timer.timeout.connect(self._apply_pending_move)
+        # All three are frozensets or None. They are tested per row on every
+        # reorder step (and by the host's rebuild), so membership must be a
+        # hash lookup — and they are snapshots, fixed for the life of a drag,
+        # so nothing gets to add to them halfway through.
+        self.group_rids   = None   # child rowids when dragging collapsed group
         self.hidden_rids  = None   # snapshot of hidden rids during separator drag
         self.visible_rids = None   # snapshot of visible rids at drag start
+        # (visible rowids list, row centre ys, visible indices) for
+        # _row_at_y — see there.
+        self._centers     = None
 
     @property
     def active(self):
@@ -152,10 +172,10 @@ class DragController:
         h = self.host
         self.dragging_rid = rowid
 
-        row = next(r for r in h._state.rows if r["rowid"] == rowid)
+        row = h._row(rowid)
         if row["type"] == "separator" and rowid in h._state.collapsed_groups:
             children        = h._group_children(rowid)
-            self.group_rids = set(children)
+            self.group_rids = frozenset(children)
         else:
             self.group_rids = None
 
@@ -164,7 +184,7 @@ class DragController:
         else:
             self.hidden_rids = None
 
-        self.visible_rids = set(h._visible_rowids)
+        self.visible_rids = frozenset(h._visible_rowids)
         # For undo. A reorder can't change any elapsed time, so keeping the
         # whole list is safe here in a way a full-state rollback is not.
         self._rows_before     = [dict(r) for r in h._state.rows]
@@ -187,6 +207,11 @@ class DragController:
     def end(self):
         """Finish drag-reordering and persist the new order."""
         h = self.host
+        # A move still waiting on its turn is where the cursor was let go, so
+        # the drop has to land there, not one coalesced step behind it.
+        if self._move_timer.isActive():
+            self._move_timer.stop()
+            self._apply_pending_move()
         drag_rid         = self.dragging_rid
         was_group_drag   = self.group_rids is not None
         visible_snapshot = self.visible_rids
@@ -198,6 +223,7 @@ class DragController:
         # actually happens.
         self._drop()
         self._last_pos    = None
+        self._centers     = None
         self.dragging_rid = None
         self.last_row     = -1
         self.group_rids   = None
@@ -211,7 +237,7 @@ class DragController:
             for row in h._state.rows:
                 if (row["type"] == "separator"
                         and row["rowid"] in h._state.collapsed_groups):
-                    for cid in h._group_children(row["rowid"]):
+                    for cid in h._children_view(row["rowid"]):
                         if cid in visible_snapshot:
                             h._state.collapsed_groups.discard(row["rowid"])
                             break
@@ -239,6 +265,9 @@ class DragController:
         # move a timer between groups. Refresh the headers or their counts
         # and totals stay stale until the next tick.
         h._refresh_group_headers()
+        # Children of a collapsed group dragged as a block were hidden for
+        # the drag, so the tick left their times alone.
+        h._refresh_running_rows()
         # Clear any stale hover tint. `hov` is a PROPERTY on the container,
         # and _on_row_hover refuses to touch it while a drag owns the strip —
         # so whichever row was hovered when the drag STARTED still carries
@@ -262,6 +291,13 @@ class DragController:
 
     def _on_mouse_move(self, event):
         self._last_pos = event.globalPosition().toPoint()
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _apply_pending_move(self):
+        """Act on the latest cursor position — see _move_timer."""
+        if not self.active or self._last_pos is None:
+            return
         self._update_autoscroll(self._last_pos)
         self._update_drag_position(self._last_pos)
 
@@ -326,58 +362,49 @@ class DragController:
 
         # Separator overshoot prevention
         if target_vis > self.last_row and self.hidden_rids is not None:
-            tgt_row = next(
-                (r for r in h._state.rows if r["rowid"] == target_rid), None)
+            tgt_row = h._row(target_rid)
             if tgt_row and tgt_row["type"] == "separator":
                 nxt = target_vis + 1
                 if nxt < len(h._visible_rowids):
                     nxt_rid = h._visible_rowids[nxt]
-                    nxt_row = next(
-                        (r for r in h._state.rows if r["rowid"] == nxt_rid), None)
+                    nxt_row = h._row(nxt_rid)
                     if nxt_row and nxt_row["type"] != "separator":
                         return  # wait
 
-        if self.group_rids is not None:
-            # Group drag
-            block = [r for r in h._state.rows
-                     if r["rowid"] == drag_rid
-                     or r["rowid"] in self.group_rids]
-            h._state.rows = [r for r in h._state.rows
-                             if r["rowid"] != drag_rid
-                             and r["rowid"] not in self.group_rids]
-            target_idx = next(
-                (i for i, r in enumerate(h._state.rows)
-                 if r["rowid"] == target_rid), len(h._state.rows))
-            if target_vis > self.last_row:
-                target_idx += 1
-                if (target_idx > 0
-                        and h._state.rows[target_idx - 1]["type"] == "separator"):
-                    while (target_idx < len(h._state.rows)
-                           and h._state.rows[target_idx]["type"] != "separator"):
-                        target_idx += 1
-            for j, br in enumerate(block):
-                h._state.rows.insert(target_idx + j, br)
-        else:
-            # Single row drag
-            drag_row = next(r for r in h._state.rows if r["rowid"] == drag_rid)
-            h._state.rows.remove(drag_row)
-            target_idx = next(
-                i for i, r in enumerate(h._state.rows)
-                if r["rowid"] == target_rid)
-            if target_vis > self.last_row:
-                insert_idx = target_idx + 1
-                if (self.hidden_rids is not None
-                        and h._state.rows[target_idx]["type"] == "separator"):
-                    while (insert_idx < len(h._state.rows)
-                           and h._state.rows[insert_idx]["type"] != "separator"):
-                        insert_idx += 1
-                h._state.rows.insert(insert_idx, drag_row)
+        # One pass lifts the moving rows out (the dragged row, plus its
+        # children for a collapsed group) and finds the target among the
+        # rest; the new order is then spliced together once. It used to be
+        # remove/insert per row plus a separate scan for the target — each
+        # of them O(rows), on every step of the drag.
+        moving = self.group_rids or ()
+        block, rest, target_idx = [], [], None
+        for r in h._state.rows:
+            rid = r["rowid"]
+            if rid == drag_rid or rid in moving:
+                block.append(r)
             else:
-                h._state.rows.insert(target_idx, drag_row)
+                if rid == target_rid:
+                    target_idx = len(rest)
+                rest.append(r)
+        if target_idx is None:
+            target_idx = len(rest)
+        if target_vis > self.last_row:
+            target_idx += 1
+            # A separator moving down past another group goes below all of
+            # it, not in among its timers. hidden_rids is set exactly when
+            # a separator is being dragged.
+            if (self.hidden_rids is not None
+                    and rest[target_idx - 1]["type"] == "separator"):
+                while (target_idx < len(rest)
+                       and rest[target_idx]["type"] != "separator"):
+                    target_idx += 1
+        h._state.rows[:] = rest[:target_idx] + block + rest[target_idx:]
+
+        # The list was reordered in place; the host's row index is stale.
+        h._rows_changed()
 
         # Pre-expand collapsed group that would swallow a single timer
-        drag_row_obj = next(
-            (r for r in h._state.rows if r["rowid"] == drag_rid), None)
+        drag_row_obj = h._row(drag_rid)
         if (drag_row_obj and drag_row_obj["type"] == "timer"
                 and self.group_rids is None):
             parent = h._parent_group(drag_rid)
@@ -437,9 +464,14 @@ class DragController:
 
         h._visible_rowids = new_visible_rids
 
-        bold_label = QFont(ss.font, s["label"])
-        bold_label.setBold(True)
-        indent_px        = QFontMetrics(bold_label).horizontalAdvance("  ")
+        # The last rebuild already measured this for the current font and
+        # size; a QFont + QFontMetrics per mouse move re-derived it each step.
+        if h._blueprint is not None:
+            indent_px = h._blueprint.indent_px
+        else:
+            bold_label = QFont(ss.font, s["label"])
+            bold_label.setBold(True)
+            indent_px  = QFontMetrics(bold_label).horizontalAdvance("  ")
         group_bg  = t["group_bg"]
 
         h._grid_widget.setUpdatesEnabled(False)
@@ -480,31 +512,21 @@ class DragController:
             border_css = (f"border-bottom: 1px solid {t['row_line']};"
                           if needs_sep else "")
 
-            # These rewrites replace the whole stylesheet, so the hover rule
-            # RowFactory baked in has to be re-appended — without it a row
-            # silently stops tinting on hover after the first drag.
-            # Group headers get their own hover colour: a bordered box reads
-            # very differently from an open row, so the tint that works for
-            # one is rarely the one that works for the other.
-            is_sep = (row["type"] == "separator")
-            hov_bg = t["group_hover_bg"] if is_sep else t["row_hover_bg"]
-            # A header's border is part of its fill as far as the eye is
-            # concerned, so the hover rule has to move it too — otherwise the
-            # box keeps its resting outline and the tint looks like it only
-            # half applied.
-            hov_line = (f" border-color: {t['group_hover_line']};"
-                        if is_sep else "")
-            hover_css = (f" #rowBg[hov=\"1\"] {{"
-                         f" background-color: {hov_bg};{hov_line} }}"
-                         f" #rowBg[nosep=\"1\"] {{ border-bottom: none; }}")
-            if is_sep:
+            # These rewrites replace the whole stylesheet, so they go through
+            # the same builders RowFactory uses — the hover rule has to come
+            # along, or a row silently stops tinting on hover after the first
+            # drag. Group headers get their own hover colour AND line: a
+            # bordered box reads very differently from an open row, and a
+            # header whose outline kept its resting colour would look like the
+            # tint only half applied.
+            if row["type"] == "separator":
                 group_line = (t["group_drag_line"]
                               if self.dragging_rid == rid else t["group_line"])
-                css = (f"#rowBg {{ background-color: {row_bg}; {margin_css}"
-                       f" border: 2px solid {group_line}; }}" + hover_css)
+                css = group_row_css(row_bg, group_line, t["group_hover_bg"],
+                                    t["group_hover_line"])
             else:
-                css = (f"#rowBg {{ background-color: {row_bg}; "
-                       f"{margin_css} {border_css} }}" + hover_css)
+                css = timer_row_css(row_bg, margin_css, border_css,
+                                    t["row_hover_bg"])
 
             # setStyleSheet ONLY when the string actually changed.
             #
@@ -521,6 +543,9 @@ class DragController:
             if h._widgets[rid].get("_css") != css:
                 container.setStyleSheet(css)
                 h._widgets[rid]["_css"] = css
+                # No longer what RowFactory built — a rebuild must not adopt
+                # it on the strength of its old signature.
+                h._widgets[rid].pop("_sig", None)
 
             container.show()
             h._grid.insertWidget(insert_idx, container)
@@ -539,21 +564,41 @@ class DragController:
         self._lift()
 
     def _row_at_y(self, y):
-        """Return the visible row index whose vertical center is closest to y."""
-        h         = self.host
-        best_row  = None
-        best_dist = float("inf")
-        for vis_idx, rid in enumerate(h._visible_rowids):
-            if rid in h._widgets and "container" in h._widgets[rid]:
-                rect = h._widgets[rid]["container"].geometry()
-                dist = abs(y - rect.center().y())
-                if dist < best_dist:
-                    best_dist = dist
-                    best_row  = vis_idx
-        return best_row
+        """Return the visible row index whose vertical center is closest to y.
+
+        Most mouse moves land on the row they were already over, and each
+        one used to read every visible container's geometry to find that out.
+        The centres are measured once per layout instead and searched with
+        bisect. Keyed on the _visible_rowids list itself: every reorder and
+        rebuild assigns a new one, and the geometry is grid-local, so
+        scrolling doesn't move it.
+        """
+        h = self.host
+        cache = self._centers
+        if cache is None or cache[0] is not h._visible_rowids:
+            points = []
+            for vis_idx, rid in enumerate(h._visible_rowids):
+                if rid in h._widgets and "container" in h._widgets[rid]:
+                    rect = h._widgets[rid]["container"].geometry()
+                    points.append((rect.center().y(), vis_idx))
+            points.sort()
+            cache = self._centers = (h._visible_rowids,
+                                     [p[0] for p in points],
+                                     [p[1] for p in points])
+        _, ys, rows = cache
+        if not ys:
+            return None
+        i = bisect_left(ys, y)
+        if i == len(ys):
+            return rows[-1]
+        # The neighbour above wins a tie, as the first-closest did in the
+        # old linear scan.
+        if i > 0 and y - ys[i - 1] <= ys[i] - y:
+            return rows[i - 1]
+        return rows[i]
 
     def _hidden_rids_snapshot(self):
-        """Return set of timer rowids currently hidden under collapsed groups."""
+        """Return frozenset of timer rowids hidden under collapsed groups."""
         h      = self.host
         hidden = set()
         parent = None
@@ -562,7 +607,7 @@ class DragController:
                 parent = row["rowid"]
             elif parent is not None and parent in h._state.collapsed_groups:
                 hidden.add(row["rowid"])
-        return hidden
+        return frozenset(hidden)
 
     def rid_for_container(self, widget):
         """Map a container widget back to its rowid."""
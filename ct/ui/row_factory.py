@@ -1,3 +1,4 @@
+from functools import lru_cache, partial
 from typing import Any, Literal
 from collections.abc import Callable
 from PySide6.QtCore import Qt
@@ -53,6 +54,41 @@ class FooterStack(QStackedWidget):
             hint.setWidth(page.minimumSizeHint().width())
         return hint
 
+# Row stylesheet text. A rebuild styles every row and a drag restyles them on
+# each step, but only a handful of distinct strings ever come out of these —
+# one per (colour, indent, separator) combination actually in use — so each
+# is built once and looked up after that. Shared with _reorder_visual, which
+# compares against the stored "_css" and must produce the identical string
+# for a row that hasn't changed. See RowFactory.timer for the selectors.
+@lru_cache(maxsize=256)
+def timer_row_css(row_bg, margin_css, border_css, hover_bg):
+    return (f"#rowBg {{ background-color: {row_bg}; {margin_css} {border_css} }}"
+            f" #rowBg[hov=\"1\"] {{"
+            f" background-color: {hover_bg}; }}"
+            f" #rowBg[nosep=\"1\"] {{ border-bottom: none; }}")
+
+# No nosep rule here: a group header's bottom edge is one side of its box,
+# not a client separator, and _update_bottom_line only touches rows whose
+# sheet mentions border-bottom. With the rule in, a header flush with the
+# viewport bottom lost the bottom of its outline.
+@lru_cache(maxsize=256)
+def group_row_css(row_bg, group_line, hover_bg, hover_line):
+    return (f"#rowBg {{ background-color: {row_bg}; "
+            f" border: 2px solid {group_line}; }}"
+            f" #rowBg[hov=\"1\"] {{"
+            f" background-color: {hover_bg};"
+            f" border-color: {hover_line}; }}")
+
+@lru_cache(maxsize=64)
+def fg_css(color):
+    return f"color: {color};"
+
+# Qt alignment for each label_align setting. Every timer row looks its own up
+# here, and so does the settings preview, which has to line up the same way.
+LABEL_ALIGN_FLAGS = {"Left": Qt.AlignLeft | Qt.AlignVCenter,
+                     "Center": Qt.AlignCenter,
+                     "Right": Qt.AlignRight | Qt.AlignVCenter}
+
 # Purely organizational class to group functions to build new rows (timers, separators, and the footer) in the main
 # view. Each builder returns a (container, widget_dict) tuple.  The container is a QWidget with objectName "rowBg"
 # that can be inserted into the grid. The widget_dict maps logical names to sub-widgets for later updates.
@@ -74,9 +110,6 @@ class RowFactory:
                             on_toggle: Callable[...,Any],
                             on_remove: Callable[...,Any]):
 
-        # Never indent separators
-        margin_css = ""
-
         # Calculate what the row_bg should be based on if its being dragged and/or if there's a user-set background color
         if is_dragging:
             # Group headers get their own drag colour for the same reason
@@ -99,12 +132,10 @@ class RowFactory:
         # Kept in a local and stored on the widget dict: _reorder_visual
         # skips setStyleSheet when the string is unchanged, and without a
         # seed here the first drag step would repay the full cost anyway.
-        sep_css = (
-            f"#rowBg {{ background-color: {row_bg}; {margin_css}"
-            f" border: 2px solid {group_line}; }}"
-            f" #rowBg[hov=\"1\"] {{"
-            f" background-color: {blueprint.theme['group_hover_bg']};"
-            f" border-color: {blueprint.theme['group_hover_line']}; }}")
+        # Separators are never indented.
+        sep_css = group_row_css(row_bg, group_line,
+                                blueprint.theme["group_hover_bg"],
+                                blueprint.theme["group_hover_line"])
         row_container.setStyleSheet(sep_css)
         row_container_layout = QHBoxLayout(row_container)
         # Per-size; was a flat 3 on all presets. Timer rows were already
@@ -118,19 +149,23 @@ class RowFactory:
         toggle_btn.setFont(blueprint.action_font)
         toggle_btn.setFixedSize(blueprint.col0_size)
         toggle_btn.setStyleSheet("padding: 0px;")
-        toggle_btn.clicked.connect(lambda _=False: on_toggle(rid))
+        # partial, not a lambda, for every per-row button: PySide trims the
+        # clicked(bool) argument off a partial the same as off a lambda, and
+        # it skips allocating a fresh closure per button per rebuild.
+        toggle_btn.clicked.connect(partial(on_toggle, rid))
         row_container_layout.addWidget(toggle_btn)
 
         # Col 1: name
         name_lbl = QLabel(row["name"])
         name_lbl.setTextFormat(Qt.PlainText)
-        grp_name_font = QFont(blueprint.font_family, blueprint.size["label"])
-        grp_name_font.setBold(has_running)
-        name_lbl.setFont(grp_name_font)
+        # Shared blueprint fonts rather than one built per row: setFont
+        # copies, so nothing here can alter the blueprint's instance.
+        name_lbl.setFont(blueprint.bold_label_font if has_running
+                         else blueprint.label_font)
         name_lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         name_lbl.setFixedWidth(blueprint.min_name_w)
         fg = blueprint.theme["group_running_fg"] if has_running else blueprint.theme["group_fg"]
-        name_lbl.setStyleSheet(f"color: {fg};")
+        name_lbl.setStyleSheet(fg_css(fg))
         row_container_layout.addWidget(name_lbl)
 
         # Col 2: child count
@@ -144,18 +179,16 @@ class RowFactory:
         count_lbl.setFont(blueprint.action_font)
         count_lbl.setAlignment(Qt.AlignCenter)
         count_lbl.setFixedWidth(blueprint.start_min_w)
-        count_lbl.setStyleSheet(f"color: {blueprint.theme['group_fg']};")
+        count_lbl.setStyleSheet(fg_css(blueprint.theme["group_fg"]))
         row_container_layout.addWidget(count_lbl)
 
         # Col 3: aggregate time
         time_lbl = QLabel(format_time(total_time))
-        grp_time_font = QFont(blueprint.font_family, blueprint.size["time"])
-        if has_running:
-            grp_time_font.setBold(True)
-        time_lbl.setFont(grp_time_font)
+        time_lbl.setFont(blueprint.bold_time_font if has_running
+                         else blueprint.time_font)
         time_lbl.setAlignment(Qt.AlignCenter)
         time_lbl.setFixedWidth(blueprint.min_time_w)
-        time_lbl.setStyleSheet(f"color: {fg};")
+        time_lbl.setStyleSheet(fg_css(fg))
         if not show_time:
             time_lbl.setText("")          # blank, not hidden — see col 2
         row_container_layout.addWidget(time_lbl)
@@ -177,7 +210,7 @@ class RowFactory:
         x_btn = QPushButton("X")
         x_btn.setFont(blueprint.action_font)
         x_btn.setFixedWidth(blueprint.col5_size.width())
-        x_btn.clicked.connect(lambda _=False: on_remove(rid))
+        x_btn.clicked.connect(partial(on_remove, rid))
         row_container_layout.addWidget(x_btn)
         x_btn.setVisible(show_x)
         # Slack goes AFTER the X, so the row reads as one block against the
@@ -196,6 +229,10 @@ class RowFactory:
             # Start/Stop button) because the two are unrelated controls.
             "group_toggle": toggle_btn,
             "bg_left": 0,          # separators are never indented
+            # Every button and label in the row, so the host can wire them
+            # without walking the widget tree with findChildren.
+            "_buttons": (toggle_btn, x_btn),
+            "_labels": (name_lbl, count_lbl, time_lbl),
         }
         return row_container, widget_dict
 
@@ -218,10 +255,6 @@ class RowFactory:
                         on_remove: Callable[...,Any],
                         force_line_gap: bool = False,
                         footer_line: bool = False):
-        _ALIGN = {"Left": Qt.AlignLeft | Qt.AlignVCenter,
-                  "Center": Qt.AlignCenter,
-                  "Right": Qt.AlignRight | Qt.AlignVCenter}
-
         # Calculate the foreground based on if the timer is running or not.
         fg = blueprint.theme["row_running_fg"] if state.running else blueprint.theme["app_fg"]
 
@@ -255,11 +288,8 @@ class RowFactory:
         # nosep: _update_bottom_line drops the separator on whichever row is
         # flush with the viewport bottom, so it doesn't stack with the footer
         # rule. A selector, not a stylesheet edit — see _update_bottom_line.
-        tmr_css = (
-            f"#rowBg {{ background-color: {row_bg}; {margin_css} {border_css} }}"
-            f" #rowBg[hov=\"1\"] {{"
-            f" background-color: {blueprint.theme['row_hover_bg']}; }}"
-            f" #rowBg[nosep=\"1\"] {{ border-bottom: none; }}")
+        tmr_css = timer_row_css(row_bg, margin_css, border_css,
+                                blueprint.theme["row_hover_bg"])
         rc.setStyleSheet(tmr_css)
         rc_lay = QHBoxLayout(rc)
         # Bottom margin only when a separator line is drawn there — the
@@ -284,16 +314,16 @@ class RowFactory:
         bullet.setFont(blueprint.action_font)
         bullet.setAlignment(Qt.AlignCenter)
         bullet.setFixedSize(blueprint.col0_size)
-        bullet.setStyleSheet(f"color: {fg};")
+        bullet.setStyleSheet(fg_css(fg))
         rc_lay.addWidget(bullet)
 
         # Col 1: name
         name_lbl = QLabel(row["name"])
         name_lbl.setTextFormat(Qt.PlainText)
-        name_lbl.setFont(QFont(blueprint.font_family, blueprint.size["label"]))
-        name_lbl.setAlignment(_ALIGN.get(label_align, Qt.AlignCenter))
+        name_lbl.setFont(blueprint.label_font)
+        name_lbl.setAlignment(LABEL_ALIGN_FLAGS.get(label_align, Qt.AlignCenter))
         name_lbl.setFixedWidth(blueprint.min_name_w)
-        name_lbl.setStyleSheet(f"color: {fg};")
+        name_lbl.setStyleSheet(fg_css(fg))
         rc_lay.addWidget(name_lbl)
 
         # Col 2: one button that starts a stopped timer and stops a running
@@ -307,27 +337,27 @@ class RowFactory:
         toggle_btn.setFont(blueprint.time_font)
         toggle_btn.setFixedWidth(blueprint.start_min_w)
         toggle_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        toggle_btn.clicked.connect(lambda _=False: on_toggle(rid))
+        toggle_btn.clicked.connect(partial(on_toggle, rid))
         rc_lay.addWidget(toggle_btn)
 
         # Col 3: time
-        time_lbl = QLabel(format_time(state.current_elapsed))
+        time_lbl = QLabel(format_time(state.current_elapsed()))
         time_lbl.setFont(blueprint.time_font)
         time_lbl.setAlignment(Qt.AlignCenter)
         time_lbl.setFixedWidth(blueprint.min_time_w)
-        time_lbl.setStyleSheet(f"color: {fg};")
+        time_lbl.setStyleSheet(fg_css(fg))
         rc_lay.addWidget(time_lbl)
 
         # Col 4: -5/+5
         minus_btn = QPushButton("-1" if shift_held else "-5")
         minus_btn.setFont(blueprint.action_font)
         minus_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        minus_btn.clicked.connect(lambda _=False: on_adjust(rid, -1))
+        minus_btn.clicked.connect(partial(on_adjust, rid, -1))
 
         plus_btn = QPushButton("+1" if shift_held else "+5")
         plus_btn.setFont(blueprint.action_font)
         plus_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        plus_btn.clicked.connect(lambda _=False: on_adjust(rid, 1))
+        plus_btn.clicked.connect(partial(on_adjust, rid, 1))
 
         adj_container = QWidget()
         adj_container.setObjectName("adjCt")
@@ -346,7 +376,7 @@ class RowFactory:
         x_btn = QPushButton("X")
         x_btn.setFont(blueprint.action_font)
         x_btn.setFixedWidth(blueprint.col5_size.width())
-        x_btn.clicked.connect(lambda _=False: on_remove(rid))
+        x_btn.clicked.connect(partial(on_remove, rid))
         rc_lay.addWidget(x_btn)
         # Removing a row is an edit, so it lives with the other edits — behind
         # the lock. A row full of X buttons is also the loudest possible signal
@@ -366,6 +396,9 @@ class RowFactory:
             # widget, so the container's geometry alone doesn't describe where
             # the row's colour actually starts. The hover strip needs to know.
             "bg_left": (blueprint.indent_px - 3) if is_child else 0,
+            # See the separator's widget dict.
+            "_buttons": (toggle_btn, minus_btn, plus_btn, x_btn),
+            "_labels": (bullet, name_lbl, time_lbl),
         }
         return rc, widget_dict
 
@@ -378,7 +411,7 @@ class RowFactory:
                      on_add_input_return: Callable[...,Any],
                      on_config: Callable[...,Any]):
         # Set font up
-        footer_font = QFont(blueprint.font_family, blueprint.size["action"])
+        footer_font = blueprint.action_font
         if blueprint.has_mdl2:
             lock_char = "\uE72E"
             unlock_char = "\uE785"
@@ -1,6 +1,13 @@
+from functools import lru_cache
+
 from .colors import THEMES
 
-# Stylesheet generator for main windows.
+# Themes are fixed dicts, so the sheet for a given name never changes. Cached
+# so that re-applying the same theme hands back the identical string — which
+# is what lets _apply_style notice "nothing changed" and skip Qt's reparse.
+# Size doesn't feed into the sheet at all (margins are set in code), so the
+# theme name alone is the key.
+@lru_cache(maxsize=None)
 def build_stylesheet(theme_name):
     """Build a Qt stylesheet string from a theme name."""
     t = THEMES.get(theme_name, THEMES["E-Ink (Default)"])
@@ -142,7 +149,8 @@ def build_stylesheet(theme_name):
         f"}}"
     )
 
-# Stylesheet generator for context menus.
+# Stylesheet generator for context menus. Cached for the same reason as above.
+@lru_cache(maxsize=None)
 def build_menu_stylesheet(theme_name):
     """Build a Qt stylesheet for context menus."""
     t = THEMES.get(theme_name, THEMES["E-Ink (Default)"])
@@ -1,10 +1,59 @@
 from dataclasses import dataclass
 from PySide6.QtCore import QSize
 from PySide6.QtGui import QFont, QFontMetrics
-from PySide6.QtWidgets import QPushButton
+from PySide6.QtWidgets import QApplication, QPushButton
 
-# A unified UI Blueprint dataclass to share across all UI builders.
-@dataclass
+# row name -> bold advance width in px, for the font key (font family, label
+# point size) in _NAME_ADVANCE_FONT. Every rebuild measures every row name to
+# size the name column, but names and fonts almost never change between two
+# rebuilds, and horizontalAdvance has to shape the text each time. A font or
+# size change clears it, since no old width can be hit again until the user
+# switches back; and renames only ever add entries, so past
+# _NAME_ADVANCE_MAX it is cleared too and refills from the current names.
+_NAME_ADVANCE: dict[str, int] = {}
+_NAME_ADVANCE_FONT = None
+_NAME_ADVANCE_MAX = 1024
+
+def _name_advance(fm_label, font_family, label_size, text):
+    global _NAME_ADVANCE_FONT
+    font_key = (font_family, label_size)
+    if font_key != _NAME_ADVANCE_FONT or len(_NAME_ADVANCE) >= _NAME_ADVANCE_MAX:
+        _NAME_ADVANCE.clear()
+        _NAME_ADVANCE_FONT = font_key
+    w = _NAME_ADVANCE.get(text)
+    if w is None:
+        w = _NAME_ADVANCE[text] = fm_label.horizontalAdvance(text)
+    return w
+
+# (font family, action point size, application stylesheet) -> (col0 height,
+# col5 height, one -5 button's width). These come from the sizeHint of real
+# throwaway QPushButtons, which costs a style polish each, three times per
+# rebuild. The stylesheet is part of the key because button padding comes
+# from the theme/size sheet — it is whatever the buttons would be polished
+# with, so a theme or size change misses without any explicit invalidation.
+_BUTTON_METRICS: dict[tuple, tuple[int, int, int]] = {}
+
+def _button_metrics(action_font, font_family, action_size):
+    app = QApplication.instance()
+    key = (font_family, action_size, app.styleSheet() if app else "")
+    metrics = _BUTTON_METRICS.get(key)
+    if metrics is None:
+        heights = []
+        for text in ("\u2261", "X"):
+            ref = QPushButton(text)
+            ref.setFont(action_font)
+            heights.append(ref.sizeHint().height())
+            ref.deleteLater()
+        ref_adj = QPushButton("-5")
+        ref_adj.setFont(action_font)
+        metrics = _BUTTON_METRICS[key] = (*heights, ref_adj.sizeHint().width())
+        ref_adj.deleteLater()
+    return metrics
+
+# A unified UI Blueprint dataclass to share across all UI builders. Slotted:
+# RowFactory reads dozens of these fields for every row it builds, and a slot
+# read skips the instance dict. Nothing adds fields to one after the fact.
+@dataclass(slots=True)
 class UIBlueprint:
     theme: dict          # resolved theme dict (THEMES[name])
     size: dict           # resolved size dict (SIZES[name])
@@ -20,8 +69,13 @@ class UIBlueprint:
     indent_px: int
     time_font: QFont
     action_font: QFont
+    label_font: QFont
     bold_label_font: QFont
     bold_time_font: QFont
+    # The two time fonts again, underlined: hovering a timer's time marks it
+    # as the click-to-copy target.
+    hover_time_font: QFont
+    hover_bold_time_font: QFont
     has_mdl2: bool
 
     # Builds the context from current settings.
@@ -35,19 +89,12 @@ class UIBlueprint:
         time_font = QFont(font_family, size["time"])
         action_font = QFont(font_family, size["action"])
 
-        # Get Column-0 reference size (square) by actually instantiating and measuring it briefly
-        _ref = QPushButton("\u2261")
-        _ref.setFont(action_font)
-        _h = _ref.sizeHint().height()
+        # Column-0 and Column-5 reference sizes (square), and the -5 button's
+        # width, measured off real buttons — see _button_metrics.
+        _h, _hx, _adj_btn_w = _button_metrics(action_font, font_family,
+                                               size["action"])
         col0_size = QSize(_h, _h)
-        _ref.deleteLater()
-
-        # Get Column-5 reference size (square) by actually instantiating and measuring it briefly
-        _ref_x = QPushButton("X")
-        _ref_x.setFont(action_font)
-        _hx = _ref_x.sizeHint().height()
         col5_size = QSize(_hx, _hx)
-        _ref_x.deleteLater()
 
         # The one button cycles through all three of these, so size it to
         # the widest or it would resize under the cursor every time a
@@ -60,7 +107,8 @@ class UIBlueprint:
                            for lbl in ("Start", "Stop", "Add"))
                        + size.get("btn_pad", 20))
 
-        bold_label = QFont(font_family, size["label"])
+        label_font = QFont(font_family, size["label"])
+        bold_label = QFont(label_font)
         bold_label.setBold(True)
         fm_label = QFontMetrics(bold_label)
         indent_px = fm_label.horizontalAdvance("  ")
@@ -68,21 +116,23 @@ class UIBlueprint:
         if rows:
             display_names = [r["name"] for r in rows]
             min_name_w = max(
-                fm_label.horizontalAdvance(dn) for dn in display_names
+                _name_advance(fm_label, font_family, size["label"], dn)
+                for dn in display_names
             ) + indent_px + size.get("name_pad", 4)
         else:
             min_name_w = 80
 
         # Width of the -5/+5 cluster. The group header reserves exactly this
         # much so its X lines up with the timer rows' when the buttons are on.
-        _ref_adj = QPushButton("-5")
-        _ref_adj.setFont(action_font)
-        adj_w = _ref_adj.sizeHint().width() * 2 + button_spacing
-        _ref_adj.deleteLater()
+        adj_w = _adj_btn_w * 2 + button_spacing
 
         bold_time = QFont(font_family, size["time"])
         bold_time.setBold(True)
         min_time_w = QFontMetrics(bold_time).horizontalAdvance("00:00:00 ")
+        hover_time = QFont(time_font)
+        hover_time.setUnderline(True)
+        hover_bold_time = QFont(bold_time)
+        hover_bold_time.setUnderline(True)
 
         return UIBlueprint(
             theme=theme, size=size, font_family=font_family,
@@ -91,6 +141,7 @@ class UIBlueprint:
             start_min_w=start_min_w, min_name_w=min_name_w,
             min_time_w=min_time_w, adj_w=adj_w, indent_px=indent_px,
             time_font=time_font, action_font=action_font,
-            bold_label_font=bold_label, bold_time_font=bold_time,
+            label_font=label_font, bold_label_font=bold_label, bold_time_font=bold_time,
+            hover_time_font=hover_time, hover_bold_time_font=hover_bold_time,
             has_mdl2=has_mdl2,
         )
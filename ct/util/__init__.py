@@ -1,5 +1,5 @@
-from .misc import (now_iso, format_time, format_copy_time,
-                   COPY_FORMATS, DEFAULT_COPY_FORMAT)
+from .misc import (now_iso, format_time, format_copy_time, dump_json,
+                   load_json, write_atomic, COPY_FORMATS, DEFAULT_COPY_FORMAT)
 
-__all__ = ["now_iso", "format_time", "format_copy_time",
-           "COPY_FORMATS", "DEFAULT_COPY_FORMAT"]
+__all__ = ["now_iso", "format_time", "format_copy_time", "dump_json",
+           "load_json", "write_atomic", "COPY_FORMATS", "DEFAULT_COPY_FORMAT"]
@@ -1,4 +1,12 @@
+import json
+import os
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Simply returns the current local time as an ISO8601 string with timezone offset.
@@ -8,7 +16,13 @@ def now_iso():
 # Given seconds as a number, this method returns a pretty HH:MM:SS formatted string. Negative values
 # get clamped to zero.
 def format_time(seconds : int | float):
-    seconds = max(0, int(seconds))
+    return _format_whole_seconds(max(0, int(seconds)))
+
+# Cached on the WHOLE second, after the floor — live elapsed values are floats
+# that never repeat, and keying on those would only fill the cache with misses.
+# Group totals and stopped rows ask for the same few values every tick.
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds : int):
     h, rem = divmod(seconds, 3600)
     m, s = divmod(rem, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
@@ -48,3 +62,76 @@ def format_copy_time(seconds : int | float, fmt : str = DEFAULT_COPY_FORMAT):
         return str(seconds // 60)
     h, rem = divmod(seconds, 3600)
     return f"{h:02d}:{rem // 60:02d}"
+
+
+# Serialises obj to UTF-8 JSON bytes, for the files the app writes itself —
+# state.json, snapshots and completed sessions. orjson does this several times
+# faster than the json module and is used when it's installed; without it the
+# stdlib is set up to produce the same text (UTF-8 rather than \u escapes,
+# compact separators unless indented), so files don't change shape depending
+# on which one wrote them. Either way the result reads back with json.load.
+def dump_json(obj, indent : bool = False, sort_keys : bool = False) -> bytes:
+    if orjson is not None:
+        option = ((orjson.OPT_INDENT_2 if indent else 0)
+                  | (orjson.OPT_SORT_KEYS if sort_keys else 0))
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None,
+                      separators=None if indent else (",", ":"),
+                      sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
+
+
+# Reads and parses a JSON file — the other half of dump_json, through orjson
+# when it's there. OSError for the file, ValueError for its contents either
+# way: orjson's JSONDecodeError subclasses json's, so handlers written for
+# the json module catch it unchanged.
+def load_json(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Writes data to path all-or-nothing: into a temp file beside it first, then
+# os.replace over the real name, so a crash mid-write leaves the previous file
+# (or none) instead of a truncated one that fails to load. The bytes go
+# straight to the fd with os.write — no buffered file object or text layer —
+# and os.write may take less than it's given, hence the loop. The folder is
+# created on demand — see ProjectPaths.build.
+#
+# The file's data is never fsynced: that's milliseconds per save, on a state
+# that's saved again within seconds anyway. With durable=True the FOLDER is
+# fsynced after the rename, so the new name itself survives a power cut —
+# that's for state.json and archived sessions, which have no other copy.
+# Snapshots are redundancy and skip it. Windows can't open a directory to
+# fsync it, so there it's a no-op.
+def write_atomic(path, data : bytes, durable=False):
+    tmp_path = f"{path}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o644)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(tmp_path), exist_ok=True)
+        fd = os.open(tmp_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+    if durable and hasattr(os, "O_DIRECTORY"):
+        _fsync_dir(os.path.dirname(os.fspath(path)) or ".")
+
+
+def _fsync_dir(folder):
+    try:
+        fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass            # some filesystems refuse it; the rename still landed
+    finally:
+        os.close(fd)
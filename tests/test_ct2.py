@@ -237,6 +237,12 @@ class TestTimerState(unittest.TestCase):
         self.assertIsNone(ts.started_at)
         self.assertIsNone(ts._mono)
 
+    def test_uses_slots(self):
+        ts = self._make()
+        self.assertFalse(hasattr(ts, "__dict__"))
+        with self.assertRaises(AttributeError):
+            ts.typo_field = 1
+
     def test_start_sets_running(self):
         ts = self._make()
         ts.start()
@@ -244,6 +250,15 @@ class TestTimerState(unittest.TestCase):
         self.assertIsNotNone(ts._mono)
         self.assertIsNotNone(ts.started_at)
 
+    def test_running_span_is_kept_in_integer_nanoseconds(self):
+        ts = self._make(elapsed=1.5)
+        ts.start()
+        self.assertIsInstance(ts._mono, int)
+        ts._mono -= 2_250_000_000
+        ts.stop()
+        self.assertIsInstance(ts.elapsed, float)
+        self.assertAlmostEqual(ts.elapsed, 3.75, delta=0.1)
+
     def test_start_is_idempotent(self):
         ts = self._make()
         ts.start()
@@ -272,12 +287,30 @@ class TestTimerState(unittest.TestCase):
         ts = self._make(elapsed=10.0)
         ts.start()
         time.sleep(0.05)
-        ce = ts.current_elapsed
+        ce = ts.current_elapsed()
         self.assertGreater(ce, 10.0)
 
     def test_current_elapsed_while_stopped(self):
         ts = self._make(elapsed=42.5)
-        self.assertAlmostEqual(ts.current_elapsed, 42.5)
+        self.assertAlmostEqual(ts.current_elapsed(), 42.5)
+
+    def test_total_elapsed_matches_per_timer_sum(self):
+        from ct.core.timer_state import total_elapsed
+        stopped = self._make(elapsed=10.0)
+        running = self._make(elapsed=5.0)
+        running.start()
+        running._mono -= 3_000_000_000
+        total = total_elapsed([stopped, running])
+        self.assertAlmostEqual(total, 18.0, delta=0.1)
+        self.assertEqual(total_elapsed([]), 0.0)
+        self.assertAlmostEqual(total_elapsed([stopped, running],
+                                             running._mono + 4_000_000_000), 19.0)
+
+    def test_elapsed_at_reads_the_given_clock(self):
+        ts = self._make(elapsed=5.0)
+        self.assertEqual(ts.elapsed_at(1e9), 5.0)
+        ts.start()
+        self.assertAlmostEqual(ts.elapsed_at(ts._mono + 2_500_000_000), 7.5)
 
     # --- Reset ---
 
@@ -300,6 +333,16 @@ class TestTimerState(unittest.TestCase):
         self.assertTrue(ts.running)  # still running
         self.assertGreater(ts.elapsed, 0.0)
 
+    def test_freeze_then_set_elapsed_keeps_counting_from_new_value(self):
+        # How Set Time overwrites a running timer.
+        ts = self._make(elapsed=500.0)
+        ts.start()
+        ts._mono -= 30_000_000_000
+        ts.freeze()
+        ts.elapsed = 60.0
+        self.assertTrue(ts.running)
+        self.assertAlmostEqual(ts.current_elapsed(), 60.0, delta=0.1)
+
     def test_freeze_when_stopped_is_noop(self):
         ts = self._make(elapsed=50.0)
         ts.freeze()
@@ -445,8 +488,27 @@ class TestSettings(unittest.TestCase):
     def test_settings_field_count_matches_defaults(self):
         from ct.core.config import _SETTINGS_DEFAULTS
         import dataclasses
-        fields = dataclasses.fields(self._cls())
-        self.assertEqual(len(fields), len(_SETTINGS_DEFAULTS))
+        fields = [f.name for f in dataclasses.fields(self._cls()) if f.init]
+        self.assertEqual(fields, list(_SETTINGS_DEFAULTS))
+
+    def test_coerced_keys_is_not_a_setting(self):
+        from ct.core.config import _SETTINGS_DEFAULTS
+        s = self._cls().from_dict({"size": 12})
+        self.assertEqual(s.coerced_keys, ["size"])
+        self.assertNotIn("coerced_keys", s.to_dict())
+        self.assertNotIn("coerced_keys", _SETTINGS_DEFAULTS)
+        self.assertEqual(s, self._cls()())
+
+    def test_coerced_keys_is_a_fresh_list_either_way(self):
+        fresh, other = self._cls()(), self._cls()()
+        self.assertEqual(fresh.coerced_keys, [])
+        self.assertIsInstance(fresh.coerced_keys, list)
+        self.assertIsNot(fresh.coerced_keys, other.coerced_keys)
+        self.assertIsInstance(self._cls().from_dict({}).coerced_keys, list)
+
+    def test_settings_are_slotted(self):
+        s = self._cls()()
+        self.assertFalse(hasattr(s, "__dict__"))
 
 
 # =========================================================================== #
@@ -485,6 +547,22 @@ class TestAppStateLoad(StatePathMixin, unittest.TestCase):
         self.assertEqual(app.tracked_times["0"]["elapsed"], 123.0)
         self.assertEqual(app.settings.theme, "E-Ink (Default)")
 
+    def test_load_interns_row_types(self):
+        import sys
+        path = self.tmp("state.json")
+        state = _minimal_state()
+        state["layout"]["rows"] = [
+            {"rowid": 0, "name": "G", "type": "separator", "bg": None},
+            {"rowid": 1, "name": "A", "type": "timer", "bg": None},
+            {"rowid": 2, "name": "B", "type": "timer", "bg": None},
+        ]
+        _write_state(path, state)
+
+        app = self._load(path)
+        self.assertIs(app.rows[0]["type"], sys.intern("separator"))
+        self.assertIs(app.rows[1]["type"], sys.intern("timer"))
+        self.assertIs(app.rows[2]["type"], app.rows[1]["type"])
+
     def test_load_preserves_collapsed_groups(self):
         path = self.tmp("state.json")
         state = _minimal_state()
@@ -505,6 +583,21 @@ class TestAppStateLoad(StatePathMixin, unittest.TestCase):
         self.assertEqual(app.session_start.year, 2025)
         self.assertEqual(app.session_start.month, 6)
 
+    def test_load_fills_only_missing_settings(self):
+        from ct.core.config import _SETTINGS_DEFAULTS
+        path = self.tmp("state.json")
+        state = _minimal_state()
+        state["settings"] = dict(_SETTINGS_DEFAULTS, theme="Mint")
+        del state["settings"]["copy_format"]
+        _write_state(path, state)
+        with patch("ct.core.config.log") as log:
+            app = self._load(path)
+        self.assertEqual(app.settings.theme, "Mint")
+        self.assertEqual(app.settings.copy_format, _SETTINGS_DEFAULTS["copy_format"])
+        warned = " ".join(str(c) for c in log.warning.call_args_list)
+        self.assertIn("settings.copy_format", warned)
+        self.assertNotIn("settings.theme", warned)
+
     # --- Corrupted / partial state files ---
 
     def test_load_invalid_json_explicit_path_raises(self):
@@ -528,6 +621,17 @@ class TestAppStateLoad(StatePathMixin, unittest.TestCase):
         self.assertEqual(app.settings.theme, "E-Ink (Default)")
         self.assertEqual(len(app.rows), 0)
 
+    def test_load_non_object_json(self):
+        # Valid JSON, wrong shape: the explicit path raises like any other
+        # unreadable file, and the default path falls back to fresh state.
+        from ct.core.config import AppState, _STATE_PATH
+        path = self.tmp("state.json")
+        _write_state(path, [1, 2])
+        with self.assertRaises(TypeError):
+            self._load(path)
+        _write_state(_STATE_PATH, [1, 2])
+        self.assertEqual(len(AppState.load().rows), 0)
+
     def test_load_empty_json_object_falls_back(self):
         path = self.tmp("state.json")
         _write_state(path, {})
@@ -573,6 +677,50 @@ class TestAppStateLoad(StatePathMixin, unittest.TestCase):
         self.assertIsNotNone(app.session_start)
         self.assertEqual(app.tracked_times, {})
 
+    def test_load_reports_a_missing_section_once(self):
+        from ct.common.logger import log
+        path = self.tmp("state.json")
+        state = _minimal_state()
+        del state["layout"]
+        state["meta"]["is_completed_session"] = "no"
+        _write_state(path, state)
+
+        with self.assertLogs(log, level="WARNING") as cm:
+            app = self._load(path)
+        self.assertEqual(app.rows, [])
+        self.assertEqual(app.window_height, 0)
+        reported = cm.output[0].split("defaulted: ")[1].split(", ")
+        self.assertIn("layout", reported)
+        self.assertIn("meta.is_completed_session", reported)
+        self.assertFalse([r for r in reported if r.startswith("layout.")])
+
+    def test_load_without_window_height_is_quiet(self):
+        # States from before window sizing have no height at all; that is
+        # normal, not damage, and gets 0 without a warning.
+        from ct.common.logger import log
+        from ct.core.config import _SETTINGS_DEFAULTS
+        path = self.tmp("state.json")
+        state = _minimal_state()
+        state["settings"] = dict(_SETTINGS_DEFAULTS)
+        self.assertNotIn("window_height", state["layout"])
+        _write_state(path, state)
+
+        with self.assertNoLogs(log, level="WARNING"):
+            app = self._load(path)
+        self.assertEqual(app.window_height, 0)
+
+    def test_load_reports_a_malformed_window_height(self):
+        from ct.common.logger import log
+        path = self.tmp("state.json")
+        state = _minimal_state()
+        state["layout"]["window_height"] = -40
+        _write_state(path, state)
+
+        with self.assertLogs(log, level="WARNING") as cm:
+            app = self._load(path)
+        self.assertEqual(app.window_height, 0)
+        self.assertIn("layout.window_height", cm.output[0])
+
     def test_load_partial_settings_fills_defaults(self):
         path = self.tmp("state.json")
         state = _minimal_state()
@@ -664,6 +812,20 @@ class TestAppStateSave(StatePathMixin, unittest.TestCase):
         gap = abs((datetime.now().astimezone() - running_since).total_seconds())
         self.assertLess(gap, 5.0, "running_since should be ~now (the save moment)")
 
+    def test_serialize_uses_one_stamp_per_save(self):
+        from ct.core.config import AppState, Settings
+        from ct.core.timer_state import TimerState
+
+        state = AppState(Settings(), [], set(), datetime.now().astimezone(), {})
+        a, b = TimerState("A"), TimerState("B")
+        a.start()
+        b.start()
+        result = state._serialize({0: a, 1: b})
+
+        tracked = result["session"]["tracked_times"]
+        self.assertEqual(tracked["0"]["running_since"], result["meta"]["saved_at"])
+        self.assertEqual(tracked["1"]["running_since"], result["meta"]["saved_at"])
+
     def test_serialize_preserves_rows(self):
         from ct.core.config import AppState, Settings
         rows = [{"rowid": 0, "name": "X", "type": "timer", "bg": None}]
@@ -734,6 +896,39 @@ class TestAppStateSave(StatePathMixin, unittest.TestCase):
         self.assertIn("1", loaded.tracked_times)
         self.assertIn("running_since", loaded.tracked_times["1"])
 
+    def test_unchanged_save_skips_the_write(self):
+        from ct.core.config import AppState, Settings
+        state = AppState(Settings(), [], set(), datetime.now().astimezone(), {})
+        state.save({})
+        with patch("ct.util.misc.os.replace") as replace:
+            result = state.save({})
+            replace.assert_not_called()
+            self.assertIn("saved_at", result["meta"])
+            state.rows.append({"rowid": 0, "name": "A", "type": "timer", "bg": None})
+            state.save({})
+            replace.assert_called_once()
+
+    def test_collapsed_groups_serialise_the_same_whatever_their_history(self):
+        from ct.core.config import AppState, Settings
+        state = AppState(Settings(), [], set(), datetime.now().astimezone(), {})
+        state.collapsed_groups.update((9, 1))
+        state.save({})
+        with patch("ct.util.misc.os.replace") as replace:
+            state.collapsed_groups.clear()
+            state.collapsed_groups.update((1, 9))
+            self.assertEqual(state.save({})["layout"]["collapsed_groups"], [1, 9])
+            replace.assert_not_called()
+
+    def test_save_rewrites_a_file_changed_behind_its_back(self):
+        from ct.core.config import AppState, Settings, _STATE_PATH
+        state = AppState(Settings(), [], set(), datetime.now().astimezone(), {})
+        state.save({})
+        _STATE_PATH.write_text("{}", encoding="utf-8")
+        os.utime(_STATE_PATH, ns=(0, 0))
+        state.save({})
+        with open(_STATE_PATH, "r", encoding="utf-8") as f:
+            self.assertIn("layout", json.load(f))
+
 
 # =========================================================================== #
 #  4. COMPLETED SESSIONS                                                        #
@@ -800,6 +995,8 @@ class SnapshotDirMixin(TempDirMixin):
 
     def tearDown(self):
         from ct.common.setup import PATHS
+        from ct.core.snapshot import flush_snapshots
+        flush_snapshots()     # nothing queued may land after the swap back
         PATHS.snapshots = self._real_snapshots
         super().tearDown()
 
@@ -858,6 +1055,71 @@ class TestSnapshot(SnapshotDirMixin, unittest.TestCase):
         # The original should not have snapshot_reason added
         self.assertNotIn("snapshot_reason", state["meta"])
 
+    def test_create_snapshot_leaves_no_temp_file(self):
+        from ct.core.snapshot import create_snapshot
+        path = create_snapshot(_minimal_state(), "test")
+        self._created_snapshots.append(path)
+        self.assertEqual([p.name for p in Path(path).parent.iterdir()],
+                         [Path(path).name])
+
+    def test_create_snapshot_creates_missing_folder(self):
+        from ct.common.setup import PATHS
+        from ct.core.snapshot import create_snapshot
+        shutil.rmtree(PATHS.snapshots)
+        path = create_snapshot(_minimal_state(), "test")
+        self._created_snapshots.append(path)
+        self.assertTrue(Path(path).exists())
+
+    def test_queued_snapshots_land_by_flush(self):
+        from ct.core.snapshot import queue_snapshot, flush_snapshots
+        from ct.common.setup import PATHS
+        for i in range(5):
+            queue_snapshot(_minimal_state(), f"test{i}")
+        self.assertTrue(flush_snapshots())
+        reasons = sorted(json.loads(p.read_text())["meta"]["snapshot_reason"]
+                         for p in PATHS.snapshots.glob("state_*.json"))
+        self.assertEqual(reasons, [f"test{i}" for i in range(5)])
+
+    def test_failed_write_keeps_previous_file(self):
+        from ct.util import write_atomic
+        path = Path(self._tmpdir) / "target.json"
+        write_atomic(path, b'{"ok":1}')
+        with patch("ct.util.misc.os.write", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_atomic(path, b'{"ok":2}')
+        self.assertEqual(path.read_bytes(), b'{"ok":1}')
+
+    def test_only_durable_writes_fsync(self):
+        from ct.util import write_atomic
+        path = Path(self._tmpdir) / "target.json"
+        with patch("ct.util.misc.os.fsync") as fsync:
+            write_atomic(path, b'{"ok":1}')
+            self.assertFalse(fsync.called)
+            write_atomic(path, b'{"ok":2}', durable=True)
+        self.assertEqual(fsync.called, hasattr(os, "O_DIRECTORY"))
+        self.assertEqual(path.read_bytes(), b'{"ok":2}')
+
+    def test_peek_meta_of_our_own_snapshot_reads_nothing(self):
+        from ct.core.snapshot import create_snapshot, peek_meta
+        state = _minimal_state()
+        path = create_snapshot(state, "test")
+        with patch("ct.core.snapshot.load_json", side_effect=AssertionError):
+            peek = peek_meta(path)
+        self.assertEqual(peek, {"start": state["session"]["start"],
+                                "saved_at": state["meta"]["saved_at"]})
+
+    def test_peek_meta_reads_a_foreign_file_once(self):
+        from ct.core.snapshot import peek_meta
+        from ct.util import load_json
+        path = self._snap(60)
+        with patch("ct.core.snapshot.load_json", side_effect=load_json) as spy:
+            first = peek_meta(path)
+            self.assertEqual(peek_meta(path), first)
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(first["saved_at"], load_json(path)["meta"]["saved_at"])
+        with self.assertRaises(ValueError):
+            peek_meta(self._snap(120, corrupt=True))
+
 
 class TestSnapshotParsing(unittest.TestCase):
     """Tests for _parse_snapshot_time."""
@@ -879,6 +1141,26 @@ class TestSnapshotParsing(unittest.TestCase):
         from ct.core.snapshot import _parse_snapshot_time
         self.assertIsNone(_parse_snapshot_time("state.json"))
 
+    def test_agrees_with_the_written_format(self):
+        from ct.core.snapshot import _parse_snapshot_time
+        for dt in (datetime(2026, 2, 12, 14, 3, 11, 123456),
+                   datetime(1999, 12, 31, 23, 59, 59, 999999),
+                   datetime(2024, 2, 29, 0, 0, 0, 0)):
+            name = f"state_{dt.strftime('%Y%m%d_%H%M%S_%f')}.json"
+            self.assertEqual(_parse_snapshot_time(name), dt)
+
+    def test_rejects_near_misses(self):
+        from ct.core.snapshot import _parse_snapshot_time
+        for name in ("state_20261301_000000_000000.json",   # month 13
+                     "state_20260230_000000_000000.json",   # Feb 30
+                     "state_2026011x_143022_123456.json",
+                     "state_20260115-143022_123456.json",
+                     "state_20260115_143022_123456.json.tmp",
+                     "state_２０２６0115_143022_123456.json",
+                     "other_20260115_143022_123456.json"):
+            with self.subTest(name=name):
+                self.assertIsNone(_parse_snapshot_time(name))
+
 
 class TestSnapshotPrune(SnapshotDirMixin, unittest.TestCase):
     """Tests for prune_snapshots()."""
@@ -887,6 +1169,21 @@ class TestSnapshotPrune(SnapshotDirMixin, unittest.TestCase):
         """Create count fake snapshot files with timestamps minutes apart."""
         return [self._snap(i * 120) for i in range(count)]
 
+    def test_unlink_each_reports_what_went(self):
+        from ct.core.snapshot import _unlink_each
+        from ct.common.setup import PATHS
+        for fd_ok in ({os.unlink} & os.supports_dir_fd, set()):
+            with self.subTest(dir_fd=bool(fd_ok)), \
+                    patch.object(os, "supports_dir_fd", fd_ok):
+                names = [self._snap(60 * i).name for i in range(1, 4)]
+                removed = _unlink_each(str(PATHS.snapshots), names + ["missing.json"])
+                self.assertEqual(removed, names)
+                self.assertEqual(list(PATHS.snapshots.iterdir()), [])
+
+    def test_tiers_ascend(self):
+        from ct.core.snapshot import TIERS
+        self.assertEqual(TIERS, sorted(set(TIERS)))
+
     def test_prune_keeps_newest(self):
         from ct.core.snapshot import prune_snapshots
         paths = self._create_fake_snapshots(20)
@@ -977,6 +1274,72 @@ class TestSnapshotPrune(SnapshotDirMixin, unittest.TestCase):
         self.assertLessEqual(len(self._alive(paths)),
                              RECENT_KEEP + len(TIERS) + 1)
 
+    def test_every_tier_keeps_its_closest_snapshot(self):
+        import random
+        from ct.core.snapshot import prune_snapshots, TIERS, _parse_snapshot_time
+        rng = random.Random(7)
+        paths = [self._snap(rng.uniform(0, 5 * 86400)) for _ in range(80)]
+        now = datetime.now().timestamp()
+        stamps = {p: _parse_snapshot_time(p.name).timestamp() for p in paths}
+        expected = {min(paths, key=lambda p: abs(stamps[p] - (now - tier)))
+                    for tier in TIERS}
+        prune_snapshots()
+        self.assertEqual([p for p in expected if not p.exists()], [])
+
+    def test_prune_reuses_the_listing_across_its_own_writes(self):
+        """A create + prune cycle must not re-list the whole folder."""
+        from ct.core.snapshot import create_snapshot, prune_snapshots
+        for i in range(30):
+            self._snap(i * 60)
+        prune_snapshots()
+        with patch("ct.core.snapshot.os.scandir",
+                   side_effect=AssertionError("re-listed")):
+            path = create_snapshot(_minimal_state(), "test")
+            prune_snapshots()
+        self.assertTrue(path.exists())
+
+    def test_remembered_stamp_matches_a_fresh_listing(self):
+        from ct.core import snapshot
+        snapshot.prune_snapshots()
+        path = snapshot.create_snapshot(_minimal_state(), "test")
+        remembered = dict(snapshot._LISTING["entries"])
+        snapshot._LISTING["mtime"] = None
+        self.assertEqual(snapshot._snapshot_entries(), remembered)
+        self.assertIn(path.name, remembered)
+
+    def test_listing_stays_oldest_first(self):
+        from ct.core import snapshot
+        for secs in (300, 0, 600, 60):
+            self._snap(secs)
+        snapshot.prune_snapshots()
+        # Even a snapshot stamped before the newest (the clock went back).
+        late = self._snap(120)
+        snapshot._remember(late, snapshot._parse_snapshot_time(late.name).timestamp(),
+                           snapshot._LISTING["mtime"])
+        stamps = list(snapshot._LISTING["entries"].values())
+        self.assertEqual(len(stamps), 5)
+        self.assertEqual(stamps, sorted(stamps))
+
+    def test_prune_sees_files_it_did_not_write(self):
+        from ct.core.snapshot import prune_snapshots, RECENT_KEEP
+        self._snap(0)
+        self._snap(60)
+        prune_snapshots()
+        outside = [self._snap(120 + i * 5) for i in range(RECENT_KEEP * 2)]
+        prune_snapshots()
+        self.assertLess(len(self._alive(outside)), len(outside),
+                        "prune never noticed files added behind its back")
+
+    def test_own_write_does_not_hide_a_file_added_behind_its_back(self):
+        from ct.core import snapshot
+        self._snap(60)
+        snapshot.prune_snapshots()
+        foreign = self._snap(30)
+        path = snapshot.create_snapshot(_minimal_state(), "test")
+        entries = snapshot._snapshot_entries()
+        self.assertIn(foreign.name, entries)
+        self.assertIn(path.name, entries)
+
     def test_prune_leaves_unrelated_files_alone(self):
         from ct.common.setup import PATHS
         from ct.core.snapshot import prune_snapshots
@@ -1059,7 +1422,7 @@ class TestUndoDeleteRow(UndoTestBase):
         del self.timers[11]
         cmd.undo(self.state, self.timers)
         self.assertEqual(self.order(), [10, 11, 12])
-        self.assertEqual(self.timers[11].current_elapsed, 3600)
+        self.assertEqual(self.timers[11].current_elapsed(), 3600)
         self.assertFalse(self.timers[11].running)
 
     def test_restored_row_is_a_copy(self):
@@ -1093,7 +1456,7 @@ class TestUndoResetTimes(UndoTestBase):
 
     def _reset(self, rids):
         from ct.core.undo import ResetTimes
-        cmd = ResetTimes("x", {r: self.timers[r].current_elapsed
+        cmd = ResetTimes("x", {r: self.timers[r].current_elapsed()
                                for r in rids})
         for r in rids:
             self.timers[r].reset()
@@ -1103,8 +1466,8 @@ class TestUndoResetTimes(UndoTestBase):
         cmd = self._reset([11, 12])
         self.assertEqual(cmd.conflicts(self.timers), [])
         cmd.undo(self.state, self.timers)
-        self.assertEqual(self.timers[11].current_elapsed, 3600)
-        self.assertEqual(self.timers[12].current_elapsed, 1800)
+        self.assertEqual(self.timers[11].current_elapsed(), 3600)
+        self.assertEqual(self.timers[12].current_elapsed(), 1800)
 
     def test_accrual_is_reported_as_a_conflict(self):
         cmd = self._reset([11, 12])
@@ -1117,13 +1480,13 @@ class TestUndoResetTimes(UndoTestBase):
         cmd = self._reset([11])
         self.timers[11].elapsed = 300
         cmd.undo(self.state, self.timers, mode="revert")
-        self.assertEqual(self.timers[11].current_elapsed, 3600)
+        self.assertEqual(self.timers[11].current_elapsed(), 3600)
 
     def test_add_keeps_time_accrued_since(self):
         cmd = self._reset([11])
         self.timers[11].elapsed = 300
         cmd.undo(self.state, self.timers, mode="add")
-        self.assertEqual(self.timers[11].current_elapsed, 3900)
+        self.assertEqual(self.timers[11].current_elapsed(), 3900)
 
     def test_a_running_timer_is_not_double_counted(self):
         """Writing elapsed while running would add the live segment twice."""
@@ -1133,7 +1496,7 @@ class TestUndoResetTimes(UndoTestBase):
         cmd.undo(self.state, self.timers, mode="add")
         self.assertTrue(self.timers[11].running)
         # 3600 restored + 300 accrued, plus at most a hair of live time.
-        self.assertAlmostEqual(self.timers[11].current_elapsed, 3900, delta=2)
+        self.assertAlmostEqual(self.timers[11].current_elapsed(), 3900, delta=2)
 
     def test_a_running_timer_stays_running(self):
         cmd = self._reset([11])
@@ -1145,7 +1508,7 @@ class TestUndoResetTimes(UndoTestBase):
         cmd = self._reset([11, 12])
         del self.timers[11]
         cmd.undo(self.state, self.timers)      # must not raise
-        self.assertEqual(self.timers[12].current_elapsed, 1800)
+        self.assertEqual(self.timers[12].current_elapsed(), 1800)
 
     def test_conflicts_ignores_a_deleted_timer(self):
         cmd = self._reset([11])
@@ -1167,7 +1530,7 @@ class TestUndoReorderAndRename(UndoTestBase):
         cmd = ReorderRows("x", [dict(r) for r in self.state.rows], set())
         self.timers[11].elapsed = 9999
         cmd.undo(self.state, self.timers)
-        self.assertEqual(self.timers[11].current_elapsed, 9999)
+        self.assertEqual(self.timers[11].current_elapsed(), 9999)
 
     def test_reorder_restores_collapsed_groups(self):
         from ct.core.undo import ReorderRows
@@ -1270,7 +1633,8 @@ class QtWindowTestBase(StatePathMixin, SnapshotDirMixin, unittest.TestCase):
         # Kill anything still pending before the state path is put back: a
         # settle timer that fires afterwards saves to the user's REAL
         # state.json, which the module-level detector then has to undo.
-        for timer in ("_resize_settle", "_toast_timer", "_timer", "_hover_poll"):
+        for timer in ("_resize_settle", "_toast_timer", "_timer", "_hover_poll",
+                      "_reset_wake", "_save_settle"):
             t = getattr(self.win, timer, None)
             if t is not None:
                 t.stop()
@@ -1766,6 +2130,31 @@ class TestQtLayoutInvariants(QtWindowTestBase):
                       "hid a separator on the wrong row — the visible symptom "
                       "is a missing line between two rows mid-list")
 
+    def test_a_bottom_flush_collapsed_group_keeps_its_border(self):
+        from ct.core.timer_state import TimerState
+        rows = [{"rowid": 300 + i, "name": f"Row {i}", "type": "timer",
+                 "bg": None} for i in range(3)]
+        rows += [{"rowid": 400, "name": "Group", "type": "separator",
+                  "bg": None},
+                 {"rowid": 401, "name": "Inside", "type": "timer", "bg": None}]
+        self.win._state.rows = rows
+        self.win._state.collapsed_groups = {400}
+        self.win.timers = {r["rowid"]: TimerState(r["name"]) for r in rows
+                           if r["type"] == "timer"}
+        self.win._state.settings.client_separators = True
+        self.rebuild()
+        self.win._shrink_to_fit()
+        self.settle()
+        header = self.win._widgets[400]["container"]
+        sa = self.win._scroll_area
+        vp_bottom = sa.verticalScrollBar().value() + sa.viewport().height()
+        self.assertLessEqual(vp_bottom - (header.y() + header.height()),
+                             max(self.win._grid.spacing(), 2),
+                             "the group header isn't the bottom-flush row")
+        self.win._update_bottom_line()
+        self.assertNotEqual(header.property("nosep"), "1")
+        self.assertIsNot(self.win._hidden_line, header)
+
     def test_hidden_separator_survives_a_stylesheet_rewrite(self):
         """The old version stored the exact string it had replaced and only
         restored on an exact match, so any rewrite in between (a drag
@@ -1798,6 +2187,186 @@ class TestQtLayoutInvariants(QtWindowTestBase):
         self.win._on_rearrange_toggle()
         self.settle()
 
+    def test_rebuild_adopts_unchanged_rows(self):
+        """A rebuild keeps rows whose inputs did not change, and only those."""
+        before = {rid: w["container"] for rid, w in self.win._widgets.items()}
+        self.win._state.rows[2]["bg"] = "#123456"      # Bravo
+        self.rebuild()
+        after = {rid: w["container"] for rid, w in self.win._widgets.items()}
+        self.assertIsNot(after[12], before[12], "a recoloured row was reused")
+        for rid in (10, 11, 13):
+            self.assertIs(after[rid], before[rid], f"row {rid} was rebuilt")
+        # Every adopted row is still wired for hover and rename.
+        self.assertEqual(sorted(self.win._name_labels.values()),
+                         [10, 11, 12, 13])
+
+    def test_rebuild_keeps_the_content_tree_when_it_can(self):
+        """Adopted rows stay in the same grid; only the order is redone."""
+        content = self.win._content_widget
+        old_bravo = self.win._widgets[12]["container"]
+        self.win._state.rows[2]["bg"] = "#123456"      # Bravo
+        self.win._state.rows.reverse()
+        self.rebuild()
+        self.assertIs(self.win._content_widget, content)
+        order = [self.win._grid.itemAt(i).widget()
+                 for i in range(self.win._grid.count())]
+        self.assertEqual(order, [self.win._widgets[rid]["container"]
+                                 for rid in (13, 12, 11, 10)])
+        self.assertTrue(all(rc.isVisible() for rc in order))
+        self.assertNotIn(old_bravo, order)
+        # No rows means no footer rule, so the tree goes.
+        self.win._state.rows = []
+        self.rebuild()
+        self.assertIsNot(self.win._content_widget, content)
+
+    def test_rebuild_does_not_adopt_a_restyled_row(self):
+        """A drag rewrites row stylesheets in place; those rows are rebuilt."""
+        before = self.win._widgets[11]["container"]
+        self.win._drag.start(11)
+        self.win._drag.end()
+        self.settle()
+        self.rebuild()
+        self.assertIsNot(self.win._widgets[11]["container"], before)
+
+    def test_reorder_visual_matches_factory_css(self):
+        """A resting reorder restyles nothing: both paths build one string."""
+        self.win._drag._reorder_visual()
+        for rid, w in self.win._widgets.items():
+            self.assertIn("_sig", w, f"row {rid} was restyled for no change")
+
+    def test_apply_style_skips_unchanged_sheet(self):
+        """Re-applying the same theme must not make Qt reparse the sheet."""
+        calls = []
+        real = self.win.setStyleSheet
+        self.win.setStyleSheet = lambda css: (calls.append(css), real(css))
+        self.win._apply_style()
+        self.assertEqual(calls, [])
+        self.win._state.settings.theme = "Galaxy Dark"
+        self.win._apply_style()
+        self.assertEqual(len(calls), 1)
+
+    def test_row_buttons_call_through_with_their_rowid(self):
+        """Row buttons are wired with functools.partial; clicked(bool) must
+        not leak in as an extra argument."""
+        w = self.win._widgets[11]
+        w["plus"].click()
+        self.assertEqual(self.win.timers[11].current_elapsed(), 300)
+        w["minus"].click()
+        self.assertEqual(self.win.timers[11].current_elapsed(), 0)
+        w["toggle"].click()
+        self.assertTrue(self.win.timers[11].running)
+        self.win._widgets[10]["group_toggle"].click()
+        self.assertIn(10, self.win._state.collapsed_groups)
+
+    def test_blueprint_reuses_its_button_measurements(self):
+        from ct.ui import ui_blueprint
+        with patch.object(ui_blueprint, "QPushButton",
+                          side_effect=AssertionError("measured again")):
+            self.win._rebuild_rows()
+        ui_blueprint._BUTTON_METRICS.clear()
+        self.win._rebuild_rows()
+        self.assertEqual(len(ui_blueprint._BUTTON_METRICS), 1)
+
+    def test_name_widths_stay_bounded(self):
+        from PySide6.QtGui import QFont, QFontMetrics
+        from ct.ui import ui_blueprint
+        fm = QFontMetrics(QFont("Calibri", 10))
+        ui_blueprint._name_advance(fm, "Calibri", 10, "Alpha")
+        ui_blueprint._name_advance(fm, "Calibri", 12, "Alpha")
+        # Another font or size drops the old font's widths.
+        self.assertEqual(list(ui_blueprint._NAME_ADVANCE), ["Alpha"])
+        for i in range(ui_blueprint._NAME_ADVANCE_MAX + 10):
+            ui_blueprint._name_advance(fm, "Calibri", 12, f"Name {i}")
+        self.assertLessEqual(len(ui_blueprint._NAME_ADVANCE),
+                             ui_blueprint._NAME_ADVANCE_MAX)
+
+    def test_blueprint_uses_slots(self):
+        bp = self.win._blueprint
+        self.assertFalse(hasattr(bp, "__dict__"))
+        with self.assertRaises(AttributeError):
+            bp.typo_field = 1
+
+    def test_row_index_follows_the_row_list(self):
+        win = self.win
+        self.assertEqual(win._group_children(10), [11, 12, 13])
+        self.assertEqual(win._parent_group(12), 10)
+        self.assertEqual(win._row(13)["name"], "Charlie")
+        # Appended, replaced, and reordered in place (with a notice).
+        win._state.rows.append(
+            {"rowid": 20, "name": "G2", "type": "separator", "bg": None})
+        self.assertEqual(win._group_children(20), [])
+        win._state.rows = [r for r in win._state.rows if r["rowid"] != 12]
+        self.assertIsNone(win._row(12))
+        self.assertEqual(win._group_children(10), [11, 13])
+        rows = win._state.rows
+        rows.insert(len(rows), rows.pop(1))
+        win._rows_changed()
+        self.assertEqual(win._parent_group(11), 20)
+        self.assertEqual(win._group_children(10), [13])
+
+    def test_drag_moves_coalesce_into_one_step(self):
+        from PySide6.QtCore import QPoint
+        from unittest.mock import Mock
+        drag = self.win._drag
+        seen = []
+        drag._update_drag_position = seen.append
+        drag._update_autoscroll = lambda pos: None
+        drag.start(11)
+        for y in (1, 2, 3):
+            ev = Mock()
+            ev.globalPosition.return_value.toPoint.return_value = QPoint(0, y)
+            drag._on_mouse_move(ev)
+        self.assertEqual(seen, [])
+        self.settle()
+        self.assertEqual(seen, [QPoint(0, 3)])
+        # A move still pending at release is applied before the drop.
+        drag._on_mouse_move(ev)
+        drag.end()
+        self.assertEqual(len(seen), 2)
+
+    def test_row_hit_test_matches_the_closest_centre(self):
+        win, drag = self.win, self.win._drag
+        drag.start(12)
+        centres = [win._widgets[rid]["container"].geometry().center().y()
+                   for rid in win._visible_rowids]
+        for y in range(centres[0] - 40, centres[-1] + 40, 3):
+            dists = [abs(y - c) for c in centres]
+            with self.subTest(y=y):
+                self.assertEqual(drag._row_at_y(y), dists.index(min(dists)))
+        cached = drag._centers
+        drag._row_at_y(0)
+        self.assertIs(drag._centers, cached, "re-measured without a relayout")
+        drag.end()
+        self.assertIsNone(drag._centers)
+
+    def test_running_marker_uses_the_blueprint_fonts(self):
+        bp = self.win._blueprint
+        w, g = self.win._widgets[11], self.win._widgets[10]
+        self.win._on_toggle_timer(11)
+        self.assertEqual(w["name"].font(), bp.bold_label_font)
+        self.assertEqual(w["time"].font(), bp.bold_time_font)
+        self.assertEqual(g["name"].font(), bp.bold_label_font)
+        self.win._on_toggle_timer(11)
+        self.assertEqual(w["name"].font(), bp.label_font)
+        self.assertEqual(g["time"].font(), bp.time_font)
+
+    def test_time_hover_underlines_with_the_shared_fonts(self):
+        bp, lbl = self.win._blueprint, self.win._widgets[11]["time"]
+        self.win._on_time_hover(11, True)
+        self.assertEqual(lbl.font(), bp.hover_time_font)
+        self.assertTrue(lbl.font().underline())
+        self.win._on_time_hover(11, False)
+        self.assertEqual(lbl.font(), bp.time_font)
+        self.win._on_toggle_timer(11)
+        self.win._on_time_hover(11, True)
+        self.assertEqual(lbl.font(), bp.hover_bold_time_font)
+        self.win._on_toggle_timer(11)
+
+    def test_window_icon_is_decoded_once(self):
+        from ct.ui import app as app_mod
+        self.assertIs(app_mod._app_icon(), app_mod._app_icon())
+        self.assertFalse(self.win.windowIcon().isNull())
+
 
 class TestQtStatusLine(QtWindowTestBase):
 
@@ -1821,7 +2390,7 @@ class TestQtStatusLine(QtWindowTestBase):
         self.win.timers[11].elapsed = 3600
         self.win.timers[12].elapsed = 1800
         self.win._update_status()
-        total = sum(t.current_elapsed for t in self.win.timers.values())
+        total = sum(t.current_elapsed() for t in self.win.timers.values())
         self.assertIn(format_time(total), self.plain())
 
     def test_period_word_follows_daily_reset(self):
@@ -1922,6 +2491,116 @@ class TestQtUpdateThreading(QtWindowTestBase):
             self.assertTrue(self.pump(self.toast_says("99.0.0")))
 
 
+class TestQtBackgroundSnapshot(QtWindowTestBase):
+    """Routine snapshots are written off the GUI thread; high ones are not."""
+
+    def setUp(self):
+        super().setUp()
+        del self.win._try_snapshot       # exercise the real one
+        self.win._idle_snapshot_due = 0
+
+    def spy_writes(self, before=None):
+        """Patch the snapshot writer to record which thread ran each write."""
+        from ct.core import snapshot
+        import threading
+        real = snapshot._write_snapshot
+        writers = []
+
+        def spy(*a, **k):
+            if before:
+                before()
+            writers.append(threading.current_thread().name)
+            return real(*a, **k)
+        return patch.object(snapshot, "_write_snapshot", spy), writers
+
+    def count(self):
+        from ct.common.setup import PATHS
+        return len(list(PATHS.snapshots.glob("state_*.json")))
+
+    def test_routine_snapshots_are_written_by_the_writer_thread(self):
+        from ct.core.snapshot import flush_snapshots
+        spying, writers = self.spy_writes()
+        with spying:
+            self.assertIsNone(self.win._try_snapshot("tick", "low"))
+            self.win._medium_snapshot_due = 0
+            self.win._state.collapsed_groups.add(10)
+            self.assertIsNone(self.win._try_snapshot("layout_change", "medium"))
+            self.assertTrue(flush_snapshots())
+        self.assertEqual(writers, ["ct2-snapshot", "ct2-snapshot"])
+        self.assertEqual(self.count(), 2)
+
+    def test_queued_snapshot_holds_the_state_as_of_the_call(self):
+        from ct.core.snapshot import flush_snapshots
+        from ct.util import load_json
+        import threading
+        edited = threading.Event()
+        spying, _ = self.spy_writes(before=lambda: edited.wait(5))
+        with spying:
+            self.win._try_snapshot("layout_change", "medium")
+            self.win._state.rows[1]["name"] = "Renamed meanwhile"
+            edited.set()
+            self.assertTrue(flush_snapshots())
+        from ct.common.setup import PATHS
+        path, = PATHS.snapshots.glob("state_*.json")
+        names = [r["name"] for r in load_json(path)["layout"]["rows"]]
+        self.assertIn("Alpha", names)
+        self.assertNotIn("Renamed meanwhile", names)
+
+    def test_high_priority_is_on_disk_when_the_call_returns(self):
+        import threading
+        spying, writers = self.spy_writes()
+        with spying:
+            path = self.win._try_snapshot("reset", "high")
+        self.assertIsNotNone(path)
+        self.assertTrue(Path(path).exists())
+        self.assertEqual(writers, [threading.current_thread().name])
+
+    def test_idle_snapshot_of_an_unchanged_state_is_skipped(self):
+        from ct.core.snapshot import flush_snapshots
+        self.win._try_snapshot("reset", "high")
+        self.win._idle_snapshot_due = 0
+        self.assertIsNone(self.win._try_snapshot("tick", "low"))
+        flush_snapshots()
+        self.assertEqual(self.count(), 1)
+        # ...but not once something has changed.
+        self.win._state.collapsed_groups.add(10)
+        self.win._idle_snapshot_due = 0
+        self.win._try_snapshot("tick", "low")
+        flush_snapshots()
+        self.assertEqual(self.count(), 2)
+
+    def test_any_snapshot_pushes_back_the_throttled_ones(self):
+        from ct.core.snapshot import flush_snapshots
+        self.win._try_snapshot("layout_change", "medium")
+        self.win._try_snapshot("layout_change", "medium")
+        self.win._try_snapshot("tick", "low")
+        flush_snapshots()
+        self.assertEqual(self.count(), 1)
+        self.assertIsNotNone(self.win._try_snapshot("reset", "high"))
+        self.win._medium_snapshot_due = 0
+        self.win._state.collapsed_groups.add(10)
+        self.win._try_snapshot("layout_change", "medium")
+        flush_snapshots()
+        self.assertEqual(self.count(), 3)
+
+    def test_medium_snapshot_of_an_unchanged_state_is_skipped(self):
+        from ct.core.snapshot import flush_snapshots
+        self.win._try_snapshot("layout_change", "medium")
+        self.win._medium_snapshot_due = 0
+        self.assertIsNone(self.win._try_snapshot("pre_undo", "medium"))
+        flush_snapshots()
+        self.assertEqual(self.count(), 1)
+        # A skipped one doesn't hold back the next real change.
+        self.win._state.collapsed_groups.add(10)
+        self.win._try_snapshot("layout_change", "medium")
+        flush_snapshots()
+        self.assertEqual(self.count(), 2)
+
+    def test_high_priority_is_written_even_if_unchanged(self):
+        self.win._try_snapshot("reset", "high")
+        self.assertIsNotNone(self.win._try_snapshot("app_exit", "high"))
+        self.assertEqual(self.count(), 2)
+
 
 class TestQtDragLift(QtWindowTestBase):
     """The dragged row reads as picked up off the page.
@@ -2013,7 +2692,7 @@ class TestQtDragLift(QtWindowTestBase):
     def sep_css(self, rid):
         """Is a separator line actually DRAWN on this row?
 
-        Not a bare "border-bottom" search: every row also carries the
+        Not a bare "border-bottom" search: every timer row also carries the
         `#rowBg[nosep="1"] { border-bottom: none; }` rule that
         _update_bottom_line switches on, so that substring is always
         present. Only a width means a line is painted.
@@ -2116,9 +2795,72 @@ class TestQtSettingsDialog(QtWindowTestBase):
         return ConfigDialog(self.win, self.win._state.settings.to_dict(),
                             lambda: None)
 
+    def build_on_appearance(self):
+        dlg = self.build()
+        dlg._tab_list.setCurrentRow(dlg._APPEARANCE_TAB)
+        return dlg
+
     def test_the_dialog_builds(self):
         self.assertIsNotNone(self.build())
 
+    def test_appearance_is_built_on_first_visit(self):
+        dlg = self.build()
+        self.assertFalse(hasattr(dlg, "_preview"))
+        dlg._tab_list.setCurrentRow(dlg._APPEARANCE_TAB)
+        self.assertTrue(hasattr(dlg, "_preview"))
+        self.assertIs(dlg._stack.currentWidget(),
+                      dlg._stack.widget(dlg._APPEARANCE_TAB))
+        self.assertTrue(dlg._preview.isVisibleTo(dlg._stack.currentWidget()))
+        self.assertEqual(dlg._stack.count(), dlg._tab_list.count())
+        # A second visit doesn't build it again.
+        page = dlg._stack.currentWidget()
+        dlg._tab_list.setCurrentRow(1)
+        dlg._tab_list.setCurrentRow(dlg._APPEARANCE_TAB)
+        self.assertIs(dlg._stack.currentWidget(), page)
+
+    def test_apply_without_opening_appearance_changes_nothing(self):
+        self.win._state.settings.theme = "Galaxy Dark"
+        self.win._state.settings.show_adjust_buttons = False
+        dlg = self.build()
+        dlg._apply()
+        self.assertFalse(dlg.style_changed)
+        self.assertEqual(dlg.chosen_theme, "Galaxy Dark")
+        self.assertFalse(dlg.chosen_show_adjust_buttons)
+
+    def test_history_is_built_on_first_visit(self):
+        dlg = self.build()
+        self.assertFalse(hasattr(dlg, "_session_table"))
+        dlg._tab_list.setCurrentRow(dlg._HISTORY_TAB)
+        self.assertIs(dlg._stack.currentWidget(),
+                      dlg._stack.widget(dlg._HISTORY_TAB))
+        self.assertTrue(
+            dlg._session_table.isVisibleTo(dlg._stack.currentWidget()))
+        self.assertEqual(dlg._stack.count(), dlg._tab_list.count())
+
+    def test_apply_without_opening_history_keeps_the_reset_schedule(self):
+        self.win._state.settings.daily_reset_enabled = False
+        self.win._state.settings.daily_reset_time = "05:30"
+        dlg = self.build()
+        dlg._apply()
+        self.assertFalse(dlg.style_changed)
+        self.assertFalse(dlg.chosen_daily_reset_enabled)
+        self.assertEqual(dlg.chosen_daily_reset_time, "05:30")
+
+    def test_apply_after_opening_history_reads_it(self):
+        from PySide6.QtCore import QTime
+        dlg = self.build()
+        dlg._tab_list.setCurrentRow(dlg._HISTORY_TAB)
+        dlg._daily_reset_time.setTime(QTime(6, 15))
+        dlg._apply()
+        self.assertEqual(dlg.chosen_daily_reset_time, "06:15")
+
+    def test_apply_after_opening_appearance_reads_it(self):
+        dlg = self.build_on_appearance()
+        dlg._theme.setCurrentText("Galaxy Dark")
+        dlg._apply()
+        self.assertTrue(dlg.style_changed)
+        self.assertEqual(dlg.chosen_theme, "Galaxy Dark")
+
     def test_every_page_is_present(self):
         dlg = self.build()
         self.assertEqual(dlg._stack.count(), dlg._tab_list.count())
@@ -2132,7 +2874,7 @@ class TestQtSettingsDialog(QtWindowTestBase):
     def test_the_preview_shows_one_toggle_per_row(self):
         """Two buttons per row was the pre-toggle layout. Row 1 is the
         running sample, row 2 the stopped one."""
-        dlg = self.build()
+        dlg = self.build_on_appearance()
         self.assertEqual(dlg._p1_start.text(), "Stop")
         self.assertEqual(dlg._p2_start.text(), "Start")
         self.assertFalse(hasattr(dlg, "_p1_stop"))
@@ -2193,7 +2935,7 @@ class TestQtSettingsDialog(QtWindowTestBase):
         for name in ("NOCturnal", "Manila Memories", "Galaxy Dark"):
             with self.subTest(theme=name):
                 self.win._state.settings.theme = name
-                dlg = self.build()
+                dlg = self.build_on_appearance()
                 self.assertIn(THEMES[name]["app_fg_muted"].lower(),
                               dlg._tip_lbl.styleSheet().lower())
                 # Changing the dropdown must NOT move it: that would put the
@@ -2239,7 +2981,7 @@ class TestQtSettingsDialog(QtWindowTestBase):
         """_refresh_preview restyles every preview widget, so a widget added
         or removed without updating that loop raises here."""
         from ct.ui.theme import THEMES, SIZES
-        dlg = self.build()
+        dlg = self.build_on_appearance()
         for name in THEMES:
             dlg._theme.setCurrentText(name)
             for size in SIZES:
@@ -2247,6 +2989,102 @@ class TestQtSettingsDialog(QtWindowTestBase):
                     dlg._size.setCurrentText(size)
                     dlg._refresh_preview()
 
+    def test_preview_fonts_are_built_once_per_font_and_size(self):
+        from ct.ui.theme import THEMES, SIZES
+        dlg = self.build_on_appearance()
+        for name in list(THEMES)[:4]:
+            dlg._theme.setCurrentText(name)
+            dlg._refresh_preview()
+        self.assertEqual(len(dlg._preview_font_cache), 1)
+        other = next(z for z in SIZES if z != dlg._size.currentText())
+        dlg._size.setCurrentText(other)
+        dlg._refresh_preview()
+        self.assertEqual(len(dlg._preview_font_cache), 2)
+        label_font, _, _, _, action_font, name_w, _, sq = \
+            dlg._preview_font_cache[(dlg._font.currentData(), other)]
+        self.assertEqual(dlg._p2_name.font(), label_font)
+        self.assertEqual(dlg._p1_minus.font(), action_font)
+        self.assertEqual(dlg._p1_name.minimumWidth(), name_w)
+        self.assertEqual(dlg._p_gx.minimumWidth(), sq)
+
+    def test_preview_widths_are_measured_once_across_dialogs(self):
+        from unittest import mock
+        from ct.ui.dialogs import settings as settings_mod
+        from ct.ui.theme import SIZES
+        dlg = self.build_on_appearance()
+        s = SIZES[dlg._size.currentText()]
+        key = (dlg._font.currentData(), s["label"])
+        self.assertEqual(settings_mod._PREVIEW_NAME_W[key],
+                         dlg._p1_name.minimumWidth())
+        # A fresh dialog reuses the measurements rather than shaping the
+        # sample text again.
+        with mock.patch.object(settings_mod, "QFontMetrics",
+                               wraps=settings_mod.QFontMetrics) as fm:
+            again = self.build_on_appearance()
+        # Only the bold fonts are measured for widths.
+        self.assertFalse([c for c in fm.call_args_list if c.args[0].bold()])
+        self.assertEqual(again._p1_name.minimumWidth(),
+                         dlg._p1_name.minimumWidth())
+
+    def test_combo_changes_coalesce_into_one_refresh(self):
+        from ct.ui.theme import SIZES
+        from PySide6.QtCore import Qt
+        dlg = self.build_on_appearance()
+        other = next(z for z in SIZES if z != dlg._size.currentText())
+        dlg._theme.setCurrentText("Galaxy Dark")
+        dlg._size.setCurrentText(other)
+        dlg._align.setCurrentText("Right")
+        self.assertTrue(dlg._preview_settle.isActive())
+        self.assertNotIn(other, [k[1] for k in dlg._preview_font_cache])
+        self.app.processEvents()
+        self.assertFalse(dlg._preview_settle.isActive())
+        self.assertIn(other, [k[1] for k in dlg._preview_font_cache])
+        self.assertTrue(dlg._p1_name.alignment() & Qt.AlignRight)
+
+    def test_only_theme_and_separators_restyle_the_preview(self):
+        from ct.ui.theme import THEMES
+        dlg = self.build_on_appearance()
+        with patch.object(dlg, "_style_preview",
+                          wraps=dlg._style_preview) as style:
+            dlg._align.setCurrentText("Center")
+            dlg._grp_count.setCurrentText("No")
+            dlg._refresh_preview()
+            self.assertEqual(style.call_count, 0)
+            dlg._sep.setCurrentText(
+                "No" if dlg._sep.currentText() == "Yes" else "Yes")
+            dlg._refresh_preview()
+            self.assertEqual(style.call_count, 1)
+            dlg._theme.setCurrentText(
+                next(n for n in THEMES if n != dlg._theme.currentText()))
+            dlg._refresh_preview()
+            self.assertEqual(style.call_count, 2)
+        t = THEMES[dlg._theme.currentText()]
+        self.assertIn(t["row_running_fg"], dlg._p_t1_row.styleSheet())
+        self.assertIn(t["app_fg"], dlg._p_t2_row.styleSheet())
+
+    def test_preview_labels_take_their_row_colours_over_the_app_sheet(self):
+        from PySide6.QtGui import QColor, QPalette
+        from PySide6.QtWidgets import QApplication
+        from ct.ui.theme import THEMES
+        dlg = self.build_on_appearance()
+        dlg._theme.setCurrentText("Galaxy Dark")
+        dlg._refresh_preview()
+        t = THEMES["Galaxy Dark"]
+        # The window's app-wide sheet colours every QLabel; the preview's
+        # row rules have to win over it.
+        self.assertIn("QLabel", QApplication.instance().styleSheet())
+        for lbl, key in ((dlg._p_gname, "group_running_fg"),
+                         (dlg._p1_name, "row_running_fg"),
+                         (dlg._p1_time, "row_running_fg"),
+                         (dlg._p2_name, "app_fg")):
+            with self.subTest(label=lbl.text()):
+                lbl.ensurePolished()
+                self.assertEqual(lbl.palette().color(QPalette.WindowText),
+                                 QColor(t[key]))
+        # Only the frame and the three rows carry a sheet.
+        self.assertEqual(dlg._p1_name.styleSheet(), "")
+        self.assertEqual(dlg._p1_start.styleSheet(), "")
+
 
 class TestQtRestoreAndReset(QtWindowTestBase):
     """A restored snapshot must not be eaten by the daily reset."""
@@ -2279,9 +3117,52 @@ class TestQtRestoreAndReset(QtWindowTestBase):
         self.win._state.session_start = (
             self.win._most_recent_reset_boundary() - timedelta(days=3))
         self.win._check_daily_reset_boundary()
-        self.assertEqual(self.win.timers[11].current_elapsed, 0,
+        self.assertEqual(self.win.timers[11].current_elapsed(), 0,
                          "expected the unclamped state to be zeroed")
 
+    def test_restore_arms_the_reset_wakeup_the_snapshot_turns_on(self):
+        from ct.core.config import AppState, Settings
+        self.win._state.settings.daily_reset_enabled = False
+        self.win._schedule_reset_wake()
+        self.assertFalse(self.win._reset_wake.isActive())
+        snap = AppState(Settings(daily_reset_enabled=True),
+                        [dict(r) for r in self.win._state.rows], set(),
+                        datetime.now().astimezone(), {})
+        with patch("ct.ui.app.AppState.load", return_value=snap):
+            self.win._restore_from_snapshot(
+                Path("state_20260101_000000_000000.json"))
+        self.assertTrue(self.win._state.settings.daily_reset_enabled)
+        self.assertTrue(self.win._reset_wake.isActive())
+
+    def test_times_match_by_rowid_then_first_unclaimed_name(self):
+        from ct.core.config import AppState, Settings
+        self.win._state.rows[2]["name"] = "Alpha"        # 11 and 12 share it
+        rows = [{"rowid": rid, "name": "Alpha", "type": "timer", "bg": None}
+                for rid in (11, 50, 51)]
+        tracked = {"11": {"elapsed": 100.0}, "50": {"elapsed": 200.0},
+                   "51": {"elapsed": 300.0}}
+        snap = AppState(Settings(), rows, set(), datetime.now().astimezone(),
+                        tracked)
+        self.assertEqual(self.win._restore_times_only(snap), 2)
+        self.assertEqual(self.win.timers[11].elapsed, 100.0)
+        self.assertEqual(self.win.timers[12].elapsed, 200.0)
+
+    def test_rows_restore_carries_live_times_onto_the_snapshot_layout(self):
+        from ct.core.config import AppState, Settings
+        self.win.timers[11].elapsed = 50.0
+        self.win.timers[12].elapsed = 70.0
+        rows = [{"rowid": 10, "name": "Group", "type": "separator", "bg": None},
+                {"rowid": 11, "name": "Alpha", "type": "timer", "bg": None},
+                {"rowid": 60, "name": "Bravo", "type": "timer", "bg": None},
+                {"rowid": 61, "name": "Delta", "type": "timer", "bg": None}]
+        snap = AppState(Settings(), rows, {10}, datetime.now().astimezone(), {})
+        self.assertEqual(self.win._restore_rows_only(snap), 2)
+        self.assertEqual(self.win._state.rows, rows)
+        self.assertIsNot(self.win._state.rows[1], rows[1])
+        self.assertEqual(self.win._state.collapsed_groups, {10})
+        self.assertEqual({rid: ts.elapsed for rid, ts in self.win.timers.items()},
+                         {11: 50.0, 60: 70.0, 61: 0.0})
+
 
 class TestUnknownChoiceReset(unittest.TestCase):
     """A setting naming a THING must name a thing that exists.
@@ -2440,6 +3321,40 @@ class TestQtDeleteButton(QtWindowTestBase):
         self.win._update_shift_labels()
         self.assertEqual(self.win._widgets[11]["minus"].text(), "-5")
 
+    def test_repeated_shift_edge_does_not_rewalk_the_rows(self):
+        self.win._shift_held = True
+        self.win._update_shift_labels()
+        self.win._widgets[11]["minus"].setText("sentinel")
+        self.win._update_shift_labels()
+        self.assertEqual(self.win._widgets[11]["minus"].text(), "sentinel")
+        self.win._shift_held = False
+        self.win._update_shift_labels()
+        self.assertEqual(self.win._widgets[11]["minus"].text(), "-5")
+
+    def test_a_burst_of_adjust_clicks_saves_once(self):
+        saves = []
+        real = self.win._state.save
+        self.win._state.save = lambda timers: saves.append(1) or real(timers)
+        for _ in range(4):
+            self.win._on_adjust(11, +1)
+        self.assertEqual(saves, [])
+        self.assertTrue(self.win._save_settle.isActive())
+        end = time.time() + 3
+        while not saves and time.time() < end:
+            self.settle(2)
+            time.sleep(0.02)
+        self.assertEqual(saves, [1])
+        self.assertEqual(self.win.timers[11].elapsed, 4 * 5 * 60)
+
+    def test_shift_at_click_time_picks_the_small_step_and_add(self):
+        self.win._shift_down = lambda: True
+        self.win._on_adjust(11, +1)
+        self.assertEqual(self.win.timers[11].elapsed, 60)
+        self.win._start_exclusive(12)
+        self.win._on_start(11)
+        self.assertTrue(self.win.timers[12].running, "Shift-start was exclusive")
+        self.win._stop_all()
+
     def test_remove_ignores_keyboard_modifiers_entirely(self):
         """The strongest form of the assertion: _on_remove no longer READS
         the modifier state, so no amount of Shift can divert it."""
@@ -2462,7 +3377,7 @@ class TestQtDeleteButton(QtWindowTestBase):
         self.win.timers[12].elapsed = 300.0
         self.win._state.settings.confirm_reset = False
         self.win._reset_one(12)
-        self.assertEqual(self.win.timers[12].current_elapsed, 0)
+        self.assertEqual(self.win.timers[12].current_elapsed(), 0)
         self.assertIn(12, self.win.timers, "reset must not delete the row")
 
 
@@ -2597,7 +3512,7 @@ class TestQtStopAll(QtWindowTestBase):
         self.win.timers[11].elapsed = 500.0
         self.win._start_exclusive(11)
         self.win._stop_all()
-        self.assertGreaterEqual(self.win.timers[11].current_elapsed, 500.0)
+        self.assertGreaterEqual(self.win.timers[11].current_elapsed(), 500.0)
 
     def test_the_toggle_button_label_follows(self):
         """_stop_all goes through _set_bold, which owns the button's text.
@@ -2608,6 +3523,109 @@ class TestQtStopAll(QtWindowTestBase):
         self.assertEqual(self.win._widgets[11]["toggle"].text(), "Start")
 
 
+class TestQtIdleTicker(QtWindowTestBase):
+    """The 1 s tick runs only while a timer does."""
+
+    def test_tick_stops_itself_when_idle(self):
+        self.win._timer.start(1000)
+        self.win._tick()
+        self.assertFalse(self.win._timer.isActive())
+
+    def test_starting_a_timer_starts_the_tick(self):
+        self.win._timer.stop()
+        self.win._start_exclusive(11)
+        self.assertTrue(self.win._timer.isActive())
+        self.win._tick()
+        self.assertTrue(self.win._timer.isActive(),
+                        "the tick stopped with a timer still running")
+        self.win._stop_all()
+
+    def test_unchanged_seconds_are_not_rewritten(self):
+        lbl = self.win._widgets[11]["time"]
+        self.win._update_display(11)
+        lbl.setText("sentinel")
+        self.win._update_display(11)
+        self.assertEqual(lbl.text(), "sentinel")
+        self.win.timers[11].elapsed = 61.0
+        self.win._update_display(11)
+        self.assertEqual(lbl.text(), "00:01:01")
+
+    def test_reset_wake_follows_the_setting(self):
+        ss = self.win._state.settings
+        ss.daily_reset_enabled = True
+        self.win._schedule_reset_wake()
+        self.assertTrue(self.win._reset_wake.isActive())
+        self.assertLessEqual(self.win._reset_wake.interval(), 16 * 60 * 1000)
+        ss.daily_reset_enabled = False
+        self.win._schedule_reset_wake()
+        self.assertFalse(self.win._reset_wake.isActive())
+
+    def test_tick_leaves_the_daily_reset_to_its_wakeup(self):
+        self.win._state.settings.daily_reset_enabled = True
+        self.win._check_daily_reset_boundary = lambda: self.fail("ticked")
+        self.win.timers[11].start()
+        self.win._tick()
+        self.win._on_toggle_timer(11)
+
+    def test_tick_only_re_sums_groups_with_a_running_child(self):
+        from ct.core.timer_state import TimerState
+        self.win._state.rows += [
+            {"rowid": 20, "name": "Other", "type": "separator", "bg": None},
+            {"rowid": 21, "name": "Delta", "type": "timer", "bg": None}]
+        self.win.timers[21] = TimerState("Delta")
+        self.rebuild()
+        summed = []
+        real = self.win._group_total_time
+        self.win._group_total_time = (
+            lambda g, *a: summed.append(g) or real(g, *a))
+        self.win._start_exclusive(21)
+        self.win._tick()
+        self.assertEqual(summed, [20])
+        # Stopping settles the group's total without waiting on a tick.
+        self.win.timers[21]._mono -= 5_000_000_000
+        self.win._stop_all()
+        self.assertEqual(self.win._widgets[20]["time"].text(), "00:00:05")
+
+    def test_tick_reads_the_clock_once_for_rows_and_totals(self):
+        from ct.core.timer_state import TimerState
+        self.win._state.rows += [
+            {"rowid": 20, "name": "Other", "type": "separator", "bg": None},
+            {"rowid": 21, "name": "Delta", "type": "timer", "bg": None}]
+        self.win.timers[21] = TimerState("Delta")
+        self.rebuild()
+        self.win._start_exclusive(21)
+        now = self.win.timers[21]._mono + 65_000_000_000
+        self.win._last_save = now       # not due an autosave
+        with patch("ct.ui.app.time.monotonic_ns", return_value=now) as clock:
+            self.win._tick()
+        self.assertEqual(clock.call_count, 1)
+        self.assertEqual(self.win._widgets[21]["time"].text(), "00:01:05")
+        self.assertEqual(self.win._widgets[20]["time"].text(), "00:01:05")
+
+    def test_hidden_rows_are_caught_up_when_shown(self):
+        lbl = self.win._widgets[11]["time"]
+        self.win._start_exclusive(11)
+        self.win._on_group_toggle(10)            # collapse
+        self.win.timers[11]._mono -= 65_000_000_000
+        self.win._tick()
+        self.assertEqual(lbl.text(), "00:00:00", "ticked a hidden row")
+        self.win._on_group_toggle(10)            # expand
+        self.assertEqual(lbl.text(), "00:01:05")
+        self.win._stop_all()
+
+    def test_autosave_counts_from_the_last_save(self):
+        self.win._on_toggle_timer(11)       # starts, and saves
+        saves = []
+        self.win._state.save = lambda timers: saves.append(1) or {}
+        for _ in range(5):
+            self.win._tick()
+        self.assertEqual(saves, [], "re-saved right after starting")
+        self.win._last_save -= 20_000_000_000
+        self.win._tick()
+        self.assertEqual(saves, [1])
+        self.win._stop_all()
+
+
 class TestQtStatusCopy(QtWindowTestBase):
     """The footer click copies every time, whatever is running."""
 
@@ -2755,7 +3773,7 @@ class TestQtUndoWiring(QtWindowTestBase):
         self.win._undo_last()
         self.settle()
         self.assertEqual(self.order(), [10, 11, 12, 13])
-        self.assertEqual(self.win.timers[12].current_elapsed, 1800)
+        self.assertEqual(self.win.timers[12].current_elapsed(), 1800)
 
     def test_deleting_a_row_toasts_with_the_undo_hint(self):
         self.win._on_remove(12)
@@ -2773,10 +3791,10 @@ class TestQtUndoWiring(QtWindowTestBase):
         self.win.timers[11].elapsed = 3600
         self.win._reset_one(11)
         self.settle()
-        self.assertEqual(self.win.timers[11].current_elapsed, 0)
+        self.assertEqual(self.win.timers[11].current_elapsed(), 0)
         self.win._undo_last()          # would block if a dialog opened
         self.settle()
-        self.assertEqual(self.win.timers[11].current_elapsed, 3600)
+        self.assertEqual(self.win.timers[11].current_elapsed(), 3600)
 
     def test_reset_all_is_a_single_undo_entry(self):
         self.win.timers[11].elapsed = 3600
@@ -2786,8 +3804,8 @@ class TestQtUndoWiring(QtWindowTestBase):
         self.assertEqual(len(self.win._undo), 1)
         self.win._undo_last()
         self.settle()
-        self.assertEqual(self.win.timers[11].current_elapsed, 3600)
-        self.assertEqual(self.win.timers[12].current_elapsed, 1800)
+        self.assertEqual(self.win.timers[11].current_elapsed(), 3600)
+        self.assertEqual(self.win.timers[12].current_elapsed(), 1800)
 
     def test_undo_on_an_empty_stack_says_so(self):
         self.win._undo.clear()
@@ -2886,6 +3904,26 @@ class TestQtToast(QtWindowTestBase):
         self.assertEqual(self.win.height(), before_h)
         self.assertEqual(self.win._scroll_area.viewport().height(), before_vp)
 
+    def test_rebuild_restores_scroll_without_double_refreshing(self):
+        pitch = self._scrollable()
+        self.win._scroll_area.verticalScrollBar().setValue(pitch)
+        self.settle()
+        calls = []
+        real = self.win._update_status
+        self.win._update_status = lambda: (calls.append(1), real())
+        # In place, the viewport is kept: one refresh, at the end.
+        self.win._rebuild_rows()
+        self.assertEqual(len(calls), 1)
+        # A full swap adds one from the new viewport's first resize. Neither
+        # scroll bar may add its own.
+        calls.clear()
+        self.win._tree_key = None
+        self.win._rebuild_rows()
+        self.assertEqual(len(calls), 2)
+        self.settle()
+        self.assertEqual(
+            self.win._scroll_area.verticalScrollBar().value(), pitch)
+
     def test_a_toast_does_not_move_the_scroll_position(self):
         """The window and the toast's layout land in different turns, so the
         scroll range briefly shrinks and Qt clamps the position into it. That
@@ -3375,6 +4413,13 @@ class TestStylesheet(unittest.TestCase):
         result = build_menu_stylesheet("BogusTheme")
         self.assertIn("QMenu", result)
 
+    def test_build_stylesheet_cached_per_theme(self):
+        from ct.ui.theme.stylesheet import build_stylesheet, build_menu_stylesheet
+        self.assertIs(build_stylesheet("Galaxy Dark"),
+                      build_stylesheet("Galaxy Dark"))
+        self.assertIs(build_menu_stylesheet("Galaxy Dark"),
+                      build_menu_stylesheet("Galaxy Dark"))
+
 
 # =========================================================================== #
 #  8. THEME __init__ RE-EXPORTS                                                 #
@@ -3442,6 +4487,45 @@ class TestFormatTime(unittest.TestCase):
         self.assertEqual(result, "100:00:00")
 
 
+class TestDumpJson(unittest.TestCase):
+    """ct.util.dump_json / load_json behave the same with or without orjson."""
+
+    SAMPLE = {"meta": {"saved_at": "2026-02-12T14:03:11+00:00"},
+              "layout": {"rows": [{"type": "timer", "name": "Caf\u00e9 \u2014 \U0001f600",
+                                   "rowid": 11}], "collapsed_groups": []},
+              "session": {"tracked_times": {"11": {"elapsed": 12.5}}}}
+
+    def test_round_trips(self):
+        from ct.util import dump_json
+        for indent in (False, True):
+            self.assertEqual(json.loads(dump_json(self.SAMPLE, indent=indent)), self.SAMPLE)
+
+    def test_stdlib_fallback_matches(self):
+        from ct.util import dump_json
+        from ct.util import misc
+        if misc.orjson is None:
+            self.skipTest("orjson not installed")
+        for kwargs in ({}, {"indent": True}, {"sort_keys": True}):
+            fast = dump_json(self.SAMPLE, **kwargs)
+            with patch.object(misc, "orjson", None):
+                self.assertEqual(dump_json(self.SAMPLE, **kwargs), fast, kwargs)
+
+    def test_load_json_with_and_without_orjson(self):
+        from ct.util import dump_json, load_json
+        from ct.util import misc
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "s.json"
+            path.write_bytes(dump_json(self.SAMPLE, indent=True))
+            self.assertEqual(load_json(path), self.SAMPLE)
+            with patch.object(misc, "orjson", None):
+                self.assertEqual(load_json(path), self.SAMPLE)
+            path.write_bytes(b"NOT JSON")
+            for lib in (misc.orjson, None):
+                with patch.object(misc, "orjson", lib):
+                    with self.assertRaises(json.JSONDecodeError):
+                        load_json(path)
+
+
 class TestThemeRenames(unittest.TestCase):
     """Renamed themes survive the rename; retired ones still fall back."""
 
@@ -3642,6 +4726,24 @@ class TestSettingsDefaultsConsistency(unittest.TestCase):
             self.assertIn(key, state["settings"],
                           f"_build_default_state missing settings key: {key}")
 
+    def test_loading_defaults_leaves_the_template_alone(self):
+        # _build_default_state and load's fallback both copy _SETTINGS_DEFAULTS;
+        # nothing done to the state they hand back may reach it.
+        from ct.core.config import AppState, _SETTINGS_DEFAULTS
+        before = dict(_SETTINGS_DEFAULTS)
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "state.json"
+            _write_state(path, {"settings": "garbage",
+                                "meta": {"schema_version": 1}})
+            AppState.load(path).settings.theme = "Galaxy Dark"
+        self.assertEqual(_SETTINGS_DEFAULTS, before)
+
+    def test_default_state_settings_are_not_the_template(self):
+        from ct.core.config import AppState, _SETTINGS_DEFAULTS
+        before = dict(_SETTINGS_DEFAULTS)
+        AppState._build_default_state()["settings"]["theme"] = "Galaxy Dark"
+        self.assertEqual(_SETTINGS_DEFAULTS, before)
+
     def test_default_theme_exists_in_themes(self):
         from ct.core.config import _SETTINGS_DEFAULTS
         from ct.ui.theme.colors import THEMES
@@ -3752,8 +4854,8 @@ class TestNameSanitizer(unittest.TestCase):
     """Tests for the client-name sanitizer (permissive denylist)."""
 
     def _sanitize(self, raw):
-        from ct.ui.app import _SANITIZE
-        return _SANITIZE.sub("", raw).strip()
+        from ct.ui.app import _sanitize
+        return _sanitize(raw)
 
     def test_real_world_names_untouched(self):
         for name in ("Müller & Sons - Tickets, LLC", "O'Brien (West)",
@@ -3766,25 +4868,54 @@ class TestNameSanitizer(unittest.TestCase):
     def test_whitespace_only_becomes_empty(self):
         self.assertEqual(self._sanitize("   "), "")
 
+    def test_strips_exactly_the_c0_and_c1_controls(self):
+        import re as _re
+        chars = "".join(map(chr, range(0x200)))
+        expected = _re.sub(r"[\x00-\x1f\x7f-\x9f]+", "", chars).strip()
+        self.assertEqual(self._sanitize(chars), expected)
+
+
+class TestTimeInput(unittest.TestCase):
+    """Tests for the Set Time parser."""
+
+    def _parse(self, text):
+        from ct.ui.app import MainWindow
+        return MainWindow._parse_time_input(text)
+
+    def test_each_shape(self):
+        self.assertEqual(self._parse("1:02:03"), 3723)
+        self.assertEqual(self._parse("02:03"), 123)
+        self.assertEqual(self._parse("15"), 15 * 60)
+        self.assertEqual(self._parse("0:00:00"), 0)
+
+    def test_rejects_what_is_not_a_time(self):
+        for text in ("", "abc", "1:2:3:4", "1::2", ":5", "5:", "-5",
+                     "+5", "1_0", "1:-2", "1.5", "١٢"):
+            with self.subTest(text=text):
+                self.assertIsNone(self._parse(text))
+
 
 class TestPaths(unittest.TestCase):
     """Tests for ct.common.setup.PATHS."""
 
-    def test_paths_exist(self):
-        from ct.common.setup import PATHS
-        self.assertTrue(PATHS.data.exists())
-        self.assertTrue(PATHS.logs.exists())
-        self.assertTrue(PATHS.current.exists())
-        self.assertTrue(PATHS.snapshots.exists())
-        self.assertTrue(PATHS.sessions.exists())
-
-    def test_paths_are_directories(self):
+    def test_data_dir_exists(self):
         from ct.common.setup import PATHS
         self.assertTrue(PATHS.data.is_dir())
+        # The logger writes into its folder at import.
         self.assertTrue(PATHS.logs.is_dir())
-        self.assertTrue(PATHS.current.is_dir())
-        self.assertTrue(PATHS.snapshots.is_dir())
-        self.assertTrue(PATHS.sessions.is_dir())
+
+    def test_subfolders_live_under_data(self):
+        from ct.common.setup import PATHS
+        for path in (PATHS.logs, PATHS.current, PATHS.snapshots, PATHS.sessions):
+            self.assertEqual(path.parent, PATHS.data)
+
+    def test_build_does_not_create_subfolders(self):
+        from ct.common.setup import ProjectPaths
+        with tempfile.TemporaryDirectory() as appdata:
+            with patch.dict(os.environ, {"APPDATA": appdata}):
+                paths = ProjectPaths.build()
+            self.assertTrue(paths.data.is_dir())
+            self.assertEqual(os.listdir(paths.data), [])
 
     def test_root_contains_ct_package(self):
         from ct.common.setup import PATHS